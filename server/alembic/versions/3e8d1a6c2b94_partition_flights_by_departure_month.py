@@ -0,0 +1,203 @@
+"""partition_flights_by_departure_month
+
+Revision ID: 3e8d1a6c2b94
+Revises: 7a2c5e9f1b36
+Create Date: 2026-10-19 18:05:41.302918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e8d1a6c2b94'
+down_revision: Union[str, Sequence[str], None] = '7a2c5e9f1b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partitions created ahead of the current month here; the app keeps
+# FLIGHT_PARTITION_MONTHS_AHEAD of them from then on
+MONTHS_AHEAD = 3
+
+FLIGHT_COLUMNS = (
+    'id, flight_number, departure_time, arrival_time, base_price, status, '
+    'plane_id, departure_airport_id, arrival_airport_id'
+)
+
+# Keeps flight_registry equal to flights. A row that moves to another
+# partition is deleted and re-inserted, so a delete only removes the entry
+# once no partition has the id any more, and an insert updates an existing
+# entry unless another partition really has the same id.
+SYNC_REGISTRY_FUNCTION = """
+    CREATE FUNCTION sync_flight_registry() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            DELETE FROM flight_registry r
+            WHERE r.id = OLD.id AND NOT EXISTS (SELECT 1 FROM flights f WHERE f.id = OLD.id);
+            RETURN NULL;
+        END IF;
+        IF TG_OP = 'UPDATE' AND NEW.id <> OLD.id THEN
+            RAISE EXCEPTION 'flights.id cannot be changed';
+        END IF;
+        IF TG_OP = 'INSERT' AND (SELECT count(*) FROM flights WHERE id = NEW.id) > 1 THEN
+            RAISE unique_violation USING MESSAGE = format('duplicate flight id %s', NEW.id);
+        END IF;
+        INSERT INTO flight_registry (id, flight_number, departure_time)
+        VALUES (NEW.id, NEW.flight_number, NEW.departure_time)
+        ON CONFLICT (id) DO UPDATE
+            SET flight_number = EXCLUDED.flight_number,
+                departure_time = EXCLUDED.departure_time;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+# Creates the partition of the month containing ``month``; returns its name,
+# or NULL if it already exists. Rows of that month already in the default
+# partition are moved into the new one.
+CREATE_PARTITION_FUNCTION = """
+    CREATE FUNCTION create_flight_partition(month date) RETURNS text AS $$
+    DECLARE
+        start_at timestamp := date_trunc('month', month);
+        end_at timestamp := date_trunc('month', month) + interval '1 month';
+        partition_name text := 'flights_p' || to_char(month, 'YYYYMM');
+    BEGIN
+        PERFORM pg_advisory_xact_lock(hashtext('create_flight_partition'));
+        IF to_regclass(partition_name) IS NOT NULL THEN
+            RETURN NULL;
+        END IF;
+        IF EXISTS (
+            SELECT 1 FROM flights_default
+            WHERE departure_time >= start_at AND departure_time < end_at
+        ) THEN
+            ALTER TABLE flights DETACH PARTITION flights_default;
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF flights FOR VALUES FROM (%L) TO (%L)',
+                partition_name, start_at, end_at
+            );
+            INSERT INTO flights
+            SELECT * FROM flights_default
+            WHERE departure_time >= start_at AND departure_time < end_at;
+            DELETE FROM flights_default
+            WHERE departure_time >= start_at AND departure_time < end_at;
+            ALTER TABLE flights ATTACH PARTITION flights_default DEFAULT;
+        ELSE
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF flights FOR VALUES FROM (%L) TO (%L)',
+                partition_name, start_at, end_at
+            );
+        END IF;
+        RETURN partition_name;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Ids and flight numbers stay globally unique in flight_registry, which
+    # the foreign keys of tickets and flight_inventory now reference: a
+    # partitioned table can only have keys that include departure_time.
+    op.create_table('flight_registry',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('flight_number', sa.String(), nullable=False),
+    sa.Column('departure_time', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('flight_number', name='uq_flight_registry_flight_number')
+    )
+    op.execute(
+        "INSERT INTO flight_registry (id, flight_number, departure_time) "
+        "SELECT id, flight_number, departure_time FROM flights"
+    )
+    op.drop_constraint('tickets_flight_id_fkey', 'tickets', type_='foreignkey')
+    op.create_foreign_key('tickets_flight_id_fkey', 'tickets', 'flight_registry', ['flight_id'], ['id'])
+    op.drop_constraint('flight_inventory_flight_id_fkey', 'flight_inventory', type_='foreignkey')
+    op.create_foreign_key('flight_inventory_flight_id_fkey', 'flight_inventory', 'flight_registry', ['flight_id'], ['id'], ondelete='CASCADE')
+
+    op.rename_table('flights', 'flights_unpartitioned')
+    op.execute("ALTER INDEX flights_pkey RENAME TO flights_unpartitioned_pkey")
+    op.execute("ALTER INDEX ix_flights_id RENAME TO ix_flights_unpartitioned_id")
+    op.execute("ALTER INDEX ix_flights_flight_number RENAME TO ix_flights_unpartitioned_flight_number")
+    op.execute("ALTER SEQUENCE flights_id_seq OWNED BY NONE")
+
+    op.execute("""
+        CREATE TABLE flights (
+            id INTEGER NOT NULL DEFAULT nextval('flights_id_seq'),
+            flight_number VARCHAR NOT NULL,
+            departure_time TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            arrival_time TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            base_price DOUBLE PRECISION NOT NULL,
+            status flightstatus NOT NULL,
+            plane_id INTEGER NOT NULL,
+            departure_airport_id VARCHAR(3) NOT NULL,
+            arrival_airport_id VARCHAR(3) NOT NULL,
+            CONSTRAINT flights_pkey PRIMARY KEY (id, departure_time),
+            CONSTRAINT flights_plane_id_fkey
+                FOREIGN KEY (plane_id) REFERENCES planes (id),
+            CONSTRAINT flights_departure_airport_id_fkey
+                FOREIGN KEY (departure_airport_id) REFERENCES airports (id),
+            CONSTRAINT flights_arrival_airport_id_fkey
+                FOREIGN KEY (arrival_airport_id) REFERENCES airports (id)
+        ) PARTITION BY RANGE (departure_time)
+    """)
+    op.execute("ALTER SEQUENCE flights_id_seq OWNED BY flights.id")
+    op.create_index(op.f('ix_flights_id'), 'flights', ['id'], unique=False)
+    op.create_index(op.f('ix_flights_flight_number'), 'flights', ['flight_number'], unique=False)
+    op.create_index(op.f('ix_flights_departure_time'), 'flights', ['departure_time'], unique=False)
+    op.execute("CREATE TABLE flights_default PARTITION OF flights DEFAULT")
+
+    op.execute(CREATE_PARTITION_FUNCTION)
+    op.execute(f"""
+        SELECT create_flight_partition(CAST(month AS date))
+        FROM generate_series(
+            date_trunc('month', LEAST((SELECT min(departure_time) FROM flights_unpartitioned), now())),
+            date_trunc('month', GREATEST(
+                (SELECT max(departure_time) FROM flights_unpartitioned),
+                now() + interval '{MONTHS_AHEAD} months'
+            )),
+            interval '1 month'
+        ) AS month
+    """)
+    op.execute(
+        f"INSERT INTO flights ({FLIGHT_COLUMNS}) "
+        f"SELECT {FLIGHT_COLUMNS} FROM flights_unpartitioned"
+    )
+    op.drop_table('flights_unpartitioned')
+
+    op.execute(SYNC_REGISTRY_FUNCTION)
+    op.execute("""
+        CREATE TRIGGER flights_sync_registry
+        AFTER INSERT OR DELETE OR UPDATE OF id, flight_number, departure_time ON flights
+        FOR EACH ROW EXECUTE FUNCTION sync_flight_registry()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER flights_sync_registry ON flights")
+    op.execute("DROP FUNCTION sync_flight_registry()")
+    op.execute("DROP FUNCTION create_flight_partition(date)")
+
+    op.execute("CREATE TABLE flights_unpartitioned (LIKE flights INCLUDING DEFAULTS)")
+    op.execute(
+        f"INSERT INTO flights_unpartitioned ({FLIGHT_COLUMNS}) "
+        f"SELECT {FLIGHT_COLUMNS} FROM flights"
+    )
+    op.execute("ALTER SEQUENCE flights_id_seq OWNED BY NONE")
+    op.drop_constraint('tickets_flight_id_fkey', 'tickets', type_='foreignkey')
+    op.drop_constraint('flight_inventory_flight_id_fkey', 'flight_inventory', type_='foreignkey')
+    op.drop_table('flights')
+    op.drop_table('flight_registry')
+
+    op.rename_table('flights_unpartitioned', 'flights')
+    op.create_primary_key('flights_pkey', 'flights', ['id'])
+    op.execute("ALTER SEQUENCE flights_id_seq OWNED BY flights.id")
+    op.create_index(op.f('ix_flights_id'), 'flights', ['id'], unique=False)
+    op.create_index(op.f('ix_flights_flight_number'), 'flights', ['flight_number'], unique=True)
+    op.create_foreign_key('flights_plane_id_fkey', 'flights', 'planes', ['plane_id'], ['id'])
+    op.create_foreign_key('flights_departure_airport_id_fkey', 'flights', 'airports', ['departure_airport_id'], ['id'])
+    op.create_foreign_key('flights_arrival_airport_id_fkey', 'flights', 'airports', ['arrival_airport_id'], ['id'])
+    op.create_foreign_key('tickets_flight_id_fkey', 'tickets', 'flights', ['flight_id'], ['id'])
+    op.create_foreign_key('flight_inventory_flight_id_fkey', 'flight_inventory', 'flights', ['flight_id'], ['id'], ondelete='CASCADE')
@@ -0,0 +1,47 @@
+"""add_flight_inventory_table
+
+Revision ID: 5c1f7e2a9d40
+Revises: 849eb3650473
+Create Date: 2026-10-19 11:24:51.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1f7e2a9d40'
+down_revision: Union[str, Sequence[str], None] = '849eb3650473'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('flight_inventory',
+    sa.Column('flight_id', sa.Integer(), nullable=False),
+    sa.Column('capacity', sa.Integer(), nullable=False),
+    sa.Column('sold', sa.Integer(), nullable=False, server_default=sa.text('0')),
+    sa.CheckConstraint('sold >= 0 AND sold <= capacity', name='ck_flight_inventory_sold'),
+    sa.ForeignKeyConstraint(['flight_id'], ['flights.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('flight_id')
+    )
+    # Backfill from the plane capacity and the tickets of non-cancelled bookings
+    op.execute("""
+        INSERT INTO flight_inventory (flight_id, capacity, sold)
+        SELECT f.id, p.total_seats, LEAST(p.total_seats, (
+            SELECT count(*)
+            FROM tickets t
+            JOIN bookings b ON b.id = t.booking_id
+            WHERE t.flight_id = f.id AND b.status <> 'CANCELLED'
+        ))
+        FROM flights f
+        JOIN planes p ON p.id = f.plane_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('flight_inventory')
@@ -0,0 +1,34 @@
+"""add_booking_history_indexes
+
+Revision ID: 7a2c5e9f1b36
+Revises: 0f9b2d4e6a18
+Create Date: 2026-10-19 14:47:20.115873
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a2c5e9f1b36'
+down_revision: Union[str, Sequence[str], None] = '0f9b2d4e6a18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset paging needs a total order on (booking_time, id)
+    op.execute("UPDATE bookings SET booking_time = now() WHERE booking_time IS NULL")
+    op.alter_column('bookings', 'booking_time', existing_type=sa.DateTime(), nullable=False)
+    op.create_index('ix_bookings_user_id_booking_time', 'bookings', ['user_id', sa.text('booking_time DESC'), sa.text('id DESC')], unique=False, postgresql_include=['total_price', 'status', 'hold_expires_at'])
+    op.create_index(op.f('ix_tickets_booking_id'), 'tickets', ['booking_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_tickets_booking_id'), table_name='tickets')
+    op.drop_index('ix_bookings_user_id_booking_time', table_name='bookings')
+    op.alter_column('bookings', 'booking_time', existing_type=sa.DateTime(), nullable=True)
@@ -0,0 +1,65 @@
+"""add_seat_bitmap_to_flight_inventory
+
+Revision ID: b7e3d91c0f12
+Revises: 5c1f7e2a9d40
+Create Date: 2026-10-19 12:08:33.917205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3d91c0f12'
+down_revision: Union[str, Sequence[str], None] = '5c1f7e2a9d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Seat layout at the time of this migration (SEAT_COLUMNS default)
+SEAT_COLUMNS = 'ABCDEF'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Free the seats of cancelled bookings and keep only the first ticket per seat
+    op.execute("""
+        UPDATE tickets t SET seat_number = NULL
+        FROM bookings b
+        WHERE b.id = t.booking_id AND b.status = 'CANCELLED'
+    """)
+    op.execute("""
+        UPDATE tickets t SET seat_number = NULL
+        WHERE t.seat_number IS NOT NULL AND EXISTS (
+            SELECT 1 FROM tickets earlier
+            WHERE earlier.flight_id = t.flight_id
+              AND earlier.seat_number = t.seat_number
+              AND earlier.id < t.id
+        )
+    """)
+    op.create_unique_constraint('uq_tickets_flight_id_seat_number', 'tickets', ['flight_id', 'seat_number'])
+
+    op.add_column('flight_inventory', sa.Column('seat_bitmap', postgresql.BIT(varying=True), nullable=True))
+    # Mark the seats already on tickets whose number fits the layout
+    op.execute(f"""
+        UPDATE flight_inventory fi SET seat_bitmap = COALESCE((
+            SELECT string_agg(CASE WHEN taken.seat IS NULL THEN '0' ELSE '1' END, '' ORDER BY s.i)
+            FROM generate_series(0, fi.capacity - 1) AS s(i)
+            LEFT JOIN (
+                SELECT (substring(t.seat_number FROM 2)::int - 1) * {len(SEAT_COLUMNS)}
+                       + strpos('{SEAT_COLUMNS}', left(t.seat_number, 1)) - 1 AS seat
+                FROM tickets t
+                WHERE t.flight_id = fi.flight_id
+                  AND t.seat_number ~ '^[{SEAT_COLUMNS}][1-9][0-9]*$'
+            ) taken ON taken.seat = s.i
+        ), '')::varbit
+    """)
+    op.alter_column('flight_inventory', 'seat_bitmap', nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('flight_inventory', 'seat_bitmap')
+    op.drop_constraint('uq_tickets_flight_id_seat_number', 'tickets', type_='unique')
@@ -0,0 +1,72 @@
+"""add_archive_tables
+
+Revision ID: c6f4a2d8e1b7
+Revises: 3e8d1a6c2b94
+Create Date: 2026-10-19 18:42:07.551630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6f4a2d8e1b7'
+down_revision: Union[str, Sequence[str], None] = '3e8d1a6c2b94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('flights_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('flight_number', sa.String(), nullable=False),
+    sa.Column('departure_time', sa.DateTime(), nullable=False),
+    sa.Column('arrival_time', sa.DateTime(), nullable=False),
+    sa.Column('base_price', sa.Float(), nullable=False),
+    sa.Column('status', postgresql.ENUM(name='flightstatus', create_type=False), nullable=False),
+    sa.Column('plane_id', sa.Integer(), nullable=False),
+    sa.Column('departure_airport_id', sa.String(length=3), nullable=False),
+    sa.Column('arrival_airport_id', sa.String(length=3), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('bookings_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('booking_time', sa.DateTime(), nullable=False),
+    sa.Column('total_price', sa.Float(), nullable=False),
+    sa.Column('status', postgresql.ENUM(name='bookingstatus', create_type=False), nullable=False),
+    sa.Column('hold_expires_at', sa.DateTime(), nullable=True),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_bookings_archive_user_id_booking_time', 'bookings_archive', ['user_id', sa.text('booking_time DESC'), sa.text('id DESC')], unique=False, postgresql_include=['total_price', 'status', 'hold_expires_at'])
+    op.create_table('tickets_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('passenger_name', sa.String(), nullable=False),
+    sa.Column('seat_number', sa.String(), nullable=True),
+    sa.Column('extra_baggage_kg', sa.Integer(), nullable=True),
+    sa.Column('final_price', sa.Float(), nullable=False),
+    sa.Column('booking_id', sa.Integer(), nullable=False),
+    sa.Column('flight_id', sa.Integer(), nullable=False),
+    sa.Column('ticket_type_id', sa.Integer(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_tickets_archive_booking_id'), 'tickets_archive', ['booking_id'], unique=False)
+    # Finds the next batch of archivable flights without scanning the rest
+    op.create_index('ix_flights_completed_departure_time', 'flights', ['departure_time', 'id'], unique=False, postgresql_where=sa.text("status = 'COMPLETED'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_flights_completed_departure_time', table_name='flights')
+    op.drop_index(op.f('ix_tickets_archive_booking_id'), table_name='tickets_archive')
+    op.drop_table('tickets_archive')
+    op.drop_index('ix_bookings_archive_user_id_booking_time', table_name='bookings_archive')
+    op.drop_table('bookings_archive')
+    op.drop_table('flights_archive')
@@ -0,0 +1,36 @@
+"""add_booking_hold_expiry
+
+Revision ID: e4a0c6b83f57
+Revises: b7e3d91c0f12
+Create Date: 2026-10-19 13:15:06.248731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a0c6b83f57'
+down_revision: Union[str, Sequence[str], None] = 'b7e3d91c0f12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('bookings', sa.Column('hold_expires_at', sa.DateTime(), nullable=True))
+    # Existing pending bookings get the default 15 minute hold from their booking time
+    op.execute("""
+        UPDATE bookings
+        SET hold_expires_at = COALESCE(booking_time, now()) + interval '15 minutes'
+        WHERE status = 'PENDING'
+    """)
+    op.create_index('ix_bookings_hold_expires_at', 'bookings', ['hold_expires_at'], unique=False, postgresql_where=sa.text("status = 'PENDING'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookings_hold_expires_at', table_name='bookings', postgresql_where=sa.text("status = 'PENDING'"))
+    op.drop_column('bookings', 'hold_expires_at')
@@ -0,0 +1,59 @@
+"""Move completed flights, with their bookings and tickets, to the archive tables.
+
+Usage:
+    python -m archive_completed [--older-than-days 90] [--batch-size 200]
+        [--max-batches N] [--pause-seconds 0.1]
+
+Runs the same batches as the app's periodic archive job: each batch of at
+most ``--batch-size`` flights is its own transaction, so the script can be
+stopped at any time and rerun to continue. ``--pause-seconds`` sleeps
+between batches to leave the database room for live traffic.
+"""
+
+import argparse
+
+from config import settings
+from core.archive import FlightArchiver
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=settings.ARCHIVE_AFTER_DAYS,
+        help="Archive completed flights that departed more than this many days ago",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.ARCHIVE_BATCH_SIZE,
+        help="Number of flights moved per transaction",
+    )
+    parser.add_argument("--max-batches", type=int, help="Stop after this many batches")
+    parser.add_argument(
+        "--pause-seconds",
+        type=float,
+        default=0.0,
+        help="Sleep between batches",
+    )
+    args = parser.parse_args()
+
+    archiver = FlightArchiver(after_days=args.older_than_days, batch_size=args.batch_size)
+    totals = archiver.run(
+        max_batches=args.max_batches,
+        pause_seconds=args.pause_seconds,
+        progress=lambda totals: print(
+            f"Batch {totals['batches']}: {totals['flights']} flights, "
+            f"{totals['bookings']} bookings, {totals['tickets']} tickets archived..."
+        ),
+    )
+    print(
+        f"Archived {totals['flights']} flights, {totals['bookings']} bookings and "
+        f"{totals['tickets']} tickets in {totals['batches']} batches "
+        f"({archiver.last_run_seconds:.1f}s)."
+    )
+
+
+if __name__ == "__main__":
+    main()
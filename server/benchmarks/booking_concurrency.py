@@ -0,0 +1,156 @@
+"""Fire parallel bookings at one flight and check that it is never oversold.
+
+Usage:
+    python -m benchmarks.booking_concurrency [--seats 200] [--bookings 1000] [--workers 64]
+
+Creates a plane with ``--seats`` seats, a future flight on it and a user,
+then runs ``--bookings`` single-passenger bookings through
+``BookingsService`` from ``--workers`` threads, each with its own session
+and connection. Exits non-zero unless exactly ``--seats`` bookings succeed
+and the inventory and ticket counts agree. Everything created is deleted
+afterwards.
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, delete, func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from config import settings
+from models.airport import Airport
+from models.booking import Booking
+from models.flight import Flight, FlightStatus
+from models.flight_inventory import FlightInventory
+from models.plane import Plane
+from models.ticket import Ticket
+from models.ticket_type import TicketType
+from models.user import User
+from schemas.booking import BookingCreate, PassengerCreate
+from services.auth_service import pwd_context
+from services.bookings_service import BookingsService
+
+PLANE_CODE = "BENCH-CONCURRENCY"
+FLIGHT_NUMBER = "BENCH-CONCURRENCY-1"
+USER_EMAIL = "bench-concurrency@example.com"
+USER_PHONE = "+840000000001"
+
+
+def cleanup(engine) -> None:
+    with engine.begin() as conn:
+        flight_ids = select(Flight.id).where(Flight.flight_number == FLIGHT_NUMBER)
+        user_ids = select(User.id).where(User.email == USER_EMAIL)
+        conn.execute(delete(Ticket).where(Ticket.flight_id.in_(flight_ids)))
+        conn.execute(delete(Booking).where(Booking.user_id.in_(user_ids)))
+        conn.execute(delete(Flight).where(Flight.flight_number == FLIGHT_NUMBER))
+        conn.execute(delete(Plane).where(Plane.code == PLANE_CODE))
+        conn.execute(delete(User).where(User.email == USER_EMAIL))
+
+
+def setup(engine, seats: int) -> tuple[int, int, int]:
+    """Create the plane, flight and user; return (flight_id, user_id, ticket_type_id)."""
+    with engine.begin() as conn:
+        plane_id = conn.execute(
+            insert(Plane).values(code=PLANE_CODE, total_seats=seats).returning(Plane.id)
+        ).scalar_one()
+        airports = conn.execute(select(Airport.id).limit(2)).scalars().all()
+        departure = datetime.now() + timedelta(days=30)
+        flight_id = conn.execute(
+            insert(Flight)
+            .values(
+                flight_number=FLIGHT_NUMBER,
+                departure_time=departure,
+                arrival_time=departure + timedelta(hours=2),
+                base_price=100.0,
+                status=FlightStatus.SCHEDULED,
+                plane_id=plane_id,
+                departure_airport_id=airports[0],
+                arrival_airport_id=airports[1],
+            )
+            .returning(Flight.id)
+        ).scalar_one()
+        user_id = conn.execute(
+            insert(User)
+            .values(
+                email=USER_EMAIL,
+                hashed_password=pwd_context.hash("bench-password"),
+                full_name="Bench User",
+                phone_number=USER_PHONE,
+            )
+            .returning(User.id)
+        ).scalar_one()
+        ticket_type_id = conn.execute(select(TicketType.id).limit(1)).scalar_one()
+    return flight_id, user_id, ticket_type_id
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seats", type=int, default=200)
+    parser.add_argument("--bookings", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=64)
+    args = parser.parse_args()
+
+    # One connection per worker, so every booking really runs concurrently
+    engine = create_engine(
+        settings.DATABASE_URL, pool_size=args.workers, max_overflow=0
+    )
+    Session = sessionmaker(bind=engine, autoflush=False)
+
+    cleanup(engine)
+    flight_id, user_id, ticket_type_id = setup(engine, args.seats)
+
+    def book(i: int) -> int:
+        booking_data = BookingCreate(
+            flight_id=flight_id,
+            ticket_type_id=ticket_type_id,
+            passengers=[PassengerCreate(passenger_name=f"Passenger {i}")],
+        )
+        db = Session()
+        try:
+            BookingsService(db).create_booking(user_id, booking_data)
+            return 201
+        except HTTPException as e:
+            return e.status_code
+        finally:
+            db.close()
+
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            results = Counter(pool.map(book, range(args.bookings)))
+        elapsed = time.perf_counter() - start
+
+        with engine.connect() as conn:
+            sold = conn.scalar(
+                select(FlightInventory.sold).where(FlightInventory.flight_id == flight_id)
+            )
+            tickets = conn.scalar(
+                select(func.count()).select_from(Ticket).where(Ticket.flight_id == flight_id)
+            )
+
+        print(
+            f"{args.bookings} bookings, {args.workers} workers, {args.seats} seats: "
+            f"{elapsed:.2f}s ({args.bookings / elapsed:.0f} bookings/s)"
+        )
+        print(f"  responses: {dict(sorted(results.items()))}")
+        print(f"  inventory sold: {sold}, tickets: {tickets}")
+
+        ok = (
+            results[201] == args.seats == sold == tickets
+            and results[201] + results[409] == args.bookings
+        )
+        print("  OK: no overselling" if ok else "  FAILED")
+    finally:
+        cleanup(engine)
+        engine.dispose()
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+"""Benchmark the public read endpoints and login, and catch regressions.
+
+Usage:
+    python -m benchmarks.endpoints [--load-data] [--concurrency 1,8,32]
+        [--requests 200] [--output results.json] [--baseline baseline.json]
+
+Runs the app in-process through ``httpx.ASGITransport`` against the
+configured database. With ``--load-data`` that database is first replaced
+(``generate_data --truncate``) by a small fixed-seed data set; otherwise it
+should already hold ``generate_data`` output, since logins use its users and
+password.
+
+Every endpoint gets ``--requests`` requests at each concurrency level, drawn
+from a seeded mix (filters, ids, search terms, users), so two runs send the
+same requests. Per endpoint and level it reports p50/p95/p99 latency,
+throughput and SQL queries per request, taken from the ``Server-Timing``
+header (enabled for this process, with the internal token). ``--output`` writes the results as JSON; ``--baseline`` compares
+against such a file and exits non-zero if p95 latency or throughput got
+worse by more than ``--threshold``, or any endpoint runs more queries.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import re
+import secrets
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable
+
+import httpx
+from sqlalchemy import select
+
+import generate_data
+from config import settings
+
+# Query counts come from Server-Timing, which is only sent with the internal
+# token; enable both for this process before the app is built
+settings.SERVER_TIMING_ENABLED = True
+settings.INTERNAL_API_TOKEN = settings.INTERNAL_API_TOKEN or secrets.token_hex(16)
+
+from database import engine  # noqa: E402
+from main import app  # noqa: E402
+from models.airport import Airport  # noqa: E402
+from models.flight import Flight, FlightStatus  # noqa: E402
+from models.user import User  # noqa: E402
+
+_QUERIES = re.compile(r'queries=(\d+)')
+
+# Data set loaded by --load-data
+LOAD_DATA_CONFIG = dict(
+    seed=42,
+    airports=len(generate_data.AIRPORTS),
+    planes=60,
+    days=60,
+    flights_per_day=200,
+    users=20_000,
+    bookings=200_000,
+    tickets_per_booking=1.6,
+)
+AIRPORT_SEARCH_TERMS = ["ha", "sgn", "Da", "Phu", "International", "Nha Trang", "zzz"]
+
+
+@dataclass(frozen=True)
+class Fixture:
+    """Ids and values the request mix is drawn from."""
+
+    flight_ids: list[int]
+    flight_numbers: list[str]
+    airport_ids: list[str]
+    dates: list[date]
+    emails: list[str]
+    password: str
+
+
+# name -> builds (method, url, json body) from the seeded RNG
+Endpoint = Callable[[random.Random, Fixture], tuple[str, str, dict | None]]
+
+
+def _flights_page(rng, fx):
+    return "GET", f"/flights?skip={rng.randrange(0, 500, 50)}&limit=50", None
+
+
+def _flights_by_date(rng, fx):
+    return "GET", f"/flights?flight_date={rng.choice(fx.dates):%d/%m/%Y}", None
+
+
+def _flights_by_route(rng, fx):
+    departure, arrival = rng.sample(fx.airport_ids, 2)
+    return (
+        "GET",
+        f"/flights?departure_airport_id={departure}&arrival_airport_id={arrival}",
+        None,
+    )
+
+
+def _flights_by_date_and_route(rng, fx):
+    departure, arrival = rng.sample(fx.airport_ids, 2)
+    return (
+        "GET",
+        f"/flights?flight_date={rng.choice(fx.dates):%d/%m/%Y}"
+        f"&departure_airport_id={departure}&arrival_airport_id={arrival}",
+        None,
+    )
+
+
+def _flight_by_id(rng, fx):
+    return "GET", f"/flights/{rng.choice(fx.flight_ids)}", None
+
+
+def _flight_by_number(rng, fx):
+    return "GET", f"/flights/{rng.choice(fx.flight_numbers)}", None
+
+
+def _airport_search(rng, fx):
+    return "GET", f"/airports/search?q={rng.choice(AIRPORT_SEARCH_TERMS)}", None
+
+
+def _addon_catalog(rng, fx):
+    return "GET", "/ticket-options/addon-options", None
+
+
+def _login(rng, fx):
+    return "POST", "/auth/login", {"email": rng.choice(fx.emails), "password": fx.password}
+
+
+ENDPOINTS: dict[str, Endpoint] = {
+    "flights_page": _flights_page,
+    "flights_by_date": _flights_by_date,
+    "flights_by_route": _flights_by_route,
+    "flights_by_date_and_route": _flights_by_date_and_route,
+    "flight_by_id": _flight_by_id,
+    "flight_by_number": _flight_by_number,
+    "airport_search": _airport_search,
+    "addon_catalog": _addon_catalog,
+    "login": _login,
+}
+
+
+def load_data() -> None:
+    config = generate_data.GeneratorConfig(
+        **LOAD_DATA_CONFIG,
+        start_date=date.today() - timedelta(days=LOAD_DATA_CONFIG["days"] // 2),
+    )
+    generate_data.generate(config, password="12345678", truncate=True)
+
+
+def load_fixture(password: str) -> Fixture:
+    with engine.connect() as conn:
+        flights = conn.execute(
+            select(Flight.id, Flight.flight_number)
+            .where(
+                Flight.departure_time >= datetime.now(),
+                Flight.status == FlightStatus.SCHEDULED,
+            )
+            .order_by(Flight.id)
+            .limit(1000)
+        ).all()
+        airport_ids = conn.execute(select(Airport.id).order_by(Airport.id)).scalars().all()
+        emails = conn.execute(
+            select(User.email).order_by(User.id).limit(200)
+        ).scalars().all()
+    if not flights or len(airport_ids) < 2 or not emails:
+        raise SystemExit("The database has no usable data; rerun with --load-data.")
+    return Fixture(
+        flight_ids=[row.id for row in flights],
+        flight_numbers=[row.flight_number for row in flights],
+        airport_ids=airport_ids,
+        dates=[date.today() + timedelta(days=n) for n in range(1, 15)],
+        emails=emails,
+        password=password,
+    )
+
+
+async def run_level(
+    client: httpx.AsyncClient, requests: list[tuple], concurrency: int
+) -> dict:
+    pending = iter(requests)
+    latencies: list[float] = []
+    queries: list[int] = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        for method, url, body in pending:
+            start = time.perf_counter()
+            response = await client.request(method, url, json=body)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+            match = _QUERIES.search(response.headers.get("server-timing", ""))
+            if match:
+                queries.append(int(match.group(1)))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": round(percentiles[49] * 1000, 3),
+        "p95_ms": round(percentiles[94] * 1000, 3),
+        "p99_ms": round(percentiles[98] * 1000, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "queries_per_request": round(statistics.fmean(queries), 3) if queries else None,
+    }
+
+
+async def run(endpoints: list[str], levels: list[int], count: int, seed: int, fixture: Fixture) -> dict:
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://benchmark",
+        headers={"X-Internal-Token": settings.INTERNAL_API_TOKEN},
+    ) as client:
+        for name in endpoints:
+            build = ENDPOINTS[name]
+            rng = random.Random(f"{seed}:{name}")
+            warmup = [build(rng, fixture) for _ in range(5)]
+            await run_level(client, warmup, 1)
+            for level in levels:
+                rng = random.Random(f"{seed}:{name}:{level}")
+                requests = [build(rng, fixture) for _ in range(count)]
+                result = await run_level(client, requests, level)
+                results[f"{name}@{level}"] = result
+                print_result(f"{name}@{level}", result)
+    return results
+
+
+def print_result(key: str, result: dict) -> None:
+    print(
+        f"{key:34} p50 {result['p50_ms']:8.2f}  p95 {result['p95_ms']:8.2f}  "
+        f"p99 {result['p99_ms']:8.2f} ms  {result['throughput_rps']:8.1f} req/s  "
+        f"queries {result['queries_per_request']}  errors {result['errors']}"
+    )
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Regressions of ``results`` against a baseline, as readable lines."""
+    regressions = []
+    for key, base in baseline.items():
+        current = results.get(key)
+        if current is None:
+            continue
+        if current["p95_ms"] > base["p95_ms"] * (1 + threshold):
+            regressions.append(
+                f"{key}: p95 {base['p95_ms']:.2f} -> {current['p95_ms']:.2f} ms"
+            )
+        if current["throughput_rps"] < base["throughput_rps"] * (1 - threshold):
+            regressions.append(
+                f"{key}: throughput {base['throughput_rps']:.1f} -> "
+                f"{current['throughput_rps']:.1f} req/s"
+            )
+        if (current["queries_per_request"] or 0) > (base["queries_per_request"] or 0):
+            regressions.append(
+                f"{key}: queries per request {base['queries_per_request']} -> "
+                f"{current['queries_per_request']}"
+            )
+        if current["errors"] > base["errors"]:
+            regressions.append(f"{key}: errors {base['errors']} -> {current['errors']}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--load-data",
+        action="store_true",
+        help="Replace the database contents with the fixed benchmark data set first",
+    )
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma-separated levels")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint and level")
+    parser.add_argument(
+        "--endpoints",
+        default=",".join(ENDPOINTS),
+        help=f"Comma-separated subset of: {', '.join(ENDPOINTS)}",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the request mix")
+    parser.add_argument("--password", default="12345678", help="Password of the generated users")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against this JSON results file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed relative p95/throughput regression against the baseline",
+    )
+    args = parser.parse_args()
+
+    endpoints = [name.strip() for name in args.endpoints.split(",") if name.strip()]
+    unknown = set(endpoints) - set(ENDPOINTS)
+    if unknown:
+        parser.error(f"unknown endpoints: {', '.join(sorted(unknown))}")
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    if args.load_data:
+        load_data()
+    fixture = load_fixture(args.password)
+    results = asyncio.run(run(endpoints, levels, args.requests, args.seed, fixture))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "meta": {
+                        "created_at": datetime.now().isoformat(timespec="seconds"),
+                        "python": platform.python_version(),
+                        "requests": args.requests,
+                        "concurrency": levels,
+                        "seed": args.seed,
+                        "list_fast_path": settings.LIST_FAST_PATH,
+                    },
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regressions against {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions against {args.baseline}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Compare the ORM and Core read paths of the list endpoints.
+
+Usage:
+    python -m benchmarks.list_endpoints [--rows 1000] [--iterations 50]
+
+Inserts ``--rows`` flights on one future day, then requests that day's page
+through the service layer and through ``GET /flights`` with
+``LIST_FAST_PATH`` off (ORM instances + response model) and on (Core row
+tuples + prebuilt JSON). Reports latency and peak traced memory per call.
+The inserted flights are deleted afterwards.
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, insert, select
+
+from config import settings
+from database import SessionLocal, engine
+from main import app
+from models.airport import Airport
+from models.flight import Flight, FlightStatus
+from models.plane import Plane
+from services.flights_service import FlightsService
+
+FLIGHT_NUMBER_PREFIX = "BENCH-LIST-"
+
+
+def insert_flights(rows: int, day: date) -> None:
+    with engine.begin() as conn:
+        plane_id = conn.execute(select(Plane.id).limit(1)).scalar_one()
+        airports = conn.execute(select(Airport.id).limit(2)).scalars().all()
+        departure = datetime.combine(day, datetime.min.time())
+        conn.execute(
+            insert(Flight),
+            [
+                {
+                    "flight_number": f"{FLIGHT_NUMBER_PREFIX}{i:05d}",
+                    "departure_time": departure + timedelta(seconds=i),
+                    "arrival_time": departure + timedelta(hours=2, seconds=i),
+                    "base_price": 100.0 + i,
+                    "status": FlightStatus.SCHEDULED,
+                    "plane_id": plane_id,
+                    "departure_airport_id": airports[0],
+                    "arrival_airport_id": airports[1],
+                }
+                for i in range(rows)
+            ],
+        )
+
+
+def delete_flights() -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            delete(Flight).where(Flight.flight_number.startswith(FLIGHT_NUMBER_PREFIX))
+        )
+
+
+def measure(func, iterations: int) -> dict:
+    func()  # warm up caches (compiled SQL, pool, pydantic)
+    latencies = []
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(iterations):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            func()
+            latencies.append(time.perf_counter() - start)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "peak_kib": statistics.median(peaks) / 1024,
+    }
+
+
+def print_result(name: str, orm: dict, core: dict) -> None:
+    print(f"\n{name}")
+    print(f"  {'':6} {'p50 ms':>10} {'mean ms':>10} {'peak KiB':>10}")
+    for label, result in (("orm", orm), ("core", core)):
+        print(
+            f"  {label:6} {result['p50_ms']:10.2f} {result['mean_ms']:10.2f} "
+            f"{result['peak_kib']:10.1f}"
+        )
+    print(
+        f"  core/orm: latency x{core['p50_ms'] / orm['p50_ms']:.2f}, "
+        f"peak memory x{core['peak_kib'] / orm['peak_kib']:.2f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    day = date.today() + timedelta(days=400)
+    delete_flights()
+    insert_flights(args.rows, day)
+    try:
+        page = {"skip": 0, "limit": args.rows, "flight_date": day}
+
+        def service_call(method_name: str):
+            def call():
+                db = SessionLocal()
+                try:
+                    result = getattr(FlightsService(db), method_name)(**page)
+                    assert len(result) == args.rows
+                finally:
+                    db.close()
+
+            return call
+
+        print_result(
+            f"FlightsService, {args.rows} rows",
+            measure(service_call("get_flights"), args.iterations),
+            measure(service_call("get_flight_rows"), args.iterations),
+        )
+
+        client = TestClient(app)
+        url = f"/flights?limit={args.rows}&flight_date={day:%d/%m/%Y}"
+
+        def endpoint_call(fast_path: bool):
+            def call():
+                settings.LIST_FAST_PATH = fast_path
+                response = client.get(url)
+                assert response.status_code == 200, response.text
+
+            return call
+
+        print_result(
+            f"GET /flights, {args.rows} rows",
+            measure(endpoint_call(False), args.iterations),
+            measure(endpoint_call(True), args.iterations),
+        )
+    finally:
+        delete_flights()
+
+
+if __name__ == "__main__":
+    main()
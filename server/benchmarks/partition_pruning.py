@@ -0,0 +1,93 @@
+"""Check that flight list queries only scan the partitions they need.
+
+Usage:
+    python -m benchmarks.partition_pruning [--days 3]
+
+Builds the ``GET /flights`` queries of ``FlightsService`` (one departure
+day, and today onward, with and without a route) and runs ``EXPLAIN`` on
+them. A one-day query must scan only that month's partition; a today-onward
+query no partition of an earlier month. Exits non-zero otherwise.
+"""
+
+import argparse
+import json
+import sys
+from datetime import date, timedelta
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from database import engine
+from services.flights_service import FLIGHT_LIST_COLUMNS, FlightsService
+
+
+def scanned_partitions(conn, stmt) -> list[str]:
+    sql = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    plan = conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    relations = []
+
+    def walk(node):
+        if "Relation Name" in node:
+            relations.append(node["Relation Name"])
+        for child in node.get("Plans", []):
+            walk(child)
+
+    walk(plan[0]["Plan"])
+    return sorted(set(relations))
+
+
+def partition_month(name: str) -> str | None:
+    """``YYYYMM`` of a monthly partition, None for the default partition."""
+    return name.removeprefix("flights_p") if name.startswith("flights_p") else None
+
+
+def _route_label(filters: dict) -> str:
+    if not filters:
+        return ""
+    return f"{filters['departure_airport_id']}->{filters['arrival_airport_id']}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=3, help="Departure days to check, from tomorrow")
+    args = parser.parse_args()
+
+    today = date.today()
+    route = {"departure_airport_id": "HAN", "arrival_airport_id": "SGN"}
+    failures = 0
+    with engine.connect() as conn:
+        checks = []
+        for offset in range(1, args.days + 1):
+            day = today + timedelta(days=offset)
+            for filters in ({}, route):
+                checks.append((f"{day} {_route_label(filters)}", day, filters))
+        for filters in ({}, route):
+            checks.append((f"today onward {_route_label(filters)}", None, filters))
+
+        for label, day, filters in checks:
+            stmt = FlightsService._filter_flights(
+                select(*FLIGHT_LIST_COLUMNS),
+                day,
+                filters.get("departure_airport_id"),
+                filters.get("arrival_airport_id"),
+            ).limit(100)
+            partitions = scanned_partitions(conn, stmt)
+            if day is not None:
+                ok = partitions == [f"flights_p{day:%Y%m}"]
+            else:
+                ok = all(
+                    (partition_month(p) or "999999") >= f"{today:%Y%m}" for p in partitions
+                )
+            failures += not ok
+            print(f"{'ok  ' if ok else 'FAIL'} {label:30} {', '.join(partitions)}")
+
+    if failures:
+        print(f"\n{failures} queries scan partitions they should have pruned.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Check read replica routing, ejection and read-your-writes end to end.
+
+Usage:
+    DATABASE_REPLICA_ENDPOINTS=<host> python -m benchmarks.replica_routing [--reads 20]
+
+Needs at least one replica in ``DATABASE_REPLICA_ENDPOINTS`` with the same
+schema and credentials as the primary. A real streaming replica works, and
+so does any stand-in: the primary's own server under a second host name
+(e.g. ``DATABASE_ENDPOINT=db DATABASE_REPLICA_ENDPOINTS=<ip of db>`` in
+docker compose, or a local server reached over a unix socket and
+``127.0.0.1``) gets its own pool and is routed to like a replica.
+
+Runs the app in-process with ``TestClient`` and counts pool checkouts per
+engine to see where each request went:
+
+1. anonymous GETs are served by the replicas, not the primary;
+2. after a successful login, the same client's GETs stay on the primary
+   for ``READ_YOUR_WRITES_SECONDS``;
+3. after the replicas' backends are terminated mid-run, a GET still
+   succeeds (retried on the primary), the replica is ejected, and the
+   following GETs go to the primary.
+
+Exits non-zero if any step fails. The user created for the login is
+deleted afterwards.
+"""
+
+import argparse
+import sys
+
+from sqlalchemy import create_engine, delete, event, insert, select, text
+from sqlalchemy.pool import NullPool
+
+from config import settings
+
+# A dropped replica connection must surface as an error, not be recycled
+# silently by the pre-ping
+settings.DB_POOL_PRE_PING = False
+settings.READ_YOUR_WRITES_SECONDS = settings.READ_YOUR_WRITES_SECONDS or 5.0
+settings.ACCESS_LOG_ENABLED = False
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from database import engine, replicas  # noqa: E402
+from main import app  # noqa: E402
+from models.refresh_token import RefreshToken  # noqa: E402
+from models.user import User  # noqa: E402
+from services.auth_service import pwd_context  # noqa: E402
+
+USER_EMAIL = "bench-replica@example.com"
+USER_PHONE = "+840000000002"
+USER_PASSWORD = "bench-password"
+READ_PATH = "/flights?limit=1"
+
+
+def cleanup() -> None:
+    with engine.begin() as conn:
+        user_ids = select(User.id).where(User.email == USER_EMAIL)
+        conn.execute(delete(RefreshToken).where(RefreshToken.user_id.in_(user_ids)))
+        conn.execute(delete(User).where(User.email == USER_EMAIL))
+
+
+def setup() -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User).values(
+                email=USER_EMAIL,
+                hashed_password=pwd_context.hash(USER_PASSWORD),
+                full_name="Bench User",
+                phone_number=USER_PHONE,
+            )
+        )
+
+
+def checkouts() -> tuple[int, int]:
+    """Pool checkouts so far on the primary and on all replicas."""
+    return engine.pool.stats.checkouts, sum(r.pool.stats.checkouts for r in replicas.engines)
+
+
+def reads(client: TestClient, count: int) -> tuple[list[int], int, int]:
+    """Send ``count`` GETs; return their status codes and the checkouts per side."""
+    primary_before, replica_before = checkouts()
+    codes = [client.get(READ_PATH).status_code for _ in range(count)]
+    primary_after, replica_after = checkouts()
+    return codes, primary_after - primary_before, replica_after - replica_before
+
+
+def client() -> TestClient:
+    # Errors are counted as 500s instead of raised into this script
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def report(name: str, ok: bool, codes: list[int], primary: int, replica: int) -> bool:
+    print(
+        f"  {'OK    ' if ok else 'FAILED'} {name}: statuses {sorted(set(codes))}, "
+        f"primary checkouts {primary}, replica checkouts {replica}"
+    )
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reads", type=int, default=20)
+    args = parser.parse_args()
+
+    if not replicas.engines:
+        sys.exit("DATABASE_REPLICA_ENDPOINTS is empty: configure at least one replica")
+
+    # Backend pids of every replica connection, to cut them off in step 3
+    backend_pids: dict[str, set[int]] = {}
+    for replica in replicas.engines:
+        pids = backend_pids.setdefault(replica.url.render_as_string(hide_password=False), set())
+
+        def remember_pid(dbapi_connection, connection_record, pids=pids):
+            pids.add(dbapi_connection.get_backend_pid())
+
+        event.listen(replica, "connect", remember_pid)
+
+    cleanup()
+    setup()
+    results = []
+    try:
+        print(
+            f"primary {engine.url.render_as_string(hide_password=True)}, "
+            f"replicas {[r['url'] for r in replicas.stats()]}"
+        )
+
+        codes, primary, replica = reads(client(), args.reads)
+        results.append(report(
+            "anonymous reads use the replicas",
+            set(codes) == {200} and primary == 0 and replica == args.reads,
+            codes, primary, replica,
+        ))
+
+        writer = client()
+        login = writer.post("/auth/login", json={"email": USER_EMAIL, "password": USER_PASSWORD})
+        writer.headers["Authorization"] = f"Bearer {login.json().get('accessToken')}"
+        codes, primary, replica = reads(writer, args.reads)
+        results.append(report(
+            "reads after the client's write stay on the primary",
+            login.status_code == 200 and set(codes) == {200} and replica == 0 and primary > 0,
+            codes, primary, replica,
+        ))
+
+        for url, pids in backend_pids.items():
+            admin = create_engine(url, poolclass=NullPool)
+            with admin.begin() as conn:
+                conn.execute(
+                    text("SELECT pg_terminate_backend(pid) FROM unnest(CAST(:pids AS int[])) AS pid"),
+                    {"pids": sorted(pids)},
+                )
+            admin.dispose()
+        ejections_before = replicas.ejections
+        codes, primary, replica = reads(client(), args.reads)
+        results.append(report(
+            "a dropped replica is ejected and reads fall back to the primary",
+            set(codes) == {200}
+            and replicas.ejections > ejections_before
+            and not any(r["healthy"] for r in replicas.stats())
+            and primary >= args.reads,
+            codes, primary, replica,
+        ))
+    finally:
+        cleanup()
+
+    print("OK" if all(results) else "FAILED")
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,15 +4,102 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     SECRET_KEY: str = "default"
     ALGORITHM: str = "HS256"
+    # Asymmetric signing (RS256/EdDSA): PEM private key, kid = file name stem
+    JWT_PRIVATE_KEY_FILE: str | None = None
+    # Extra PEM public keys still accepted for verification during rotation
+    JWT_PUBLIC_KEYS_DIR: str | None = None
+    # Key files are re-read at this interval, so rotated keys are picked up
+    # without a restart (only with JWT_PRIVATE_KEY_FILE)
+    KEY_RING_RELOAD_SECONDS: float = 300.0
+    JWKS_CACHE_MAX_AGE_SECONDS: int = 3600
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30.0
+    LAST_LOGIN_FLUSH_INTERVAL_SECONDS: float = 5.0
+    LAST_LOGIN_BUFFER_MAX_SIZE: int = 10000
+    REVOCATION_SYNC_INTERVAL_SECONDS: float = 5.0
+    REVOCATION_PRUNE_INTERVAL_SECONDS: float = 3600.0
     POSTGRES_USER: str = "myuser"
     POSTGRES_PASSWORD: str = "mypassword"
     DATABASE_ENDPOINT: str = "db"
     POSTGRES_DB: str = "mydatabase"
+    # Connection pool (per worker process)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+    DB_POOL_USE_LIFO: bool = False
+    # Read replicas: comma-separated hosts using the same credentials/database
+    DATABASE_REPLICA_ENDPOINTS: str = ""
+    REPLICA_EJECT_SECONDS: float = 30.0
+    # Reads stay on the primary for this long after a client's own write
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+    # Required in the X-Internal-Token header of /internal endpoints (disabled if unset)
+    INTERNAL_API_TOKEN: str | None = None
+    # Queries slower than this are written (sampled) to the "sql.slow" logger
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SLOW_QUERY_LOG_SAMPLE_RATE: float = 1.0
+    # Server-Timing header with DB time and query count, only sent to
+    # requests carrying the internal token
+    SERVER_TIMING_ENABLED: bool = False
+    # Serve Prometheus metrics at /metrics and record per-route request
+    # durations; scrapes must send the internal token as X-Internal-Token
+    METRICS_ENABLED: bool = False
+    # JSON access log, written by a background thread to this file (stdout if
+    # empty); entries beyond ACCESS_LOG_QUEUE_SIZE waiting ones are dropped
+    ACCESS_LOG_ENABLED: bool = True
+    ACCESS_LOG_PATH: str = ""
+    ACCESS_LOG_QUEUE_SIZE: int = 10000
+    # cProfile request profiling; without PROFILING_ENABLED nothing is
+    # installed. Requests sending X-Profile with the internal token are
+    # profiled, plus this fraction of all requests
+    PROFILING_ENABLED: bool = False
+    PROFILE_SAMPLE_RATE: float = 0.0
+    PROFILE_TOP_N: int = 30
+    PROFILE_MAX_STORED: int = 50
+    # Also write each profile (pstats format) into this directory
+    PROFILE_DIRECTORY: str = ""
+    # Serve list endpoints from Core row tuples instead of ORM instances
+    LIST_FAST_PATH: bool = True
+    # Seat letters across one row; seat maps number seats row by row (A1, B1, ...)
+    SEAT_COLUMNS: str = "ABCDEF"
+    # Pending bookings hold their seats this long before the sweeper cancels them
+    BOOKING_HOLD_TTL_SECONDS: int = 900
+    BOOKING_HOLD_SWEEP_INTERVAL_SECONDS: float = 10.0
+    BOOKING_HOLD_SWEEP_BATCH_SIZE: int = 500
+    # Idempotency-Key: how long results are replayed, and how long a retry
+    # waits for the first request / after which an unfinished one is abandoned
+    IDEMPOTENCY_TTL_SECONDS: int = 86400
+    IDEMPOTENCY_WAIT_SECONDS: float = 10.0
+    IDEMPOTENCY_LOCK_SECONDS: int = 60
+    IDEMPOTENCY_CLEANUP_INTERVAL_SECONDS: float = 3600.0
+    # flights is partitioned by departure month; partitions are created this
+    # many months ahead, checked at startup and then at this interval
+    FLIGHT_PARTITION_MONTHS_AHEAD: int = 12
+    FLIGHT_PARTITION_CHECK_INTERVAL_SECONDS: float = 21600.0
+    # Completed flights departed more than this many days ago move, with
+    # their bookings and tickets, to the archive tables in batches of flights.
+    # Off by default: run archive_completed.py, or set ARCHIVE_ENABLED to also
+    # archive periodically from the server
+    ARCHIVE_ENABLED: bool = False
+    ARCHIVE_AFTER_DAYS: int = 90
+    ARCHIVE_BATCH_SIZE: int = 200
+    ARCHIVE_INTERVAL_SECONDS: float = 3600.0
 
     @property
     def DATABASE_URL(self) -> str:
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.DATABASE_ENDPOINT}:5432/{self.POSTGRES_DB}"
 
+    @property
+    def DATABASE_REPLICA_URLS(self) -> list[str]:
+        return [
+            f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{endpoint.strip()}:5432/{self.POSTGRES_DB}"
+            for endpoint in self.DATABASE_REPLICA_ENDPOINTS.split(",")
+            if endpoint.strip()
+        ]
+
 
 settings = Settings()
@@ -0,0 +1,101 @@
+import json
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener, WatchedFileHandler
+
+from config import settings
+
+
+class JSONLineFormatter(logging.Formatter):
+    """One JSON object per line, built from the record's ``fields`` dict."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(
+            {"ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"), **record.fields},
+            separators=(",", ":"),
+            default=str,
+        )
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks: records that do not fit are counted and dropped.
+
+    Records are enqueued as they are; formatting happens in the listener
+    thread, so the request path only pays for building the record.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class AccessLog:
+    """Structured access log written by a background thread.
+
+    ``log()`` puts a record on a bounded queue; a ``QueueListener`` thread
+    formats it as a JSON line and writes it to ``path`` (stdout if empty).
+    When the sink falls behind and the queue is full, records are dropped
+    and counted instead of slowing requests down. Until ``start()`` runs,
+    records wait in the queue.
+    """
+
+    def __init__(self, max_queued: int, path: str = ""):
+        self.path = path
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queued)
+        self._handler = DroppingQueueHandler(self._queue)
+        self._logger = logging.getLogger("access")
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        self._logger.addHandler(self._handler)
+        self._listener: QueueListener | None = None
+        self.logged = 0
+
+    def start(self) -> None:
+        if self._listener is not None:
+            return
+        sink = WatchedFileHandler(self.path) if self.path else logging.StreamHandler(sys.stdout)
+        sink.setFormatter(JSONLineFormatter())
+        self._listener = QueueListener(self._queue, sink)
+        self._listener.start()
+
+    def stop(self) -> None:
+        """Write what is queued and stop the writer thread."""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+        self._listener = None
+
+    def log(self, fields: dict) -> None:
+        self.logged += 1
+        self._logger.info("access", extra={"fields": fields})
+
+    @property
+    def dropped(self) -> int:
+        return self._handler.dropped
+
+    def stats(self) -> dict:
+        return {
+            "running": self._listener is not None,
+            "logged": self.logged,
+            "dropped": self.dropped,
+            "queued": self._queue.qsize(),
+            "max_queued": self._queue.maxsize,
+        }
+
+
+access_log = AccessLog(
+    max_queued=settings.ACCESS_LOG_QUEUE_SIZE,
+    path=settings.ACCESS_LOG_PATH,
+)
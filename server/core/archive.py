@@ -0,0 +1,181 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy import text
+
+from config import settings
+from database import engine
+from models.booking import Booking
+from models.flight import Flight
+from models.ticket import Ticket
+
+logger = logging.getLogger(__name__)
+
+_FLIGHT_COLUMNS = [column.name for column in Flight.__table__.c]
+_BOOKING_COLUMNS = [column.name for column in Booking.__table__.c]
+_TICKET_COLUMNS = [column.name for column in Ticket.__table__.c]
+
+
+def _columns(names: list[str], alias: str = "") -> str:
+    return ", ".join(f"{alias}{name}" for name in names)
+
+
+# Moves one batch of completed flights, with their bookings and tickets, to
+# the archive tables in a single statement. A booking moves only once every
+# flight it has tickets on is archivable; a flight moves only once all its
+# tickets move with it, otherwise it stays hot and is retried on the next
+# run. Every CTE sees the same snapshot, and foreign keys (and the
+# flight_registry trigger) are checked at the end of the statement.
+ARCHIVE_BATCH_SQL = text(f"""
+    WITH batch AS (
+        SELECT id, departure_time FROM flights
+        WHERE status = 'COMPLETED' AND departure_time < :cutoff
+          AND (departure_time, id) > (:after_time, :after_id)
+        ORDER BY departure_time, id
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    ), movable AS (
+        SELECT DISTINCT t.booking_id AS id
+        FROM tickets t
+        JOIN batch ON batch.id = t.flight_id
+        WHERE NOT EXISTS (
+            SELECT 1 FROM tickets other
+            JOIN flights f ON f.id = other.flight_id
+            WHERE other.booking_id = t.booking_id
+              AND NOT (f.status = 'COMPLETED' AND f.departure_time < :cutoff)
+        )
+    ), moved_tickets AS (
+        DELETE FROM tickets t USING movable
+        WHERE t.booking_id = movable.id
+        RETURNING {_columns(_TICKET_COLUMNS, "t.")}
+    ), moved_bookings AS (
+        DELETE FROM bookings b USING movable
+        WHERE b.id = movable.id
+        RETURNING {_columns(_BOOKING_COLUMNS, "b.")}
+    ), moved_flights AS (
+        DELETE FROM flights f USING batch
+        WHERE f.id = batch.id AND f.departure_time = batch.departure_time
+          AND NOT EXISTS (
+              SELECT 1 FROM tickets t
+              WHERE t.flight_id = f.id AND t.booking_id NOT IN (SELECT id FROM movable)
+          )
+        RETURNING {_columns(_FLIGHT_COLUMNS, "f.")}
+    ), archived_tickets AS (
+        INSERT INTO tickets_archive ({_columns(_TICKET_COLUMNS)})
+        SELECT {_columns(_TICKET_COLUMNS)} FROM moved_tickets
+    ), archived_bookings AS (
+        INSERT INTO bookings_archive ({_columns(_BOOKING_COLUMNS)})
+        SELECT {_columns(_BOOKING_COLUMNS)} FROM moved_bookings
+    ), archived_flights AS (
+        INSERT INTO flights_archive ({_columns(_FLIGHT_COLUMNS)})
+        SELECT {_columns(_FLIGHT_COLUMNS)} FROM moved_flights
+    )
+    SELECT
+        (SELECT count(*) FROM moved_flights) AS flights,
+        (SELECT count(*) FROM moved_bookings) AS bookings,
+        (SELECT count(*) FROM moved_tickets) AS tickets,
+        last.departure_time AS last_departure_time,
+        last.id AS last_id
+    FROM (
+        SELECT departure_time, id FROM batch
+        ORDER BY departure_time DESC, id DESC
+        LIMIT 1
+    ) AS last
+""")
+
+
+class FlightArchiver:
+    """Moves completed flights older than ``after_days`` to the archive tables.
+
+    Works through the flights in ``(departure_time, id)`` order, one
+    transaction of at most ``batch_size`` flights at a time, so row locks
+    are held briefly and an interrupted run loses nothing: committed
+    batches stay archived and the next run picks up what is left.
+    """
+
+    def __init__(self, after_days: int, batch_size: int):
+        self.after_days = after_days
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self.runs = 0
+        self.batches = 0
+        self.flights = 0
+        self.bookings = 0
+        self.tickets = 0
+        self.last_run_seconds = 0.0
+        self.longest_batch_seconds = 0.0
+
+    def run(
+        self,
+        max_batches: int | None = None,
+        pause_seconds: float = 0.0,
+        progress: Callable[[dict], None] | None = None,
+    ) -> dict:
+        """Archive until no batch is left (or ``max_batches``); returns the totals."""
+        totals = {"batches": 0, "flights": 0, "bookings": 0, "tickets": 0}
+        with self._lock:
+            start = time.perf_counter()
+            cutoff = datetime.now() - timedelta(days=self.after_days)
+            after_time, after_id = datetime.min, 0
+            while max_batches is None or totals["batches"] < max_batches:
+                batch_start = time.perf_counter()
+                with engine.begin() as conn:
+                    row = conn.execute(
+                        ARCHIVE_BATCH_SQL,
+                        {
+                            "cutoff": cutoff,
+                            "after_time": after_time,
+                            "after_id": after_id,
+                            "batch_size": self.batch_size,
+                        },
+                    ).first()
+                if row is None:
+                    break
+                self.longest_batch_seconds = max(
+                    self.longest_batch_seconds, time.perf_counter() - batch_start
+                )
+                after_time, after_id = row.last_departure_time, row.last_id
+                totals["batches"] += 1
+                for key in ("flights", "bookings", "tickets"):
+                    totals[key] += getattr(row, key)
+                if progress:
+                    progress(dict(totals))
+                if pause_seconds:
+                    time.sleep(pause_seconds)
+
+            self.runs += 1
+            self.batches += totals["batches"]
+            self.flights += totals["flights"]
+            self.bookings += totals["bookings"]
+            self.tickets += totals["tickets"]
+            self.last_run_seconds = time.perf_counter() - start
+        if totals["flights"] or totals["bookings"]:
+            logger.info(
+                "Archived %d flights, %d bookings, %d tickets",
+                totals["flights"],
+                totals["bookings"],
+                totals["tickets"],
+            )
+        return totals
+
+    def stats(self) -> dict:
+        return {
+            "enabled": settings.ARCHIVE_ENABLED,
+            "after_days": self.after_days,
+            "runs": self.runs,
+            "batches": self.batches,
+            "flights": self.flights,
+            "bookings": self.bookings,
+            "tickets": self.tickets,
+            "last_run_seconds": round(self.last_run_seconds, 6),
+            "longest_batch_seconds": round(self.longest_batch_seconds, 6),
+        }
+
+
+flight_archiver = FlightArchiver(
+    after_days=settings.ARCHIVE_AFTER_DAYS,
+    batch_size=settings.ARCHIVE_BATCH_SIZE,
+)
@@ -0,0 +1,41 @@
+import asyncio
+import logging
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTasks:
+    """Runs blocking maintenance jobs at fixed intervals during the app lifespan.
+
+    Each job runs in a worker thread so it never blocks the event loop, and a
+    failing run is logged without stopping later runs.
+    """
+
+    def __init__(self):
+        self._jobs: list[tuple[str, Callable[[], object], float]] = []
+        self._tasks: list[asyncio.Task] = []
+
+    def add(self, func: Callable[[], object], interval: float, name: str | None = None):
+        self._jobs.append((name or func.__qualname__, func, interval))
+
+    def start(self) -> None:
+        for name, func, interval in self._jobs:
+            self._tasks.append(
+                asyncio.create_task(self._run(name, func, interval), name=name)
+            )
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    @staticmethod
+    async def _run(name: str, func: Callable[[], object], interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(func)
+            except Exception:
+                logger.exception("Periodic task %s failed", name)
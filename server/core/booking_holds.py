@@ -0,0 +1,207 @@
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+
+from sqlalchemy import text
+
+from config import settings
+from core.seat_map import seat_index
+from database import engine
+
+logger = logging.getLogger(__name__)
+
+# Window over which hold/expire/confirm rates are reported
+RATE_WINDOW_SECONDS = 300
+
+# Cancels one batch of expired holds and frees their ticket seats in a single
+# statement. SKIP LOCKED lets several workers sweep at once and never waits on
+# a booking that is being confirmed or whose seat is being changed. ``held``
+# is the statement snapshot; ``cleared`` only updates tickets whose seat is
+# still the one in it and returns that seat, so the bits freed afterwards are
+# exactly the seats this sweep took away, never one changed concurrently.
+EXPIRE_BATCH_SQL = text("""
+    WITH expired AS (
+        SELECT id FROM bookings
+        WHERE status = 'PENDING' AND hold_expires_at <= :now
+        ORDER BY hold_expires_at
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    ), cancelled AS (
+        UPDATE bookings b
+        SET status = 'CANCELLED', hold_expires_at = NULL
+        FROM expired
+        WHERE b.id = expired.id
+        RETURNING b.id
+    ), held AS (
+        SELECT t.id, t.booking_id, t.flight_id, t.seat_number
+        FROM tickets t
+        JOIN cancelled c ON c.id = t.booking_id
+    ), cleared AS (
+        UPDATE tickets t
+        SET seat_number = NULL
+        FROM held
+        WHERE t.id = held.id AND t.seat_number = held.seat_number
+        RETURNING t.id, held.seat_number
+    )
+    SELECT c.id AS booking_id, held.flight_id, cleared.seat_number, fi.capacity
+    FROM cancelled c
+    LEFT JOIN held ON held.booking_id = c.id
+    LEFT JOIN cleared ON cleared.id = held.id
+    LEFT JOIN flight_inventory fi ON fi.flight_id = held.flight_id
+""")
+
+
+class RateCounter:
+    """Event count over the last ``window`` seconds, in one-second buckets."""
+
+    def __init__(self, window: int = RATE_WINDOW_SECONDS):
+        self.window = window
+        self.total = 0
+        self._buckets: deque[list[int]] = deque()  # [second, count]
+        self._lock = threading.Lock()
+
+    def add(self, count: int = 1) -> None:
+        now = int(time.monotonic())
+        with self._lock:
+            self.total += count
+            if self._buckets and self._buckets[-1][0] == now:
+                self._buckets[-1][1] += count
+            else:
+                self._buckets.append([now, count])
+            self._trim(now)
+
+    def per_minute(self) -> float:
+        with self._lock:
+            self._trim(int(time.monotonic()))
+            return sum(count for _, count in self._buckets) * 60 / self.window
+
+    def _trim(self, now: int) -> None:
+        while self._buckets and self._buckets[0][0] <= now - self.window:
+            self._buckets.popleft()
+
+
+class BookingHolds:
+    """Seat holds of pending bookings and the sweeper that expires them.
+
+    A booking holds its seats until ``hold_expires_at``; :meth:`sweep`
+    cancels expired ones in batches of ``batch_size``. Each batch is two
+    statements in one transaction: the CTE above, then one
+    ``UPDATE flight_inventory ... FROM (VALUES ...)`` that gives back the
+    seat counts and clears the seat bits of every affected flight.
+    """
+
+    def __init__(self, ttl_seconds: int, batch_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.batch_size = batch_size
+        self._sweep_lock = threading.Lock()
+        self.held = RateCounter()
+        self.expired = RateCounter()
+        self.confirmed = RateCounter()
+        self.sweeps = 0
+        self.last_sweep_seconds = 0.0
+
+    def record_hold(self) -> None:
+        self.held.add()
+
+    def record_confirm(self) -> None:
+        self.confirmed.add()
+
+    def sweep(self) -> int:
+        """Cancel every expired hold, returning the number of bookings cancelled."""
+        with self._sweep_lock:
+            start = time.perf_counter()
+            total = 0
+            while True:
+                cancelled = self._expire_batch(datetime.now())
+                total += cancelled
+                if cancelled < self.batch_size:
+                    break
+            self.sweeps += 1
+            self.last_sweep_seconds = time.perf_counter() - start
+        if total:
+            self.expired.add(total)
+            logger.info("Expired %d booking holds", total)
+        return total
+
+    def _expire_batch(self, now: datetime) -> int:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                EXPIRE_BATCH_SQL, {"now": now, "batch_size": self.batch_size}
+            ).all()
+            cancelled = len({row.booking_id for row in rows})
+
+            # flight_id -> [tickets, capacity, seat indices]
+            released: dict[int, list] = defaultdict(lambda: [0, None, set()])
+            for _, flight_id, seat_number, capacity in rows:
+                if flight_id is None or capacity is None:
+                    continue
+                entry = released[flight_id]
+                entry[0] += 1
+                entry[1] = capacity
+                if seat_number:
+                    try:
+                        entry[2].add(seat_index(seat_number, capacity, settings.SEAT_COLUMNS))
+                    except ValueError:
+                        pass  # free-form seat number, never in the bitmap
+            if released:
+                self._release_inventory(conn, released)
+        return cancelled
+
+    @staticmethod
+    def _release_inventory(conn, released: dict[int, list]) -> None:
+        flight_ids = sorted(released)
+        # Lock in a fixed order so concurrent sweepers cannot deadlock
+        conn.execute(
+            text(
+                "SELECT flight_id FROM flight_inventory "
+                "WHERE flight_id = ANY(:ids) ORDER BY flight_id FOR UPDATE"
+            ),
+            {"ids": flight_ids},
+        )
+
+        values = ", ".join(
+            f"(CAST(:id_{i} AS INTEGER), CAST(:n_{i} AS INTEGER), CAST(:mask_{i} AS VARBIT))"
+            for i in range(len(flight_ids))
+        )
+        params = {}
+        for i, flight_id in enumerate(flight_ids):
+            count, capacity, seats = released[flight_id]
+            params[f"id_{i}"] = flight_id
+            params[f"n_{i}"] = count
+            params[f"mask_{i}"] = "".join(
+                "1" if seat in seats else "0" for seat in range(capacity)
+            )
+
+        conn.execute(
+            text(
+                f"""
+                UPDATE flight_inventory AS fi
+                SET sold = fi.sold - v.n,
+                    seat_bitmap = fi.seat_bitmap & ~v.mask
+                FROM (VALUES {values}) AS v(flight_id, n, mask)
+                WHERE fi.flight_id = v.flight_id
+                """
+            ),
+            params,
+        )
+
+    def stats(self) -> dict:
+        return {
+            "ttl_seconds": self.ttl_seconds,
+            "held": self.held.total,
+            "expired": self.expired.total,
+            "confirmed": self.confirmed.total,
+            "held_per_minute": round(self.held.per_minute(), 2),
+            "expired_per_minute": round(self.expired.per_minute(), 2),
+            "confirmed_per_minute": round(self.confirmed.per_minute(), 2),
+            "sweeps": self.sweeps,
+            "last_sweep_seconds": round(self.last_sweep_seconds, 6),
+        }
+
+
+booking_holds = BookingHolds(
+    ttl_seconds=settings.BOOKING_HOLD_TTL_SECONDS,
+    batch_size=settings.BOOKING_HOLD_SWEEP_BATCH_SIZE,
+)
@@ -0,0 +1,94 @@
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+# Upper bounds (seconds) of the checkout wait histogram buckets
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float("inf"))
+
+
+class PoolStats:
+    """Counters for one connection pool.
+
+    Counters are updated without a lock: an increment lost to a thread switch
+    is acceptable for sizing data and keeps checkout cheap.
+    """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.overflow_connects = 0
+        self.timeouts = 0
+        # Every checkout attempt, including timed-out and failed ones
+        self.waits = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.wait_buckets = [0] * len(WAIT_BUCKETS)
+
+    def record_wait(self, seconds: float) -> None:
+        self.waits += 1
+        self.wait_seconds_total += seconds
+        if seconds > self.wait_seconds_max:
+            self.wait_seconds_max = seconds
+        for i, bound in enumerate(WAIT_BUCKETS):
+            if seconds <= bound:
+                self.wait_buckets[i] += 1
+                break
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait to check out a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+        event.listen(self, "checkout", self._on_checkout)
+        event.listen(self, "checkin", self._on_checkin)
+        event.listen(self, "connect", self._on_connect)
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            self.stats.record_wait(time.perf_counter() - start)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        self.stats.checkouts += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        self.stats.checkins += 1
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        self.stats.connects += 1
+        if self.overflow() > 0:
+            self.stats.overflow_connects += 1
+
+    def snapshot(self) -> dict:
+        stats = self.stats
+        return {
+            "pool_size": self.size(),
+            "max_overflow": self._max_overflow,
+            "in_use": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "checkouts": stats.checkouts,
+            "checkins": stats.checkins,
+            "connects": stats.connects,
+            "overflow_connects": stats.overflow_connects,
+            "timeouts": stats.timeouts,
+            "waits": stats.waits,
+            "wait_seconds_total": round(stats.wait_seconds_total, 6),
+            "wait_seconds_max": round(stats.wait_seconds_max, 6),
+            "wait_seconds_avg": round(stats.wait_seconds_total / stats.waits, 6)
+            if stats.waits
+            else 0.0,
+            "wait_buckets": {
+                ("+Inf" if bound == float("inf") else str(bound)): count
+                for bound, count in zip(WAIT_BUCKETS, stats.wait_buckets)
+            },
+        }
@@ -0,0 +1,61 @@
+import itertools
+import logging
+import threading
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaSet:
+    """Round-robin over read replicas with temporary ejection of failing ones."""
+
+    def __init__(self, engines: list[Engine], eject_seconds: float):
+        self.engines = engines
+        self.eject_seconds = eject_seconds
+        self._ejected_until = {id(e): 0.0 for e in engines}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self.ejections = 0
+        for replica in engines:
+            event.listen(replica, "handle_error", self._on_error)
+
+    def choose(self) -> Engine | None:
+        """Next healthy replica, or None if there is none (use the primary)."""
+        if not self.engines:
+            return None
+        now = time.monotonic()
+        for _ in range(len(self.engines)):
+            replica = self.engines[next(self._counter) % len(self.engines)]
+            if self._ejected_until[id(replica)] <= now:
+                return replica
+        return None
+
+    def eject(self, replica: Engine) -> None:
+        with self._lock:
+            self._ejected_until[id(replica)] = time.monotonic() + self.eject_seconds
+            self.ejections += 1
+        logger.warning(
+            "Read replica %s ejected for %ss",
+            replica.url.render_as_string(hide_password=True),
+            self.eject_seconds,
+        )
+
+    def _on_error(self, context) -> None:
+        if context.is_disconnect or isinstance(
+            context.sqlalchemy_exception, exc.OperationalError
+        ):
+            self.eject(context.engine)
+
+    def stats(self) -> list[dict]:
+        now = time.monotonic()
+        return [
+            {
+                "url": replica.url.render_as_string(hide_password=True),
+                "healthy": self._ejected_until[id(replica)] <= now,
+                "pool": replica.pool.snapshot(),
+            }
+            for replica in self.engines
+        ]
@@ -0,0 +1,15 @@
+import json
+
+from fastapi import Request, Response
+
+
+def prebuilt_json_response(request: Request, content) -> Response:
+    """JSON response for content whose keys are already camelCase.
+
+    Skips FastAPI's response model validation and encoding, and tells
+    ``CaseConverterMiddleware`` not to parse and re-encode the body. Callers
+    must produce the same keys and values as the regular path; key order
+    may differ, since the ORM path follows the instance's attribute order.
+    """
+    request.state.camel_case_body = True
+    return Response(json.dumps(content).encode("utf-8"), media_type="application/json")
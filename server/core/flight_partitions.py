@@ -0,0 +1,80 @@
+import logging
+import time
+
+from sqlalchemy import text
+
+from config import settings
+from database import engine
+
+logger = logging.getLogger(__name__)
+
+# Creates the monthly partitions from the current month to ``months_ahead``
+# months later (see create_flight_partition() in the partitioning migration)
+ENSURE_PARTITIONS_SQL = text("""
+    SELECT created FROM (
+        SELECT create_flight_partition(CAST(month AS date)) AS created
+        FROM generate_series(
+            date_trunc('month', now()),
+            date_trunc('month', now()) + make_interval(months => :months_ahead),
+            interval '1 month'
+        ) AS month
+    ) AS partitions
+    WHERE created IS NOT NULL
+""")
+
+PARTITIONS_SQL = text("""
+    SELECT count(*) FROM pg_inherits WHERE inhparent = CAST('flights' AS regclass)
+""")
+
+
+class FlightPartitions:
+    """Keeps monthly ``flights`` partitions created ahead of the schedule.
+
+    Flights departing in a month without a partition land in
+    ``flights_default``, which every query has to scan; creating the month
+    later moves them out again, but under a lock on the whole table.
+    :meth:`ensure_ahead` runs periodically so that does not happen.
+    """
+
+    def __init__(self, months_ahead: int):
+        self.months_ahead = months_ahead
+        self.runs = 0
+        self.created = 0
+        self.partitions = 0
+        self.default_rows = 0
+        self.last_run_seconds = 0.0
+
+    def ensure_ahead(self) -> list[str]:
+        """Create missing partitions, returning the names of the new ones."""
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            created = conn.execute(
+                ENSURE_PARTITIONS_SQL, {"months_ahead": self.months_ahead}
+            ).scalars().all()
+            self.partitions = conn.execute(PARTITIONS_SQL).scalar_one()
+            self.default_rows = conn.execute(
+                text("SELECT count(*) FROM flights_default")
+            ).scalar_one()
+        self.runs += 1
+        self.created += len(created)
+        self.last_run_seconds = time.perf_counter() - start
+        if created:
+            logger.info("Created flight partitions %s", ", ".join(created))
+        if self.default_rows:
+            logger.warning(
+                "%d flights are in the default partition", self.default_rows
+            )
+        return created
+
+    def stats(self) -> dict:
+        return {
+            "months_ahead": self.months_ahead,
+            "partitions": self.partitions,
+            "default_rows": self.default_rows,
+            "created": self.created,
+            "runs": self.runs,
+            "last_run_seconds": round(self.last_run_seconds, 6),
+        }
+
+
+flight_partitions = FlightPartitions(months_ahead=settings.FLIGHT_PARTITION_MONTHS_AHEAD)
@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from config import settings
+from database import engine
+from models.idempotency_key import IdempotencyKey
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    status_code: int
+    headers: list[list[str]]
+    body: bytes
+
+
+@dataclass(frozen=True)
+class KeyState:
+    """What another request already did with a key."""
+
+    fingerprint: str
+    response: StoredResponse | None  # None while it is still running
+
+
+class IdempotencyStore:
+    """``idempotency_keys`` rows: claimed by the first request, then completed.
+
+    Blocking calls; the middleware runs them in a worker thread.
+    """
+
+    def __init__(self, ttl_seconds: int, lock_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self.lock_seconds = lock_seconds
+        self.executed = 0
+        self.replayed = 0
+        self.waited = 0
+        self.mismatched = 0
+
+    def claim(self, scope: str, key: str, fingerprint: str) -> bool:
+        """Take the key for this request; False if another request holds it.
+
+        An expired key, or one whose request has run longer than
+        ``lock_seconds`` (e.g. the worker died), can be taken over.
+        """
+        now = datetime.now()
+        stmt = pg_insert(IdempotencyKey).values(
+            scope=scope,
+            key=key,
+            fingerprint=fingerprint,
+            created_at=now,
+            expires_at=now + timedelta(seconds=self.ttl_seconds),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[IdempotencyKey.scope, IdempotencyKey.key],
+            set_={
+                "fingerprint": stmt.excluded.fingerprint,
+                "status_code": None,
+                "response_headers": None,
+                "response_body": None,
+                "created_at": stmt.excluded.created_at,
+                "expires_at": stmt.excluded.expires_at,
+            },
+            where=(IdempotencyKey.expires_at <= now)
+            | (
+                IdempotencyKey.status_code.is_(None)
+                & (IdempotencyKey.created_at <= now - timedelta(seconds=self.lock_seconds))
+            ),
+        ).returning(IdempotencyKey.key)
+        with engine.begin() as conn:
+            return conn.execute(stmt).first() is not None
+
+    def get(self, scope: str, key: str) -> KeyState | None:
+        with engine.connect() as conn:
+            row = conn.execute(
+                select(
+                    IdempotencyKey.fingerprint,
+                    IdempotencyKey.status_code,
+                    IdempotencyKey.response_headers,
+                    IdempotencyKey.response_body,
+                ).where(IdempotencyKey.scope == scope, IdempotencyKey.key == key)
+            ).first()
+        if row is None:
+            return None
+        response = None
+        if row.status_code is not None:
+            response = StoredResponse(row.status_code, row.response_headers, row.response_body)
+        return KeyState(row.fingerprint, response)
+
+    def complete(self, scope: str, key: str, response: StoredResponse) -> None:
+        with engine.begin() as conn:
+            conn.execute(
+                update(IdempotencyKey)
+                .where(IdempotencyKey.scope == scope, IdempotencyKey.key == key)
+                .values(
+                    status_code=response.status_code,
+                    response_headers=response.headers,
+                    response_body=response.body,
+                )
+            )
+
+    def release(self, scope: str, key: str) -> None:
+        """Forget a claimed key so the request can be retried (server errors)."""
+        with engine.begin() as conn:
+            conn.execute(
+                delete(IdempotencyKey).where(
+                    IdempotencyKey.scope == scope, IdempotencyKey.key == key
+                )
+            )
+
+    def prune(self) -> int:
+        with engine.begin() as conn:
+            return conn.execute(
+                delete(IdempotencyKey).where(IdempotencyKey.expires_at <= datetime.now())
+            ).rowcount
+
+    def stats(self) -> dict:
+        return {
+            "ttl_seconds": self.ttl_seconds,
+            "executed": self.executed,
+            "replayed": self.replayed,
+            "waited": self.waited,
+            "mismatched": self.mismatched,
+        }
+
+
+idempotency_store = IdempotencyStore(
+    ttl_seconds=settings.IDEMPOTENCY_TTL_SECONDS,
+    lock_seconds=settings.IDEMPOTENCY_LOCK_SECONDS,
+)
@@ -1,6 +1,56 @@
+import threading
+import uuid
 from datetime import datetime, timedelta
 import jwt
 from config import settings
+from core.jwt_keys import KeyRing, load_key_ring
+
+
+# Current key ring with the settings it was built from; replaced as a whole
+_key_ring: tuple[tuple, KeyRing] | None = None
+_key_ring_lock = threading.Lock()
+
+
+def _key_settings() -> tuple:
+    return (
+        settings.ALGORITHM,
+        settings.SECRET_KEY,
+        settings.JWT_PRIVATE_KEY_FILE,
+        settings.JWT_PUBLIC_KEYS_DIR,
+    )
+
+
+def get_key_ring() -> KeyRing:
+    global _key_ring
+    key_settings = _key_settings()
+    current = _key_ring
+    if current is None or current[0] != key_settings:
+        with _key_ring_lock:
+            current = _key_ring
+            if current is None or current[0] != key_settings:
+                current = _key_ring = (key_settings, load_key_ring(*key_settings))
+    return current[1]
+
+
+def reload_key_ring() -> KeyRing:
+    """Re-read key files, e.g. after a new verification key was deployed.
+
+    Runs periodically (``KEY_RING_RELOAD_SECONDS``). The files are read once
+    and the new ring replaces the current one only once it is built, so a
+    half-written or broken key file raises here and the current keys stay
+    in use.
+    """
+    global _key_ring
+    key_settings = _key_settings()
+    key_ring = load_key_ring(*key_settings)
+    with _key_ring_lock:
+        _key_ring = (key_settings, key_ring)
+    return key_ring
+
+
+def signing_key_fingerprint() -> str:
+    """Identify the current signing/verification keys without exposing them."""
+    return get_key_ring().fingerprint
 
 
 def create_access_token(data: dict, expires_delta: timedelta = None):
@@ -9,12 +59,33 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
         expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    # Unique token id so the token can be revoked before it expires
+    to_encode.setdefault("jti", uuid.uuid4().hex)
+
+    key_ring = get_key_ring()
+    headers = {"kid": key_ring.signing_kid} if key_ring.is_asymmetric else None
+    return jwt.encode(
+        to_encode, key_ring.signing_key, algorithm=key_ring.algorithm, headers=headers
+    )
 
 
 def decode_access_token(token: str):
+    key_ring = get_key_ring()
     try:
-        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        if key_ring.is_asymmetric:
+            # Pick the verification key by kid; the algorithm is bound to the key
+            kid = jwt.get_unverified_header(token).get("kid")
+            verification_key = key_ring.verification_keys.get(kid)
+            if verification_key is None:
+                return None
+            return jwt.decode(
+                token,
+                verification_key.key,
+                algorithms=[verification_key.algorithm],
+            )
+        return jwt.decode(
+            token, key_ring.signing_key, algorithms=[key_ring.algorithm]
+        )
     except jwt.ExpiredSignatureError:
         # Token has expired
         return None
@@ -0,0 +1,119 @@
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+
+
+@dataclass(frozen=True)
+class VerificationKey:
+    kid: str
+    algorithm: str
+    key: Any  # public key object
+
+
+@dataclass(frozen=True)
+class KeyRing:
+    """Signing key plus every key currently accepted for verification.
+
+    In symmetric mode (no key files configured) tokens are signed with
+    ``SECRET_KEY`` and carry no ``kid``. In asymmetric mode tokens are signed
+    with the private key and its ``kid``, and verified with whichever public
+    key matches the token's ``kid``, so old keys can stay valid while a new
+    one is rolled out.
+    """
+
+    algorithm: str
+    signing_key: Any
+    signing_kid: str | None = None
+    verification_keys: dict[str, VerificationKey] = field(default_factory=dict)
+    fingerprint: str = ""
+
+    @property
+    def is_asymmetric(self) -> bool:
+        return self.signing_kid is not None
+
+    def jwks(self) -> dict:
+        """Public verification keys in JWK Set format."""
+        keys = []
+        for vk in self.verification_keys.values():
+            if vk.algorithm == "EdDSA":
+                jwk = OKPAlgorithm.to_jwk(vk.key, as_dict=True)
+            else:
+                jwk = RSAAlgorithm.to_jwk(vk.key, as_dict=True)
+            # "use" and "key_ops" should not be combined (RFC 7517, 4.3)
+            jwk.pop("key_ops", None)
+            jwk.update({"kid": vk.kid, "alg": vk.algorithm, "use": "sig"})
+            keys.append(jwk)
+        return {"keys": keys}
+
+
+def _algorithm_for(public_key) -> str:
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        return "EdDSA"
+    if isinstance(public_key, rsa.RSAPublicKey):
+        return "RS256"
+    raise ValueError(f"Unsupported JWT key type: {type(public_key).__name__}")
+
+
+def _public_bytes(public_key) -> bytes:
+    return public_key.public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+
+
+def _load_public_key(path: Path):
+    data = path.read_bytes()
+    try:
+        return serialization.load_pem_public_key(data)
+    except ValueError:
+        # Accept private keys in the directory as well
+        return serialization.load_pem_private_key(data, password=None).public_key()
+
+
+def load_key_ring(
+    algorithm: str,
+    secret_key: str,
+    private_key_file: str | None,
+    public_keys_dir: str | None,
+) -> KeyRing:
+    """Build the key ring from settings.
+
+    The kid of every key is its file name without extension, e.g.
+    ``keys/2025-07.pem`` has kid ``2025-07``.
+    """
+    if not private_key_file:
+        fingerprint = hashlib.sha256(f"{algorithm}:{secret_key}".encode()).hexdigest()
+        return KeyRing(algorithm=algorithm, signing_key=secret_key, fingerprint=fingerprint)
+
+    private_path = Path(private_key_file)
+    private_key = serialization.load_pem_private_key(
+        private_path.read_bytes(), password=None
+    )
+    signing_kid = private_path.stem
+    public_keys = {signing_kid: private_key.public_key()}
+
+    if public_keys_dir:
+        for path in sorted(Path(public_keys_dir).glob("*.pem")):
+            public_keys.setdefault(path.stem, _load_public_key(path))
+
+    verification_keys = {
+        kid: VerificationKey(kid=kid, algorithm=_algorithm_for(key), key=key)
+        for kid, key in public_keys.items()
+    }
+
+    digest = hashlib.sha256(signing_kid.encode())
+    for kid, vk in sorted(verification_keys.items()):
+        digest.update(kid.encode())
+        digest.update(_public_bytes(vk.key))
+
+    return KeyRing(
+        algorithm=verification_keys[signing_kid].algorithm,
+        signing_key=private_key,
+        signing_kid=signing_kid,
+        verification_keys=verification_keys,
+        fingerprint=digest.hexdigest(),
+    )
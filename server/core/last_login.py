@@ -0,0 +1,119 @@
+import logging
+import threading
+from datetime import datetime
+
+from sqlalchemy import text
+
+from config import settings
+from database import engine
+
+logger = logging.getLogger(__name__)
+
+# Number of (id, timestamp) pairs sent per UPDATE statement
+FLUSH_CHUNK_SIZE = 1000
+
+
+class LastLoginBuffer:
+    """Write-behind buffer for ``users.last_login_at``.
+
+    Logins only record the timestamp in memory; repeat logins of the same user
+    are coalesced to the latest one. Pending timestamps are written by
+    :meth:`flush` as one ``UPDATE ... FROM (VALUES ...)`` per chunk,
+    periodically and on shutdown. Logins never wait for a flush: when the
+    buffer holds ``max_size`` users, the oldest pending entry is dropped.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._pending: dict[int, datetime] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self.recorded = 0
+        self.coalesced = 0
+        self.flushed = 0
+        self.dropped = 0
+
+    def record(self, user_id: int, logged_in_at: datetime) -> None:
+        with self._lock:
+            self.recorded += 1
+            previous = self._pending.get(user_id)
+            if previous is not None:
+                self.coalesced += 1
+                if previous >= logged_in_at:
+                    return
+            elif len(self._pending) >= self.max_size:
+                # Dicts keep insertion order: the first key is the oldest entry
+                del self._pending[next(iter(self._pending))]
+                self.dropped += 1
+            self._pending[user_id] = logged_in_at
+
+    def flush(self) -> int:
+        """Write all pending timestamps, returning the number of users updated."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+
+            try:
+                items = list(batch.items())
+                with engine.begin() as conn:
+                    for start in range(0, len(items), FLUSH_CHUNK_SIZE):
+                        self._write_chunk(conn, items[start:start + FLUSH_CHUNK_SIZE])
+            except Exception:
+                logger.exception("Could not flush %d last_login_at updates", len(batch))
+                self._requeue(batch)
+                return 0
+
+            self.flushed += len(batch)
+            return len(batch)
+
+    @staticmethod
+    def _write_chunk(conn, items: list[tuple[int, datetime]]) -> None:
+        values = ", ".join(
+            f"(CAST(:id_{i} AS INTEGER), CAST(:ts_{i} AS TIMESTAMP))"
+            for i in range(len(items))
+        )
+        params = {}
+        for i, (user_id, logged_in_at) in enumerate(items):
+            params[f"id_{i}"] = user_id
+            params[f"ts_{i}"] = logged_in_at
+
+        conn.execute(
+            text(
+                f"""
+                UPDATE users AS u
+                SET last_login_at = v.ts
+                FROM (VALUES {values}) AS v(id, ts)
+                WHERE u.id = v.id
+                  AND (u.last_login_at IS NULL OR u.last_login_at < v.ts)
+                """
+            ),
+            params,
+        )
+
+    def _requeue(self, batch: dict[int, datetime]) -> None:
+        """Put a failed batch back without growing past ``max_size``."""
+        with self._lock:
+            for user_id, logged_in_at in batch.items():
+                current = self._pending.get(user_id)
+                if current is not None:
+                    if logged_in_at > current:
+                        self._pending[user_id] = logged_in_at
+                elif len(self._pending) < self.max_size:
+                    self._pending[user_id] = logged_in_at
+                else:
+                    self.dropped += 1
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "max_size": self.max_size,
+            "recorded": self.recorded,
+            "coalesced": self.coalesced,
+            "flushed": self.flushed,
+            "dropped": self.dropped,
+        }
+
+
+last_login_buffer = LastLoginBuffer(max_size=settings.LAST_LOGIN_BUFFER_MAX_SIZE)
@@ -0,0 +1,59 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+
+
+class SessionUsageStats:
+    """How many requests actually needed a database connection.
+
+    Updated without a lock, like the pool counters.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.sessions_created = 0
+        self.requests_with_checkout = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": self.requests,
+            "sessions_created": self.sessions_created,
+            "requests_with_checkout": self.requests_with_checkout,
+            "requests_without_checkout": self.requests - self.requests_with_checkout,
+        }
+
+
+class LazySession:
+    """Stands in for a ``Session`` and creates it on first attribute access.
+
+    Requests that are answered from a cache or rejected before touching the
+    database never build a session. The real session still only checks out
+    a connection when it first executes something; ``after_begin`` records
+    that in ``info["checked_out"]``.
+    """
+
+    def __init__(self, factory: sessionmaker, stats: SessionUsageStats, info: dict | None = None):
+        self._factory = factory
+        self._stats = stats
+        self._info = info or {}
+        self._session: Session | None = None
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the proxy itself
+        if self._session is None:
+            self._session = self._factory(info=dict(self._info))
+            self._stats.sessions_created += 1
+        return getattr(self._session, name)
+
+    def close(self) -> None:
+        self._stats.requests += 1
+        if self._session is None:
+            return
+        if self._session.info.get("checked_out"):
+            self._stats.requests_with_checkout += 1
+        self._session.close()
+
+
+def track_checkouts(factory: sessionmaker) -> None:
+    @event.listens_for(factory, "after_begin")
+    def _after_begin(session, transaction, connection):
+        session.info["checked_out"] = True
@@ -0,0 +1,156 @@
+import bisect
+
+from anyio import to_thread
+
+from core.access_log import access_log
+from core.db_pool import WAIT_BUCKETS
+from core.principal_cache import principal_cache
+from core.token_cache import token_cache
+from database import engine, replicas
+
+# Upper bounds (seconds) of the request duration histogram buckets
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Snapshot keys of InstrumentedQueuePool exported as gauges and counters
+POOL_GAUGES = ("pool_size", "max_overflow", "in_use", "idle", "overflow")
+POOL_COUNTERS = ("checkouts", "checkins", "connects", "overflow_connects", "timeouts")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items())
+
+
+def _bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+class _Series:
+    __slots__ = ("buckets", "count", "sum")
+
+    def __init__(self):
+        self.buckets = [0] * (len(REQUEST_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+
+class RequestMetrics:
+    """Request duration histograms per (method, route template, status).
+
+    Only touched from the event loop thread (the middleware records there
+    and ``/metrics`` is an async endpoint), so recording takes no lock: it
+    is one dict lookup, a bisect and three increments. Buckets are stored
+    per bucket and made cumulative when rendered.
+    """
+
+    def __init__(self):
+        self.in_flight = 0
+        self._series: dict[tuple[str, str, int], _Series] = {}
+
+    def observe(self, method: str, route: str, status: int, seconds: float) -> None:
+        key = (method, route, status)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series()
+        series.buckets[bisect.bisect_left(REQUEST_BUCKETS, seconds)] += 1
+        series.count += 1
+        series.sum += seconds
+
+    def render(self, lines: list[str]) -> None:
+        lines.append("# HELP http_requests_in_flight Requests being handled right now.")
+        lines.append("# TYPE http_requests_in_flight gauge")
+        lines.append(f"http_requests_in_flight {self.in_flight}")
+
+        lines.append("# HELP http_request_duration_seconds Request duration by route template and status.")
+        lines.append("# TYPE http_request_duration_seconds histogram")
+        for (method, route, status), series in sorted(self._series.items()):
+            labels = _labels(method=method, route=route, status=status)
+            cumulative = 0
+            for bound, count in zip((*REQUEST_BUCKETS, float("inf")), series.buckets):
+                cumulative += count
+                lines.append(
+                    f'http_request_duration_seconds_bucket{{{labels},le="{_bound(bound)}"}} {cumulative}'
+                )
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {series.sum:.6f}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {series.count}")
+
+
+def _render_pools(lines: list[str]) -> None:
+    pools = [("primary", engine.pool)] + [
+        (f"replica{i}", replica.pool) for i, replica in enumerate(replicas.engines)
+    ]
+    snapshots = [(name, pool, pool.snapshot()) for name, pool in pools]
+
+    for key in POOL_GAUGES:
+        lines.append(f"# TYPE db_pool_{key} gauge")
+        for name, _, snapshot in snapshots:
+            lines.append(f"db_pool_{key}{{{_labels(pool=name)}}} {snapshot[key]}")
+    for key in POOL_COUNTERS:
+        lines.append(f"# TYPE db_pool_{key}_total counter")
+        for name, _, snapshot in snapshots:
+            lines.append(f"db_pool_{key}_total{{{_labels(pool=name)}}} {snapshot[key]}")
+
+    lines.append("# HELP db_pool_checkout_wait_seconds Time spent waiting to check out a connection.")
+    lines.append("# TYPE db_pool_checkout_wait_seconds histogram")
+    for name, pool, _ in snapshots:
+        stats = pool.stats
+        cumulative = 0
+        for bound, count in zip(WAIT_BUCKETS, stats.wait_buckets):
+            cumulative += count
+            lines.append(
+                f'db_pool_checkout_wait_seconds_bucket{{{_labels(pool=name)},le="{_bound(bound)}"}} {cumulative}'
+            )
+        lines.append(
+            f"db_pool_checkout_wait_seconds_sum{{{_labels(pool=name)}}} {stats.wait_seconds_total:.6f}"
+        )
+        lines.append(f"db_pool_checkout_wait_seconds_count{{{_labels(pool=name)}}} {stats.waits}")
+
+
+def _render_caches(lines: list[str]) -> None:
+    caches = [("token", token_cache.stats()), ("principal", principal_cache.stats())]
+    for key, kind in (("hits", "counter"), ("misses", "counter"), ("evictions", "counter")):
+        lines.append(f"# TYPE cache_{key}_total {kind}")
+        for name, stats in caches:
+            lines.append(f"cache_{key}_total{{{_labels(cache=name)}}} {stats[key]}")
+    for key in ("size", "max_size", "hit_ratio"):
+        lines.append(f"# TYPE cache_{key} gauge")
+        for name, stats in caches:
+            lines.append(f"cache_{key}{{{_labels(cache=name)}}} {stats[key]}")
+
+
+def _render_threadpool(lines: list[str]) -> None:
+    # The limiter run_in_threadpool uses for sync endpoints and dependencies
+    stats = to_thread.current_default_thread_limiter().statistics()
+    lines.append("# HELP threadpool_tokens Worker threads the default anyio limiter allows.")
+    lines.append("# TYPE threadpool_tokens gauge")
+    lines.append(f"threadpool_tokens {stats.total_tokens}")
+    lines.append("# HELP threadpool_busy Worker threads in use.")
+    lines.append("# TYPE threadpool_busy gauge")
+    lines.append(f"threadpool_busy {stats.borrowed_tokens}")
+    lines.append("# HELP threadpool_queue_depth Tasks waiting for a worker thread.")
+    lines.append("# TYPE threadpool_queue_depth gauge")
+    lines.append(f"threadpool_queue_depth {stats.tasks_waiting}")
+
+
+def render_metrics() -> str:
+    """All metrics of this process in the Prometheus text exposition format.
+
+    Must be called from the event loop: the threadpool limiter belongs to it.
+    """
+    lines: list[str] = []
+    request_metrics.render(lines)
+    _render_pools(lines)
+    _render_caches(lines)
+    _render_threadpool(lines)
+    lines.append("# HELP access_log_dropped_total Access log entries dropped on a full queue.")
+    lines.append("# TYPE access_log_dropped_total counter")
+    lines.append(f"access_log_dropped_total {access_log.dropped}")
+    return "\n".join(lines) + "\n"
+
+
+request_metrics = RequestMetrics()
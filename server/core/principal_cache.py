@@ -0,0 +1,83 @@
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from config import settings
+from core.cache import LRUCache
+from models.user import User
+
+_PENDING_INVALIDATIONS = "principal_cache_invalidations"
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Immutable snapshot of the authenticated user, detached from any session."""
+
+    id: int
+    email: str
+    full_name: str | None
+    phone_number: str
+    is_active: bool
+    is_verified: bool
+
+
+class PrincipalCache:
+    """Short-TTL cache of active principals keyed by email (the token ``sub``).
+
+    Invalidation is per process: ORM updates/deletes of ``User`` rows evict the
+    affected emails once their transaction commits. Other workers only see
+    the change after ``PRINCIPAL_CACHE_TTL_SECONDS``.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._cache = LRUCache(max_size)
+
+    def get(self, email: str) -> Principal | None:
+        return self._cache.get(email)
+
+    def set(self, principal: Principal) -> None:
+        if principal.is_active:
+            self._cache.set(
+                principal.email, principal, time.time() + self.ttl_seconds
+            )
+
+    def invalidate(self, email: str) -> None:
+        self._cache.pop(email)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _collect_changed_user(mapper, connection, target):
+    session = object_session(target)
+    if session is None:
+        return
+    emails = session.info.setdefault(_PENDING_INVALIDATIONS, set())
+    emails.add(target.email)
+    # Also evict the previous email if it was changed in this flush
+    emails.update(inspect(target).attrs.email.history.deleted or ())
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session):
+    for email in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        principal_cache.invalidate(email)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session):
+    session.info.pop(_PENDING_INVALIDATIONS, None)
@@ -0,0 +1,147 @@
+import asyncio
+import cProfile
+import functools
+import os
+import pstats
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Callable
+
+from fastapi.routing import APIRoute
+
+from config import settings
+
+
+class RequestProfile:
+    """cProfile data of one profiled request.
+
+    ``main`` profiles the event loop thread (middlewares, async endpoints);
+    every sync endpoint call made in the threadpool adds its own profile,
+    since cProfile only sees the thread it was enabled in.
+    """
+
+    def __init__(self, profile_id: str):
+        self.id = profile_id
+        self.main = cProfile.Profile()
+        self.workers: list[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def add_worker(self, profile: cProfile.Profile) -> None:
+        with self._lock:
+            self.workers.append(profile)
+
+
+_current_profile: ContextVar[RequestProfile | None] = ContextVar(
+    "request_profile", default=None
+)
+
+
+def start_request_profile(profile_id: str) -> RequestProfile:
+    """Begin profiling the current request context; sync endpoints join in."""
+    profile = RequestProfile(profile_id)
+    _current_profile.set(profile)
+    return profile
+
+
+def _profile_call(func: Callable, *args, **kwargs):
+    request_profile = _current_profile.get()
+    if request_profile is None:
+        return func(*args, **kwargs)
+    profile = cProfile.Profile()
+    try:
+        return profile.runcall(func, *args, **kwargs)
+    finally:
+        request_profile.add_worker(profile)
+
+
+class ProfilingRoute(APIRoute):
+    """APIRoute whose sync endpoint is profiled with the request that runs it.
+
+    Sync endpoints run in the threadpool, out of reach of the profiler the
+    middleware enables on the event loop thread. With profiling disabled the
+    endpoint is left untouched.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        call = self.dependant.call
+        if settings.PROFILING_ENABLED and call and not asyncio.iscoroutinefunction(call):
+            self.dependant.call = functools.partial(_profile_call, call)
+
+
+class ProfileStore:
+    """Keeps the top-N functions of the last profiled requests.
+
+    With a ``directory`` each profile is also written there in pstats format
+    (``python -m pstats <file>`` or snakeviz can open it).
+    """
+
+    def __init__(self, max_profiles: int, top_n: int, directory: str = ""):
+        self.top_n = top_n
+        self.directory = directory
+        self._profiles: deque[dict] = deque(maxlen=max_profiles)
+        self._lock = threading.Lock()
+        self.recorded = 0
+
+    def record(self, request_profile: RequestProfile, meta: dict) -> dict:
+        stats = pstats.Stats(request_profile.main)
+        for worker in request_profile.workers:
+            stats.add(worker)
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+        entry = {
+            "id": request_profile.id,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            **meta,
+            "total_calls": stats.total_calls,
+            "functions": [
+                {
+                    "function": pstats.func_std_string(func),
+                    "calls": calls,
+                    "primitive_calls": primitive_calls,
+                    "total_seconds": round(total_time, 6),
+                    "cumulative_seconds": round(cumulative_time, 6),
+                }
+                for func, (primitive_calls, calls, total_time, cumulative_time, _) in rows[
+                    : self.top_n
+                ]
+            ],
+        }
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            filename = f"{time.strftime('%Y%m%d-%H%M%S')}-{request_profile.id}.prof"
+            stats.dump_stats(os.path.join(self.directory, filename))
+        with self._lock:
+            self._profiles.append(entry)
+            self.recorded += 1
+        return entry
+
+    def recent(self) -> list[dict]:
+        """Stored profiles, newest first, without their function rows."""
+        with self._lock:
+            entries = list(self._profiles)
+        return [
+            {key: value for key, value in entry.items() if key != "functions"}
+            for entry in reversed(entries)
+        ]
+
+    def get(self, profile_id: str) -> dict | None:
+        with self._lock:
+            return next((entry for entry in self._profiles if entry["id"] == profile_id), None)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": settings.PROFILING_ENABLED,
+            "sample_rate": settings.PROFILE_SAMPLE_RATE,
+            "stored": len(self._profiles),
+            "recorded": self.recorded,
+        }
+
+
+profile_store = ProfileStore(
+    max_profiles=settings.PROFILE_MAX_STORED,
+    top_n=settings.PROFILE_TOP_N,
+    directory=settings.PROFILE_DIRECTORY,
+)
@@ -0,0 +1,136 @@
+import logging
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from config import settings
+
+slow_query_logger = logging.getLogger("sql.slow")
+
+
+@dataclass(eq=False)
+class QueryStats:
+    """Queries executed while handling one request (or inside ``count_queries``)."""
+
+    path: str | None = None
+    count: int = 0
+    db_time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: str | None = None
+    statements: list[str] | None = None  # only collected by count_queries()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.db_time += elapsed
+        if elapsed > self.slowest_time:
+            self.slowest_time = elapsed
+            self.slowest_statement = statement
+        if self.statements is not None:
+            self.statements.append(statement)
+
+
+_request_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+# count_queries() collectors; queries run in threadpool workers, so the list
+# and the collectors' counters are only touched under the lock
+_collectors: list[QueryStats] = []
+_collectors_lock = threading.Lock()
+
+
+def start_request_stats(path: str | None = None) -> QueryStats:
+    """Begin collecting stats for the current request context."""
+    stats = QueryStats(path=path)
+    _request_stats.set(stats)
+    return stats
+
+
+def current_request_stats() -> QueryStats | None:
+    return _request_stats.get()
+
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"%\(\w+\)s|%s|\?|(?<!:):\w+")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(statement: str) -> str:
+    """Strip literals and bind parameters so equal query shapes group together."""
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _BIND_PARAM.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER_LIST.sub("?, ...", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+# The start time lives on the execution context, not the pooled connection:
+# after_cursor_execute does not run when the statement raises, and nothing
+# may be left behind for the connection's next query
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start_time = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_start_time
+
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    if _collectors:
+        with _collectors_lock:
+            for collector in _collectors:
+                collector.record(statement, elapsed)
+
+    if (
+        elapsed * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS
+        and random.random() < settings.SLOW_QUERY_LOG_SAMPLE_RATE
+    ):
+        slow_query_logger.warning(
+            "slow query %.1fms path=%s sql=%s",
+            elapsed * 1000,
+            stats.path if stats else None,
+            normalize_sql(statement),
+        )
+
+
+@contextmanager
+def count_queries():
+    """Count every query executed in this process inside the block.
+
+    Works with ``TestClient``, where the app runs in another thread::
+
+        with count_queries() as stats:
+            client.get("/flights")
+        assert stats.count <= 1
+    """
+    stats = QueryStats(statements=[])
+    with _collectors_lock:
+        _collectors.append(stats)
+    try:
+        yield stats
+    finally:
+        with _collectors_lock:
+            _collectors.remove(stats)
+
+
+@contextmanager
+def assert_max_queries(max_queries: int):
+    """Fail if the block issues more than ``max_queries`` queries."""
+    with count_queries() as stats:
+        yield stats
+    if stats.count > max_queries:
+        executed = "\n".join(normalize_sql(s) for s in stats.statements)
+        raise AssertionError(
+            f"Expected at most {max_queries} queries, got {stats.count}:\n{executed}"
+        )
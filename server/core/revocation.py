@@ -0,0 +1,93 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from database import engine
+from models.revoked_token import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+# Rows committed shortly after a sync can carry an earlier revoked_at (it is
+# the transaction start time), so every sync re-reads this window.
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+class RevocationList:
+    """In-process mirror of ``revoked_tokens`` keyed by ``jti``.
+
+    Lookups are a dict membership test, so the common not-revoked case never
+    touches the database. The mirror is synced incrementally by ``revoked_at``
+    and entries are dropped once the revoked token has expired anyway, which
+    keeps memory bounded by the number of live revoked tokens.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, float] = {}  # jti -> exp (unix timestamp)
+        self._lock = threading.Lock()
+        self._watermark: datetime | None = None
+        self.syncs = 0
+
+    def is_revoked(self, jti: str | None) -> bool:
+        return jti is not None and jti in self._entries
+
+    def revoke(self, db: Session, jti: str, exp: float) -> None:
+        """Persist a revocation and apply it to this process immediately."""
+        db.execute(
+            pg_insert(RevokedToken)
+            .values(jti=jti, expires_at=datetime.fromtimestamp(exp))
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+        )
+        db.commit()
+        with self._lock:
+            self._entries[jti] = exp
+
+    def sync(self) -> int:
+        """Load revocations made since the last sync (by any process)."""
+        query = select(
+            RevokedToken.jti, RevokedToken.expires_at, RevokedToken.revoked_at
+        ).where(RevokedToken.expires_at > datetime.now())
+        if self._watermark is not None:
+            query = query.where(RevokedToken.revoked_at >= self._watermark - SYNC_OVERLAP)
+
+        with engine.connect() as conn:
+            rows = conn.execute(query).all()
+
+        with self._lock:
+            for jti, expires_at, revoked_at in rows:
+                self._entries[jti] = expires_at.timestamp()
+                if self._watermark is None or revoked_at > self._watermark:
+                    self._watermark = revoked_at
+            self._prune_expired()
+        self.syncs += 1
+        return len(rows)
+
+    def prune(self) -> int:
+        """Delete expired revocations from the table and from memory."""
+        with engine.begin() as conn:
+            deleted = conn.execute(
+                delete(RevokedToken).where(RevokedToken.expires_at <= datetime.now())
+            ).rowcount
+        with self._lock:
+            self._prune_expired()
+        return deleted
+
+    def _prune_expired(self) -> None:
+        now = time.time()
+        expired = [jti for jti, exp in self._entries.items() if exp <= now]
+        for jti in expired:
+            del self._entries[jti]
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "syncs": self.syncs,
+            "watermark": self._watermark.isoformat() if self._watermark else None,
+        }
+
+
+revocation_list = RevocationList()
@@ -0,0 +1,48 @@
+"""Seat layout and bitmap helpers.
+
+Seats are numbered row by row: with columns ``ABCDEF`` seat index 0 is
+``A1``, 5 is ``F1``, 6 is ``A2``. A flight's seat map is a bit string of
+``capacity`` bits (``1`` = taken) stored as ``BIT VARYING`` in
+``flight_inventory.seat_bitmap``; the last row may be partial.
+"""
+
+import base64
+import re
+
+_SEAT_LABEL = re.compile(r"^([A-Z])([1-9][0-9]*)$")
+
+
+def seat_label(index: int, columns: str) -> str:
+    row, column = divmod(index, len(columns))
+    return f"{columns[column]}{row + 1}"
+
+
+def seat_index(label: str, capacity: int, columns: str) -> int:
+    """Bit index of a seat label such as ``A23``.
+
+    Raises ``ValueError`` if the label is malformed or outside the plane.
+    """
+    match = _SEAT_LABEL.match(label.strip().upper())
+    if not match or match.group(1) not in columns:
+        raise ValueError(f"Invalid seat number: {label}")
+    index = (int(match.group(2)) - 1) * len(columns) + columns.index(match.group(1))
+    if index >= capacity:
+        raise ValueError(f"Invalid seat number: {label}")
+    return index
+
+
+def row_count(capacity: int, columns: str) -> int:
+    return -(-capacity // len(columns))
+
+
+def pack_bits(bits: str) -> bytes:
+    """Pack a ``'0'``/``'1'`` string into bytes, first seat in the high bit."""
+    if not bits:
+        return b""
+    padded = bits.ljust(-(-len(bits) // 8) * 8, "0")
+    return int(padded, 2).to_bytes(len(padded) // 8, "big")
+
+
+def encode_bitmap(bits: str) -> str:
+    """Base64 of the packed bitmap: 40 characters for a 240-seat plane."""
+    return base64.b64encode(pack_bits(bits)).decode("ascii")
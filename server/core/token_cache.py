@@ -0,0 +1,52 @@
+import hashlib
+from types import MappingProxyType
+from typing import Mapping
+
+from config import settings
+from core.cache import LRUCache
+from core.jwt_helper import decode_access_token, signing_key_fingerprint
+
+
+class VerifiedTokenCache:
+    """Caches the claims of successfully verified access tokens.
+
+    Entries are keyed by a SHA-256 digest of the raw token (the token itself is
+    never kept) and expire at the token's own ``exp``. The whole cache is
+    dropped as soon as the signing key fingerprint changes, so rotating
+    ``SECRET_KEY`` invalidates every previously verified token.
+    """
+
+    def __init__(self, max_size: int):
+        self._cache = LRUCache(max_size)
+        self._fingerprint: str | None = None
+
+    def decode(self, token: str) -> Mapping | None:
+        """Return read-only verified claims, or None if the token is invalid."""
+        fingerprint = signing_key_fingerprint()
+        if fingerprint != self._fingerprint:
+            self._cache.clear()
+            self._fingerprint = fingerprint
+
+        key = hashlib.sha256(token.encode()).digest()
+        claims = self._cache.get(key)
+        if claims is not None:
+            return claims
+
+        payload = decode_access_token(token)
+        if payload is None:
+            return None
+
+        claims = MappingProxyType(payload)
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            self._cache.set(key, claims, float(exp))
+        return claims
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+token_cache = VerifiedTokenCache(max_size=settings.TOKEN_CACHE_MAX_SIZE)
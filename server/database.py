@@ -1,13 +1,83 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from fastapi import Request
+from sqlalchemy import create_engine, exc
+from sqlalchemy.orm import Session, sessionmaker
 from config import settings
+from core.db_pool import InstrumentedQueuePool
+from core.db_routing import ReplicaSet
+from core.lazy_session import LazySession, SessionUsageStats, track_checkouts
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def _create_engine(url: str):
+    return create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_use_lifo=settings.DB_POOL_USE_LIFO,
+    )
 
-def get_db():
-    db = SessionLocal()
+
+engine = _create_engine(settings.DATABASE_URL)
+replicas = ReplicaSet(
+    [_create_engine(url) for url in settings.DATABASE_REPLICA_URLS],
+    eject_seconds=settings.REPLICA_EJECT_SECONDS,
+)
+
+
+class RoutingSession(Session):
+    """Session that sends reads of read-only requests to a replica.
+
+    ``info["read_only"]`` is set by ``get_db`` for safe requests. The chosen
+    replica is kept for the rest of the session so one request sees one
+    snapshot. Flushes always go to the primary.
+
+    A statement that fails on the replica with an ``OperationalError`` (the
+    replica went away mid-request; ``ReplicaSet`` ejects it) is run once
+    more on the primary, and the rest of the session stays there.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.info.get("read_only") and not self._flushing:
+            replica = self.info.get("replica")
+            if replica is None:
+                replica = self.info["replica"] = replicas.choose() or engine
+            return replica
+        return engine
+
+    # execute(), scalars(), scalar(), get() and lazy loads all run through
+    # _execute_internal, so this is the one place to catch replica failures
+    def _execute_internal(self, *args, **kwargs):
+        try:
+            return super()._execute_internal(*args, **kwargs)
+        except exc.OperationalError:
+            replica = self.info.get("replica")
+            if replica is None or replica is engine:
+                raise
+            self.rollback()
+            self.info["replica"] = engine
+            return super()._execute_internal(*args, **kwargs)
+
+
+SessionLocal = sessionmaker(
+    class_=RoutingSession, autocommit=False, autoflush=False, bind=engine
+)
+
+
+track_checkouts(SessionLocal)
+session_usage = SessionUsageStats()
+
+
+def get_db(request: Request):
+    info = {}
+    if request.method in ("GET", "HEAD") and not getattr(
+        request.state, "read_primary", False
+    ):
+        info["read_only"] = True
+    # The session is only created when a dependency or route first uses it
+    db = LazySession(SessionLocal, session_usage, info)
     try:
         yield db
     finally:
@@ -1,14 +1,78 @@
-from fastapi import Depends, HTTPException, status
+from typing import Mapping
+
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from core.jwt_helper import decode_access_token
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.principal_cache import Principal, principal_cache
+from core.revocation import revocation_list
+from core.token_cache import token_cache
+from database import get_db
+from models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
-def get_current_user(token: str = Depends(oauth2_scheme)):
-    payload = decode_access_token(token)
-    if not payload or "sub" not in payload:
+def valid_token_claims(token: str) -> Mapping | None:
+    """Claims of an access token that is valid, has a subject and is not revoked."""
+    payload = token_cache.decode(token)
+    if (
+        not payload
+        or "sub" not in payload
+        or revocation_list.is_revoked(payload.get("jti"))
+    ):
+        return None
+    return payload
+
+
+def get_current_token_claims(token: str = Depends(oauth2_scheme)) -> Mapping:
+    payload = valid_token_claims(token)
+    if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token"
         )
-    return payload["sub"] 
\ No newline at end of file
+    return payload
+
+
+def get_current_user(payload: Mapping = Depends(get_current_token_claims)):
+    return payload["sub"]
+
+
+def get_current_principal(
+    request: Request,
+    email: str = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> Principal:
+    """Resolve the authenticated user once per request.
+
+    FastAPI already caches dependency results within a request; across
+    requests active users are served from ``principal_cache``.
+    """
+    principal = principal_cache.get(email)
+    if principal is None:
+        row = db.execute(
+            select(
+                User.id,
+                User.email,
+                User.full_name,
+                User.phone_number,
+                User.is_active,
+                User.is_verified,
+            ).where(User.email == email)
+        ).first()
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token",
+            )
+        if not row.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Account is deactivated",
+            )
+        principal = Principal(**row._mapping)
+        principal_cache.set(principal)
+
+    request.state.principal = principal
+    return principal
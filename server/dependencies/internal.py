@@ -0,0 +1,17 @@
+import secrets
+
+from fastapi import Header, HTTPException, status
+
+from config import settings
+
+
+def require_internal_token(x_internal_token: str | None = Header(default=None)):
+    """Guard for operational endpoints; they do not exist unless a token is configured."""
+    if not settings.INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not x_internal_token or not secrets.compare_digest(
+        x_internal_token, settings.INTERNAL_API_TOKEN
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Invalid internal token"
+        )
@@ -0,0 +1,653 @@
+"""Generate a large, reproducible data set for performance work.
+
+Usage:
+    python -m generate_data [--seed 42] [--days 90] [--flights-per-day 200]
+                            [--users 100000] [--bookings 1000000] [--truncate]
+
+Every table is streamed into Postgres with ``COPY`` from generators, so
+memory stays flat whatever the volume. The same seed and arguments always
+produce the same rows: the schedule has its own RNG, every day of flights
+and every flight's bookings are drawn from an RNG derived from the seed and
+the day or flight id. That is also what lets ``flight_inventory``,
+``bookings`` and ``tickets`` be written in separate passes that agree with
+each other.
+
+Flights follow a fixed daily schedule: routes are picked with a gravity
+model over airport weights, every route is flown both ways, departures
+cluster in morning and evening banks and durations follow the great-circle
+distance. A flight number is the schedule designator plus the date
+(``VN0123-20261019``), so volume is not capped by the designator range.
+
+Half of the schedule lies before ``--start-date + days/2`` (flown, with
+completed or cancelled statuses) and half after it (open for booking). By
+default that middle day is today; pass ``--start-date`` to get identical
+rows on another day. All users share one password (``--password``), hashed
+once.
+
+Existing airports, planes, flights, users, bookings and tickets are
+replaced only with ``--truncate``; ticket types are reused.
+"""
+
+import argparse
+import io
+import itertools
+import math
+import random
+import string
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+from config import settings
+from core.seat_map import seat_label
+from database import engine
+from schemas.booking import MAX_PASSENGERS_PER_BOOKING
+from services.auth_service import pwd_context
+
+# code, name, city, latitude, longitude, traffic weight
+AIRPORTS = [
+    ("SGN", "Tan Son Nhat International Airport", "Ho Chi Minh City", 10.82, 106.66, 40),
+    ("HAN", "Noi Bai International Airport", "Hanoi", 21.22, 105.81, 35),
+    ("DAD", "Da Nang International Airport", "Da Nang", 16.04, 108.20, 15),
+    ("CXR", "Cam Ranh International Airport", "Nha Trang", 11.99, 109.22, 8),
+    ("PQC", "Phu Quoc International Airport", "Phu Quoc", 10.17, 103.99, 7),
+    ("HPH", "Cat Bi International Airport", "Hai Phong", 20.82, 106.72, 5),
+    ("VII", "Vinh International Airport", "Vinh", 18.74, 105.67, 4),
+    ("HUI", "Phu Bai International Airport", "Hue", 16.40, 107.70, 4),
+    ("DLI", "Lien Khuong Airport", "Da Lat", 11.75, 108.37, 4),
+    ("UIH", "Phu Cat Airport", "Quy Nhon", 13.95, 109.04, 3),
+    ("VCA", "Can Tho International Airport", "Can Tho", 10.09, 105.71, 3),
+    ("BMV", "Buon Ma Thuot Airport", "Buon Ma Thuot", 12.67, 108.12, 3),
+    ("THD", "Tho Xuan Airport", "Thanh Hoa", 19.90, 105.47, 3),
+    ("VDO", "Van Don International Airport", "Quang Ninh", 21.12, 107.41, 2),
+    ("PXU", "Pleiku Airport", "Pleiku", 14.00, 108.02, 2),
+    ("VDH", "Dong Hoi Airport", "Dong Hoi", 17.52, 106.59, 2),
+    ("TBB", "Tuy Hoa Airport", "Tuy Hoa", 13.05, 109.33, 1),
+    ("VCL", "Chu Lai Airport", "Tam Ky", 15.40, 108.71, 1),
+    ("VCS", "Con Dao Airport", "Con Dao", 8.73, 106.63, 1),
+    ("CAH", "Ca Mau Airport", "Ca Mau", 9.18, 105.18, 1),
+    ("DIN", "Dien Bien Phu Airport", "Dien Bien Phu", 21.40, 103.01, 1),
+    ("BKK", "Suvarnabhumi Airport", "Bangkok", 13.69, 100.75, 6),
+    ("SIN", "Changi Airport", "Singapore", 1.36, 103.99, 6),
+    ("ICN", "Incheon International Airport", "Seoul", 37.46, 126.44, 5),
+    ("NRT", "Narita International Airport", "Tokyo", 35.77, 140.39, 4),
+    ("TPE", "Taoyuan International Airport", "Taipei", 25.08, 121.23, 3),
+    ("HKG", "Hong Kong International Airport", "Hong Kong", 22.31, 113.91, 3),
+    ("KUL", "Kuala Lumpur International Airport", "Kuala Lumpur", 2.74, 101.70, 3),
+]
+
+# model, seats, fleet weight
+PLANE_MODELS = [
+    ("A321", 184, 10),
+    ("A350", 305, 3),
+    ("B787", 274, 3),
+    ("AT72", 70, 2),
+]
+
+# Share of tickets per ticket type name; unknown types get weight 1
+TICKET_TYPE_WEIGHTS = {"Economy": 80, "Premium Economy": 12, "Business": 7, "VIP": 1}
+
+DEFAULT_TICKET_TYPES = [
+    ("Economy", 1.0, 20),
+    ("Premium Economy", 1.5, 25),
+    ("Business", 2.5, 35),
+    ("VIP", 4.0, 50),
+]
+
+# Hours around which departures cluster
+DEPARTURE_BANKS = [6.5, 8.5, 11.0, 14.0, 17.5, 20.0]
+
+FAMILY_NAMES = ["Nguyễn", "Trần", "Lê", "Phạm", "Hoàng", "Huỳnh", "Phan", "Vũ", "Võ", "Đặng", "Bùi", "Đỗ", "Hồ", "Ngô", "Dương", "Lý"]
+MIDDLE_NAMES = ["Văn", "Thị", "Hữu", "Đức", "Minh", "Thanh", "Ngọc", "Quốc", "Gia", "Xuân"]
+GIVEN_NAMES = ["An", "Bình", "Châu", "Dũng", "Giang", "Hà", "Hải", "Hạnh", "Hiếu", "Hoa", "Hùng", "Khánh", "Lan", "Linh", "Long", "Mai", "Nam", "Nga", "Phong", "Phúc", "Quân", "Quỳnh", "Sơn", "Tâm", "Thảo", "Trang", "Trung", "Tuấn", "Vy", "Yến"]
+
+PASSENGER_NAMES = [
+    f"{family} {middle} {given}"
+    for family in FAMILY_NAMES
+    for middle in MIDDLE_NAMES
+    for given in GIVEN_NAMES
+]
+
+TRUNCATE_SQL = """
+    TRUNCATE tickets, bookings, flight_inventory, flight_registry, flights, planes, airports, users,
+        tickets_archive, bookings_archive, flights_archive
+    RESTART IDENTITY CASCADE
+"""
+
+GENERATED_TABLES = ["airports", "planes", "flights", "users", "bookings", "tickets"]
+LOADED_TABLES = GENERATED_TABLES + ["flight_inventory", "flight_registry"]
+SERIAL_TABLES = ["planes", "flights", "users", "bookings", "tickets"]
+
+
+@dataclass(frozen=True)
+class GeneratorConfig:
+    seed: int
+    airports: int
+    planes: int
+    days: int
+    flights_per_day: int
+    users: int
+    bookings: int
+    tickets_per_booking: float
+    start_date: date
+
+    @property
+    def as_of(self) -> datetime:
+        """Flights before this have flown, flights after it are on sale."""
+        return datetime.combine(self.start_date + timedelta(days=self.days // 2), datetime.min.time())
+
+    def rng(self, *scope) -> random.Random:
+        return random.Random(":".join(map(str, (self.seed, *scope))))
+
+
+@dataclass(frozen=True)
+class ScheduledFlight:
+    designator: str
+    departure_airport_id: str
+    arrival_airport_id: str
+    departure_minute: int
+    duration_minutes: int
+    fare: float
+    plane_id: int
+    capacity: int
+
+
+@dataclass(frozen=True)
+class GeneratedFlight:
+    id: int
+    flight_number: str
+    departure_time: datetime
+    arrival_time: datetime
+    base_price: float
+    status: str
+    plane_id: int
+    departure_airport_id: str
+    arrival_airport_id: str
+    capacity: int
+
+
+class CopyStream(io.TextIOBase):
+    """Read-only file over generated rows in ``COPY ... (FORMAT text)`` format."""
+
+    def __init__(self, rows):
+        self._lines = (_copy_line(row) for row in rows)
+        self._buffer = ""
+        self.rows = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        while size < 0 or length < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            chunks.append(line)
+            length += len(line)
+            self.rows += 1
+        data = "".join(chunks)
+        if size < 0:
+            self._buffer = ""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+
+def _copy_line(row: tuple) -> str:
+    # Generated text never contains tabs, newlines or backslashes, so values
+    # need no escaping
+    return "\t".join(["\\N" if value is None else str(value) for value in row]) + "\n"
+
+
+def _distance_km(a: tuple, b: tuple) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (a[3], a[4], b[3], b[4]))
+    h = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * 6371 * math.asin(math.sqrt(h))
+
+
+def build_airports(config: GeneratorConfig) -> list[tuple]:
+    """The real airports first, then small synthetic ones if more are asked for."""
+    airports = AIRPORTS[: config.airports]
+    rng = config.rng("airports")
+    used = {airport[0] for airport in AIRPORTS}
+    codes = ("".join(letters) for letters in itertools.product(string.ascii_uppercase, repeat=3))
+    while len(airports) < config.airports:
+        code = next(code for code in codes if code not in used)
+        airports.append(
+            (
+                code,
+                f"{code} Regional Airport",
+                f"City {code}",
+                round(rng.uniform(8.5, 23.0), 2),
+                round(rng.uniform(102.5, 109.5), 2),
+                rng.choice([0.5, 1, 1]),
+            )
+        )
+    return airports
+
+
+def build_planes(config: GeneratorConfig) -> list[tuple]:
+    """(id, code, total_seats) rows."""
+    rng = config.rng("planes")
+    models = rng.choices(PLANE_MODELS, weights=[m[2] for m in PLANE_MODELS], k=config.planes)
+    return [
+        (plane_id, f"VN-{model}-{plane_id:04d}", seats)
+        for plane_id, (model, seats, _) in enumerate(models, start=1)
+    ]
+
+
+def build_schedule(config: GeneratorConfig, airports: list[tuple], planes: list[tuple]) -> list[ScheduledFlight]:
+    """One day of flights, repeated (with jitter) for every day generated."""
+    rng = config.rng("schedule")
+    pairs = list(itertools.combinations(airports, 2))
+    weights = [a[5] * b[5] for a, b in pairs]
+    routes = rng.choices(pairs, weights=weights, k=(config.flights_per_day + 1) // 2)
+
+    schedule = []
+    for outbound, inbound in routes:
+        if rng.random() < 0.5:
+            outbound, inbound = inbound, outbound
+        km = _distance_km(outbound, inbound)
+        duration = 5 * round((35 + km / 800 * 60) / 5)
+        fare = round((30 + km * 0.08) * rng.uniform(0.9, 1.2), 2)
+        candidates = [p for p in planes if p[2] >= 150] if km > 700 else planes
+        plane_id, _, capacity = rng.choice(candidates or planes)
+        bank = rng.choice(DEPARTURE_BANKS)
+        departure = int(min(max(bank * 60 + rng.gauss(0, 40), 5 * 60), 23 * 60))
+        turnaround = departure + duration + rng.randint(45, 120)
+        for origin, destination, minute in (
+            (outbound, inbound, departure),
+            (inbound, outbound, turnaround % (24 * 60)),
+        ):
+            if len(schedule) == config.flights_per_day:
+                break
+            schedule.append(
+                ScheduledFlight(
+                    designator=f"VN{len(schedule) + 1:04d}",
+                    departure_airport_id=origin[0],
+                    arrival_airport_id=destination[0],
+                    departure_minute=5 * (minute // 5),
+                    duration_minutes=duration,
+                    fare=fare,
+                    plane_id=plane_id,
+                    capacity=capacity,
+                )
+            )
+    return schedule
+
+
+def iter_flights(config: GeneratorConfig, schedule: list[ScheduledFlight]):
+    as_of = config.as_of
+    for day in range(config.days):
+        rng = config.rng("day", day)
+        flight_date = config.start_date + timedelta(days=day)
+        midnight = datetime.combine(flight_date, datetime.min.time())
+        # Fridays and Sundays are busier and dearer
+        day_factor = 1.15 if flight_date.weekday() in (4, 6) else 1.0
+        for index, entry in enumerate(schedule):
+            departure = midnight + timedelta(
+                minutes=entry.departure_minute + 5 * rng.randint(-2, 2)
+            )
+            if departure < as_of:
+                status = "CANCELLED" if rng.random() < 0.02 else "COMPLETED"
+            elif departure < as_of + timedelta(days=2) and rng.random() < 0.05:
+                status = "DELAYED"
+            else:
+                status = "SCHEDULED"
+            yield GeneratedFlight(
+                id=day * len(schedule) + index + 1,
+                flight_number=f"{entry.designator}-{flight_date:%Y%m%d}",
+                departure_time=departure,
+                arrival_time=departure + timedelta(minutes=entry.duration_minutes),
+                base_price=round(entry.fare * day_factor * rng.uniform(0.85, 1.25), 2),
+                status=status,
+                plane_id=entry.plane_id,
+                departure_airport_id=entry.departure_airport_id,
+                arrival_airport_id=entry.arrival_airport_id,
+                capacity=entry.capacity,
+            )
+
+
+def iter_users(config: GeneratorConfig, hashed_password: str):
+    rng = config.rng("users")
+    for user_id in range(1, config.users + 1):
+        created_at = config.as_of - timedelta(seconds=rng.randint(0, 3 * 365 * 86400))
+        yield (
+            user_id,
+            f"user{user_id:08d}@example.com",
+            hashed_password,
+            rng.choice(PASSENGER_NAMES),
+            f"09{user_id:08d}",
+            True,
+            True,
+            created_at,
+            created_at,
+            None,
+        )
+
+
+def iter_flight_bookings(config: GeneratorConfig, schedule: list[ScheduledFlight], ticket_types: list[tuple]):
+    """Yield ``(flight, bookings)`` for every flight, always identically.
+
+    A booking is ``(booking_row, ticket_type_id, price, seats)`` with one
+    seat index (or None) per passenger; booking ids run on across flights.
+    Cancelled bookings hold no seats and are not counted in the inventory.
+    Passenger details are drawn separately by :func:`iter_tickets`.
+    """
+    as_of = config.as_of
+    mean_bookings = config.bookings / max(1, config.days * len(schedule))
+    # Party size is 1 + a geometric number of companions
+    log_q = math.log((config.tickets_per_booking - 1) / config.tickets_per_booking or 1e-300)
+    cum_weights = list(
+        itertools.accumulate(TICKET_TYPE_WEIGHTS.get(name, 1) for _, name, _ in ticket_types)
+    )
+    lead_scale = 1 / (21 * 86400)
+
+    booking_id = 0
+    for flight in iter_flights(config, schedule):
+        rng = config.rng("flight", flight.id)
+        wanted = max(0, round(rng.gauss(mean_bookings, mean_bookings * 0.3)))
+        seated_share = 1.0 if flight.departure_time < as_of else 0.8
+
+        parties = []
+        sold = 0
+        for _ in range(wanted):
+            size = min(1 + int(math.log(1 - rng.random()) / log_q), MAX_PASSENGERS_PER_BOOKING)
+            cancelled = flight.status == "CANCELLED" or rng.random() < 0.06
+            if not cancelled:
+                if sold + size > flight.capacity:
+                    break
+                sold += size
+            parties.append((size, cancelled))
+
+        seated = [rng.random() < seated_share for _ in range(sold)]
+        seats = iter(rng.sample(range(flight.capacity), sum(seated)))
+        seated = iter(seated)
+
+        bookings = []
+        for size, cancelled in parties:
+            booking_id += 1
+            lead = min(rng.expovariate(lead_scale), 180 * 86400)
+            booking_time = flight.departure_time - timedelta(seconds=int(lead))
+            if booking_time > as_of:
+                booking_time = as_of - timedelta(seconds=rng.randint(60, 30 * 86400))
+            user_id = 1 + min(config.users - 1, int(config.users * rng.random() ** 2))
+            ticket_type_id, _, multiplier = rng.choices(ticket_types, cum_weights=cum_weights)[0]
+            price = round(flight.base_price * multiplier, 2)
+            if cancelled:
+                booking_seats = [None] * size
+            else:
+                booking_seats = [next(seats) if next(seated) else None for _ in range(size)]
+            bookings.append(
+                (
+                    (
+                        booking_id,
+                        booking_time,
+                        round(price * size, 2),
+                        "CANCELLED" if cancelled else "CONFIRMED",
+                        None,
+                        user_id,
+                    ),
+                    ticket_type_id,
+                    price,
+                    booking_seats,
+                )
+            )
+        yield flight, bookings
+
+
+def iter_inventory(flight_bookings):
+    for flight, bookings in flight_bookings:
+        bitmap = bytearray(b"0" * flight.capacity)
+        sold = 0
+        for booking, _, _, seats in bookings:
+            if booking[3] == "CANCELLED":
+                continue
+            sold += len(seats)
+            for seat in seats:
+                if seat is not None:
+                    bitmap[seat] = ord("1")
+        yield flight.id, flight.capacity, sold, bitmap.decode("ascii")
+
+
+def iter_tickets(config: GeneratorConfig, flight_bookings):
+    ticket_id = 0
+    columns = settings.SEAT_COLUMNS
+    for flight, bookings in flight_bookings:
+        rng = config.rng("tickets", flight.id)
+        for booking, ticket_type_id, price, seats in bookings:
+            for seat in seats:
+                ticket_id += 1
+                yield (
+                    ticket_id,
+                    rng.choice(PASSENGER_NAMES),
+                    None if seat is None else seat_label(seat, columns),
+                    rng.choice((0, 0, 0, 10, 20)),
+                    price,
+                    booking[0],
+                    flight.id,
+                    ticket_type_id,
+                )
+
+
+def copy_rows(cursor, table: str, columns: list[str], rows) -> int:
+    stream = CopyStream(rows)
+    start = time.perf_counter()
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT text)",
+        stream,
+        size=1 << 16,
+    )
+    elapsed = time.perf_counter() - start
+    print(f"{table}: {stream.rows} rows in {elapsed:.1f}s ({stream.rows / max(elapsed, 1e-9):,.0f} rows/s)")
+    return stream.rows
+
+
+def drop_secondary_objects(cursor) -> list[str]:
+    """Drop foreign keys and plain indexes of the loaded tables.
+
+    Checking a foreign key per copied row and updating every index row by
+    row is most of the cost of a bulk load; rebuilding them afterwards is
+    much cheaper. Returns the statements that recreate them. Primary keys
+    and unique constraints stay, so duplicates still fail the load.
+    """
+    cursor.execute(
+        """
+        SELECT format('ALTER TABLE %%s ADD CONSTRAINT %%I %%s',
+                      conrelid::regclass, conname, pg_get_constraintdef(oid)),
+               format('ALTER TABLE %%s DROP CONSTRAINT %%I', conrelid::regclass, conname)
+        FROM pg_constraint
+        WHERE contype = 'f' AND conrelid = ANY(CAST(%(tables)s AS regclass[]))
+        UNION ALL
+        SELECT pg_get_indexdef(i.indexrelid),
+               format('DROP INDEX %%s', i.indexrelid::regclass)
+        FROM pg_index i
+        WHERE i.indrelid = ANY(CAST(%(tables)s AS regclass[]))
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+        """,
+        {"tables": LOADED_TABLES},
+    )
+    rows = cursor.fetchall()
+    for _, drop in rows:
+        cursor.execute(drop)
+    # Indexes of the partitioned flights table are defined "ON ONLY" the
+    # parent; recreating them without ONLY builds them on every partition.
+    # Indexes go before foreign keys, so validating a key can use them.
+    return sorted(
+        (create.replace(" ON ONLY ", " ON ") for create, _ in rows),
+        key=lambda sql: sql.startswith("ALTER"),
+    )
+
+
+def ensure_ticket_types(cursor) -> list[tuple]:
+    cursor.execute("SELECT id, name, price_multiplier FROM ticket_types ORDER BY id")
+    rows = cursor.fetchall()
+    if rows:
+        return rows
+    for name, multiplier, baggage in DEFAULT_TICKET_TYPES:
+        cursor.execute(
+            "INSERT INTO ticket_types (name, price_multiplier, base_baggage_allowance_kg) "
+            "VALUES (%s, %s, %s)",
+            (name, multiplier, baggage),
+        )
+    return ensure_ticket_types(cursor)
+
+
+def generate(config: GeneratorConfig, password: str, truncate: bool) -> None:
+    airports = build_airports(config)
+    planes = build_planes(config)
+    schedule = build_schedule(config, airports, planes)
+
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SET LOCAL synchronous_commit = off")
+        if truncate:
+            cursor.execute(TRUNCATE_SQL)
+        else:
+            for table in GENERATED_TABLES:
+                cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {table})")
+                if cursor.fetchone()[0]:
+                    raise SystemExit(f"Table {table} is not empty; rerun with --truncate to replace it.")
+        ticket_types = ensure_ticket_types(cursor)
+
+        start = time.perf_counter()
+        recreate = drop_secondary_objects(cursor)
+        copy_rows(cursor, "airports", ["id", "name", "city"], (a[:3] for a in airports))
+        copy_rows(cursor, "planes", ["id", "code", "total_seats"], planes)
+        copy_rows(
+            cursor,
+            "users",
+            [
+                "id", "email", "hashed_password", "full_name", "phone_number",
+                "is_active", "is_verified", "created_at", "updated_at", "last_login_at",
+            ],
+            iter_users(config, pwd_context.hash(password)),
+        )
+        # Every generated month gets its partition, rather than the default one
+        cursor.execute(
+            "SELECT create_flight_partition(CAST(month AS date)) "
+            "FROM generate_series(CAST(%(first)s AS timestamp), %(last)s, interval '1 month') AS month",
+            {
+                "first": config.start_date.replace(day=1),
+                "last": config.start_date + timedelta(days=config.days),
+            },
+        )
+        copy_rows(
+            cursor,
+            "flights",
+            [
+                "id", "flight_number", "departure_time", "arrival_time", "base_price",
+                "status", "plane_id", "departure_airport_id", "arrival_airport_id",
+            ],
+            (
+                (
+                    f.id, f.flight_number, f.departure_time, f.arrival_time, f.base_price,
+                    f.status, f.plane_id, f.departure_airport_id, f.arrival_airport_id,
+                )
+                for f in iter_flights(config, schedule)
+            ),
+        )
+        copy_rows(
+            cursor,
+            "flight_inventory",
+            ["flight_id", "capacity", "sold", "seat_bitmap"],
+            iter_inventory(iter_flight_bookings(config, schedule, ticket_types)),
+        )
+        copy_rows(
+            cursor,
+            "bookings",
+            ["id", "booking_time", "total_price", "status", "hold_expires_at", "user_id"],
+            (
+                booking
+                for _, bookings in iter_flight_bookings(config, schedule, ticket_types)
+                for booking, _, _, _ in bookings
+            ),
+        )
+        copy_rows(
+            cursor,
+            "tickets",
+            [
+                "id", "passenger_name", "seat_number", "extra_baggage_kg", "final_price",
+                "booking_id", "flight_id", "ticket_type_id",
+            ],
+            iter_tickets(config, iter_flight_bookings(config, schedule, ticket_types)),
+        )
+
+        build_start = time.perf_counter()
+        for statement in recreate:
+            cursor.execute(statement)
+        print(f"Rebuilt {len(recreate)} indexes and foreign keys in {time.perf_counter() - build_start:.1f}s")
+
+        for table in SERIAL_TABLES:
+            cursor.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"COALESCE((SELECT max(id) FROM {table}), 0) + 1, false)"
+            )
+        for table in LOADED_TABLES:
+            cursor.execute(f"ANALYZE {table}")
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    print(f"Generated data in {time.perf_counter() - start:.1f}s.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate reproducible bulk test data.")
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed")
+    parser.add_argument("--airports", type=int, default=len(AIRPORTS), help="Number of airports")
+    parser.add_argument("--planes", type=int, default=60, help="Number of planes")
+    parser.add_argument("--days", type=int, default=90, help="Days of schedule")
+    parser.add_argument("--flights-per-day", type=int, default=200, help="Flights per day of schedule")
+    parser.add_argument("--users", type=int, default=100_000, help="Number of users")
+    parser.add_argument("--bookings", type=int, default=1_000_000, help="Approximate number of bookings")
+    parser.add_argument(
+        "--tickets-per-booking",
+        type=float,
+        default=1.6,
+        help="Mean passengers per booking (at least 1)",
+    )
+    parser.add_argument(
+        "--start-date",
+        type=date.fromisoformat,
+        default=None,
+        help="First day of schedule (default: today minus half of --days)",
+    )
+    parser.add_argument("--password", default="12345678", help="Password of every generated user")
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="Replace existing airports, planes, flights, users, bookings and tickets",
+    )
+    args = parser.parse_args()
+
+    if min(args.airports, args.planes, args.days, args.flights_per_day, args.users) < 1 or args.airports < 2:
+        parser.error("counts must be positive and there must be at least 2 airports")
+    if args.tickets_per_booking < 1:
+        parser.error("--tickets-per-booking must be at least 1")
+
+    config = GeneratorConfig(
+        seed=args.seed,
+        airports=args.airports,
+        planes=args.planes,
+        days=args.days,
+        flights_per_day=args.flights_per_day,
+        users=args.users,
+        bookings=args.bookings,
+        tickets_per_booking=args.tickets_per_booking,
+        start_date=args.start_date or date.today() - timedelta(days=args.days // 2),
+    )
+    generate(config, args.password, args.truncate)
+
+
+if __name__ == "__main__":
+    main()
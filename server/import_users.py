@@ -0,0 +1,138 @@
+"""Bulk import users from a CSV file.
+
+Usage:
+    python -m import_users customers.csv [--workers 8] [--chunk-size 5000]
+
+The CSV must have a header with the columns ``email,full_name,phone_number,password``.
+Passwords are hashed in a process pool, rows are streamed into a temporary
+staging table with ``COPY`` and then moved into ``users`` in one statement.
+Rows whose email or phone number already exists are skipped.
+"""
+
+import argparse
+import csv
+import io
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from pydantic import ValidationError
+
+from database import engine
+from schemas.auth import UserRegister
+from services.auth_service import pwd_context
+
+STAGING_TABLE_SQL = """
+    CREATE TEMP TABLE users_import (
+        email VARCHAR NOT NULL,
+        hashed_password VARCHAR NOT NULL,
+        full_name VARCHAR,
+        phone_number VARCHAR NOT NULL
+    ) ON COMMIT DROP
+"""
+
+COPY_SQL = """
+    COPY users_import (email, hashed_password, full_name, phone_number)
+    FROM STDIN WITH (FORMAT csv)
+"""
+
+MOVE_SQL = """
+    INSERT INTO users (
+        email, hashed_password, full_name, phone_number,
+        is_active, is_verified, created_at, updated_at
+    )
+    SELECT email, hashed_password, full_name, phone_number,
+           true, false, now(), now()
+    FROM users_import
+    ON CONFLICT DO NOTHING
+"""
+
+
+def hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def read_valid_rows(reader: csv.DictReader, invalid: list):
+    """Yield validated registrations, recording invalid line numbers."""
+    for line_number, record in enumerate(reader, start=2):
+        try:
+            yield UserRegister(
+                email=record.get("email", "").strip(),
+                full_name=record.get("full_name", "").strip(),
+                phone_number=record.get("phone_number", "").strip(),
+                password=record.get("password", ""),
+            )
+        except ValidationError:
+            invalid.append(line_number)
+
+
+def import_users(path: str, workers: int, chunk_size: int) -> None:
+    invalid_lines: list[int] = []
+    staged = 0
+
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(STAGING_TABLE_SQL)
+
+        with open(path, newline="", encoding="utf-8") as f, ProcessPoolExecutor(
+            max_workers=workers
+        ) as pool:
+            rows = read_valid_rows(csv.DictReader(f), invalid_lines)
+            while chunk := list(itertools.islice(rows, chunk_size)):
+                hashes = pool.map(
+                    hash_password,
+                    [user.password for user in chunk],
+                    chunksize=max(1, len(chunk) // (workers * 4)),
+                )
+
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                for user, hashed in zip(chunk, hashes):
+                    writer.writerow(
+                        [user.email, hashed, user.full_name, user.phone_number]
+                    )
+                buffer.seek(0)
+                cursor.copy_expert(COPY_SQL, buffer)
+
+                staged += len(chunk)
+                print(f"Staged {staged} users...")
+
+        cursor.execute(MOVE_SQL)
+        inserted = cursor.rowcount
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    print(f"Imported {inserted} users.")
+    print(f"Skipped {staged - inserted} users with an existing email or phone number.")
+    if invalid_lines:
+        shown = ", ".join(str(n) for n in invalid_lines[:20])
+        more = ", ..." if len(invalid_lines) > 20 else ""
+        print(f"Skipped {len(invalid_lines)} invalid rows (lines: {shown}{more}).")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import users from CSV.")
+    parser.add_argument("path", help="CSV file with email,full_name,phone_number,password")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes used to hash passwords",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=5000,
+        help="Number of rows hashed and copied per batch",
+    )
+    args = parser.parse_args()
+    import_users(args.path, args.workers, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
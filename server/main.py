@@ -1,9 +1,81 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, HTTPException, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from routers import flights, auth, ticket_options, airports
+from config import settings
+from core.access_log import access_log
+from core.archive import flight_archiver
+from core.background import PeriodicTasks
+from core.booking_holds import booking_holds
+from core.flight_partitions import flight_partitions
+from core.idempotency import idempotency_store
+from core.jwt_helper import reload_key_ring
+from core.last_login import last_login_buffer
+from core.metrics import CONTENT_TYPE, render_metrics, request_metrics
+from core.profiler import profile_store
+from core.revocation import revocation_list
+from dependencies.internal import require_internal_token
+from routers import (
+    flights,
+    auth,
+    ticket_options,
+    airports,
+    well_known,
+    internal,
+    bookings,
+    me,
+)
+from middlewares.access_log import AccessLogMiddleware
 from middlewares.case_converter import CaseConverterMiddleware
+from middlewares.idempotency import IdempotencyMiddleware
+from middlewares.metrics import MetricsMiddleware
+from middlewares.profiling import ProfilingMiddleware
+from middlewares.read_your_writes import ReadYourWritesMiddleware
+from middlewares.server_timing import ServerTimingMiddleware
+
+logger = logging.getLogger(__name__)
+
+periodic_tasks = PeriodicTasks()
+periodic_tasks.add(
+    last_login_buffer.flush, settings.LAST_LOGIN_FLUSH_INTERVAL_SECONDS
+)
+periodic_tasks.add(revocation_list.sync, settings.REVOCATION_SYNC_INTERVAL_SECONDS)
+periodic_tasks.add(revocation_list.prune, settings.REVOCATION_PRUNE_INTERVAL_SECONDS)
+periodic_tasks.add(booking_holds.sweep, settings.BOOKING_HOLD_SWEEP_INTERVAL_SECONDS)
+periodic_tasks.add(
+    idempotency_store.prune, settings.IDEMPOTENCY_CLEANUP_INTERVAL_SECONDS
+)
+periodic_tasks.add(
+    flight_partitions.ensure_ahead, settings.FLIGHT_PARTITION_CHECK_INTERVAL_SECONDS
+)
+if settings.JWT_PRIVATE_KEY_FILE:
+    periodic_tasks.add(reload_key_ring, settings.KEY_RING_RELOAD_SECONDS)
+if settings.ARCHIVE_ENABLED:
+    periodic_tasks.add(flight_archiver.run, settings.ARCHIVE_INTERVAL_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await asyncio.to_thread(revocation_list.sync)
+    except Exception:
+        logger.exception("Initial token revocation sync failed")
+    try:
+        await asyncio.to_thread(flight_partitions.ensure_ahead)
+    except Exception:
+        logger.exception("Creating flight partitions failed")
+    access_log.start()
+    periodic_tasks.start()
+    yield
+    await periodic_tasks.stop()
+    # Flush pending write-behind state before the process exits
+    last_login_buffer.flush()
+    access_log.stop()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 
 app.add_middleware(
@@ -18,6 +90,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 app.add_middleware(CaseConverterMiddleware)
+# Outside the case converter so the stored response is the final body
+app.add_middleware(
+    IdempotencyMiddleware,
+    store=idempotency_store,
+    path_prefixes=("/bookings",),
+    wait_seconds=settings.IDEMPOTENCY_WAIT_SECONDS,
+)
+app.add_middleware(
+    ReadYourWritesMiddleware, window_seconds=settings.READ_YOUR_WRITES_SECONDS
+)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=profile_store,
+        sample_rate=settings.PROFILE_SAMPLE_RATE,
+        token=settings.INTERNAL_API_TOKEN,
+    )
+if settings.ACCESS_LOG_ENABLED:
+    app.add_middleware(AccessLogMiddleware, access_log=access_log)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, metrics=request_metrics)
+app.add_middleware(
+    ServerTimingMiddleware,
+    enabled=settings.SERVER_TIMING_ENABLED,
+    token=settings.INTERNAL_API_TOKEN,
+)
 
 
 @app.get("/health")
@@ -26,6 +124,18 @@ async def health_check():
     return {"status": "healthy", "message": "Server đang hoạt động bình thường"}
 
 
+@app.get(
+    "/metrics",
+    include_in_schema=False,
+    dependencies=[Depends(require_internal_token)],
+)
+async def metrics():
+    """Metrics của process theo định dạng text của Prometheus (cần X-Internal-Token)"""
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    return Response(render_metrics(), media_type=CONTENT_TYPE)
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -36,3 +146,7 @@ app.include_router(auth.router)
 app.include_router(airports.router, prefix="/airports", tags=["Sân bay"])
 app.include_router(flights.router, prefix="/flights", tags=["Chuyến bay"])
 app.include_router(ticket_options.router, prefix="/ticket-options", tags=["Vé máy bay"])
+app.include_router(bookings.router, prefix="/bookings", tags=["Đặt vé"])
+app.include_router(me.router, prefix="/me", tags=["Người dùng"])
+app.include_router(well_known.router, prefix="/.well-known", tags=["Authentication"])
+app.include_router(internal.router, prefix="/internal", tags=["Nội bộ"])
@@ -0,0 +1,54 @@
+import time
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.access_log import AccessLog
+from core.query_stats import current_request_stats
+
+
+class AccessLogMiddleware:
+    """Writes one structured access log entry per HTTP request.
+
+    DB time and query count come from the request's query stats, started by
+    ``ServerTimingMiddleware``, so this must run inside it. The user id is
+    the principal ``get_current_principal`` left in ``request.state``.
+    """
+
+    def __init__(self, app: ASGIApp, access_log: AccessLog):
+        self.app = app
+        self.access_log = access_log
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            stats = current_request_stats()
+            route = scope.get("route")
+            principal = scope.get("state", {}).get("principal")
+            client = scope.get("client")
+            self.access_log.log(
+                {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "route": getattr(route, "path", None),
+                    "status": status,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                    "db_ms": round(stats.db_time * 1000, 3) if stats else None,
+                    "queries": stats.count if stats else None,
+                    "user_id": principal.id if principal else None,
+                    "client": client[0] if client else None,
+                }
+            )
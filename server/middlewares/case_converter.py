@@ -78,7 +78,10 @@ class CaseConverterMiddleware:
                     headers_dict = dict(response_start.get("headers", []))
                     content_type = headers_dict.get(b"content-type", b"").decode()
 
-                    if "application/json" in content_type:
+                    # Fast read paths build camelCase bodies themselves
+                    already_converted = scope.get("state", {}).get("camel_case_body")
+
+                    if "application/json" in content_type and not already_converted:
                         try:
                             parsed = json.loads(captured_body)
                             converted = convert_dict_keys(parsed, to_camel_case)
@@ -0,0 +1,185 @@
+import asyncio
+import hashlib
+import time
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.idempotency import IdempotencyStore, StoredResponse
+from dependencies.auth import valid_token_claims
+
+UNSAFE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+HEADER_NAME = b"idempotency-key"
+MAX_KEY_LENGTH = 255
+# Not replayed: cookies belong to the original exchange
+EXCLUDED_HEADERS = {"set-cookie", "content-length"}
+# Client errors that say nothing about the request itself (auth, rate
+# limiting, timeouts): the key is released so a retry runs again
+RETRYABLE_STATUSES = {401, 403, 408, 425, 429}
+
+
+class IdempotencyMiddleware:
+    """Runs a mutating request at most once per ``Idempotency-Key``.
+
+    The first request with a key claims it in ``idempotency_keys`` and its
+    response (after case conversion, so add this middleware after
+    ``CaseConverterMiddleware``) is stored. Retries with the same key and
+    the same method, path and body get the stored bytes back with an
+    ``Idempotent-Replayed`` header; retries that arrive while the first
+    request is still running poll until it finishes. Only successful
+    responses and business errors (4xx other than ``RETRYABLE_STATUSES``)
+    are stored; on server, auth and rate limit errors the key is released
+    so the client can retry.
+
+    Keys are scoped by the token's subject, not the token itself, so a
+    retry sent after refreshing the access token still finds its key.
+    Requests without a valid access token are passed through untouched;
+    the endpoints reject them anyway.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: IdempotencyStore,
+        path_prefixes: tuple[str, ...],
+        wait_seconds: float,
+        poll_interval: float = 0.05,
+    ):
+        self.app = app
+        self.store = store
+        self.path_prefixes = path_prefixes
+        self.wait_seconds = wait_seconds
+        self.poll_interval = poll_interval
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in UNSAFE_METHODS
+            or not scope["path"].startswith(self.path_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers", []))
+        raw_key = headers.get(HEADER_NAME)
+        subject = self._subject(headers) if raw_key is not None else None
+        if subject is None:
+            await self.app(scope, receive, send)
+            return
+        key = raw_key.decode("latin-1").strip()
+        if not key or len(key) > MAX_KEY_LENGTH:
+            await self._error(scope, receive, send, 400, "Idempotency-Key không hợp lệ")
+            return
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        client = hashlib.sha256(subject.encode()).hexdigest()
+        fingerprint = hashlib.sha256(
+            b"\0".join(
+                [scope["method"].encode(), scope["path"].encode(), scope["query_string"], body]
+            )
+        ).hexdigest()
+
+        deadline = time.monotonic() + self.wait_seconds
+        waited = False
+        while not await asyncio.to_thread(self.store.claim, client, key, fingerprint):
+            state = await asyncio.to_thread(self.store.get, client, key)
+            if state is not None and state.fingerprint != fingerprint:
+                self.store.mismatched += 1
+                await self._error(
+                    scope, receive, send, 422,
+                    "Idempotency-Key đã được dùng cho một request khác",
+                )
+                return
+            if state is not None and state.response is not None:
+                self.store.replayed += 1
+                await self._replay(state.response, send)
+                return
+            if time.monotonic() >= deadline:
+                await self._error(
+                    scope, receive, send, 409,
+                    "Request với Idempotency-Key này đang được xử lý",
+                )
+                return
+            if not waited:
+                waited = True
+                self.store.waited += 1
+            # Still running, or released after a server error: claim again
+            await asyncio.sleep(self.poll_interval)
+
+        await self._execute(scope, body, send, client, key)
+
+    @staticmethod
+    def _subject(headers: dict[bytes, bytes]) -> str | None:
+        """``sub`` of the request's access token, None without a valid one.
+
+        Uses the same checks as the auth dependency, so a revoked token is
+        treated like a missing one and never claims or replays a key.
+        """
+        scheme, _, token = headers.get(b"authorization", b"").decode("latin-1").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return None
+        claims = valid_token_claims(token.strip())
+        return str(claims["sub"]) if claims else None
+
+    async def _execute(self, scope: Scope, body: bytes, send: Send, client: str, key: str):
+        async def receive_body() -> Message:
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        status_code = None
+        response_headers: list[list[str]] = []
+        chunks: list[bytes] = []
+        complete = False
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code, complete
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_headers.extend(
+                    [name.decode("latin-1"), value.decode("latin-1")]
+                    for name, value in message.get("headers", [])
+                    if name.decode("latin-1").lower() not in EXCLUDED_HEADERS
+                )
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                complete = not message.get("more_body", False)
+            await send(message)
+
+        try:
+            await self.app(scope, receive_body, send_wrapper)
+        finally:
+            if complete and self._storable(status_code):
+                response = StoredResponse(status_code, response_headers, b"".join(chunks))
+                await asyncio.to_thread(self.store.complete, client, key, response)
+                self.store.executed += 1
+            else:
+                await asyncio.to_thread(self.store.release, client, key)
+
+    @staticmethod
+    def _storable(status_code: int | None) -> bool:
+        if status_code is None:
+            return False
+        return 200 <= status_code < 300 or (
+            400 <= status_code < 500 and status_code not in RETRYABLE_STATUSES
+        )
+
+    @staticmethod
+    async def _replay(response: StoredResponse, send: Send):
+        headers = [
+            (name.encode("latin-1"), value.encode("latin-1"))
+            for name, value in response.headers
+        ]
+        headers.append((b"idempotent-replayed", b"true"))
+        await send(
+            {"type": "http.response.start", "status": response.status_code, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": response.body, "more_body": False})
+
+    @staticmethod
+    async def _error(scope: Scope, receive: Receive, send: Send, status_code: int, detail: str):
+        await JSONResponse({"detail": detail}, status_code=status_code)(scope, receive, send)
@@ -0,0 +1,49 @@
+import time
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.metrics import RequestMetrics
+
+# Route label of requests no route matched, so unknown paths cannot grow
+# the number of series
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Records request durations labeled by route template and status.
+
+    The route template (``/flights/{flight_id}``) is read from
+    ``scope["route"]``, which the router sets on the shared scope while
+    matching, so it is known once the inner app has returned.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.metrics.in_flight += 1
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.metrics.in_flight -= 1
+            route = scope.get("route")
+            self.metrics.observe(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                status,
+                time.perf_counter() - start,
+            )
@@ -0,0 +1,101 @@
+import asyncio
+import random
+import secrets
+import time
+import uuid
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.profiler import ProfileStore, start_request_profile
+
+PROFILE_HEADER = b"x-profile"
+TOKEN_HEADER = b"x-internal-token"
+
+
+class ProfilingMiddleware:
+    """Runs selected requests under cProfile and stores their top functions.
+
+    A request is profiled when it sends ``X-Profile: 1`` together with the
+    internal API token, or at random with ``sample_rate``. Its response gets
+    an ``X-Profile-Id`` header naming the stored profile. Only one request
+    is profiled at a time: the profiler on the event loop thread also sees
+    the other requests interleaved with it, so the profiled request should
+    be the only busy one for clean numbers. Only installed when
+    ``PROFILING_ENABLED`` is set.
+    """
+
+    def __init__(
+        self, app: ASGIApp, store: ProfileStore, sample_rate: float, token: str | None
+    ):
+        self.app = app
+        self.store = store
+        self.sample_rate = sample_rate
+        self.token = token
+        self._busy = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or self._busy:
+            await self.app(scope, receive, send)
+            return
+        reason = self._reason(scope)
+        if reason is None:
+            await self.app(scope, receive, send)
+            return
+
+        self._busy = True
+        request_profile = start_request_profile(uuid.uuid4().hex[:12])
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message = {
+                    **message,
+                    "headers": [
+                        *message.get("headers", []),
+                        (b"x-profile-id", request_profile.id.encode()),
+                    ],
+                }
+            await send(message)
+
+        start = time.perf_counter()
+        request_profile.main.enable()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_profile.main.disable()
+            duration = time.perf_counter() - start
+            self._busy = False
+            route = scope.get("route")
+            await asyncio.to_thread(
+                self.store.record,
+                request_profile,
+                {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "route": getattr(route, "path", None),
+                    "status": status,
+                    "reason": reason,
+                    "duration_ms": round(duration * 1000, 3),
+                },
+            )
+
+    def _reason(self, scope: Scope) -> str | None:
+        requested = token = None
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                requested = value
+            elif name == TOKEN_HEADER:
+                token = value
+        if (
+            requested
+            and requested != b"0"
+            and self.token
+            and token
+            and secrets.compare_digest(token, self.token.encode())
+        ):
+            return "header"
+        if self.sample_rate and random.random() < self.sample_rate:
+            return "sample"
+        return None
@@ -0,0 +1,78 @@
+import hashlib
+import time
+from http.cookies import SimpleCookie
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.cache import LRUCache
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+COOKIE_NAME = "ryw_until"
+
+
+class ReadYourWritesMiddleware:
+    """Pins reads to the primary for a short window after a client's own write.
+
+    A successful unsafe request (POST/PUT/PATCH/DELETE) marks the client in two
+    ways: a ``ryw_until`` cookie, which works across workers, and an
+    in-process entry keyed by the Authorization header, which works for
+    clients that ignore cookies. Safe requests inside the window get
+    ``request.state.read_primary = True``, which ``get_db`` uses to skip the
+    replicas.
+    """
+
+    def __init__(self, app: ASGIApp, window_seconds: float, max_clients: int = 10000):
+        self.app = app
+        self.window_seconds = window_seconds
+        self._recent_writers = LRUCache(max_clients)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or self.window_seconds <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers", []))
+        client_key = self._client_key(headers)
+
+        if scope["method"] in SAFE_METHODS:
+            if self._in_window(headers, client_key):
+                scope.setdefault("state", {})["read_primary"] = True
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                deadline = time.time() + self.window_seconds
+                if client_key is not None:
+                    self._recent_writers.set(client_key, True, deadline)
+                cookie = (
+                    f"{COOKIE_NAME}={deadline:.3f}; Max-Age={int(self.window_seconds) + 1}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", []), (b"set-cookie", cookie.encode())],
+                }
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _client_key(headers: dict) -> bytes | None:
+        authorization = headers.get(b"authorization")
+        if not authorization:
+            return None
+        return hashlib.sha256(authorization).digest()
+
+    def _in_window(self, headers: dict, client_key: bytes | None) -> bool:
+        if client_key is not None and self._recent_writers.get(client_key):
+            return True
+        raw_cookie = headers.get(b"cookie")
+        if not raw_cookie or COOKIE_NAME.encode() not in raw_cookie:
+            return False
+        cookie = SimpleCookie()
+        try:
+            cookie.load(raw_cookie.decode("latin-1"))
+            return float(cookie[COOKIE_NAME].value) > time.time()
+        except (KeyError, ValueError):
+            return False
@@ -0,0 +1,60 @@
+import secrets
+import time
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.query_stats import start_request_stats
+
+TOKEN_HEADER = b"x-internal-token"
+
+
+class ServerTimingMiddleware:
+    """Adds a ``Server-Timing`` header with the request's DB time and query count.
+
+    Query stats live in a context variable, which is copied into the
+    threadpool that runs sync endpoints and dependencies, so queries made
+    there are attributed to this request. Must be the outermost middleware so
+    ``app`` covers the whole request, including response buffering done by
+    other middlewares.
+
+    The header exposes DB timings, so it is only added to requests that
+    send the internal API token in ``X-Internal-Token``.
+    """
+
+    def __init__(self, app: ASGIApp, enabled: bool = False, token: str | None = None):
+        self.app = app
+        self.enabled = enabled
+        self.token = token
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = start_request_stats(scope["path"])
+        if not self.enabled or not self._authorized(scope):
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                total_ms = (time.perf_counter() - start) * 1000
+                value = (
+                    f'db;dur={stats.db_time * 1000:.1f};desc="queries={stats.count}", '
+                    f"app;dur={total_ms:.1f}"
+                )
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", []), (b"server-timing", value.encode())],
+                }
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _authorized(self, scope: Scope) -> bool:
+        if not self.token:
+            return False
+        token = dict(scope["headers"]).get(TOKEN_HEADER)
+        return token is not None and secrets.compare_digest(token, self.token.encode())
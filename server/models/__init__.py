@@ -4,7 +4,15 @@ from models.user import User
 from models.airport import Airport
 from models.plane import Plane
 from models.flight import Flight
+from models.flight_registry import FlightRegistry
 from models.ticket_type import TicketType
 from models.booking import Booking
 from models.ticket import Ticket
 from models.addon_option import AddonOption
+from models.refresh_token import RefreshToken
+from models.revoked_token import RevokedToken
+from models.flight_inventory import FlightInventory
+from models.idempotency_key import IdempotencyKey
+from models.flight_archive import FlightArchive
+from models.booking_archive import BookingArchive
+from models.ticket_archive import TicketArchive
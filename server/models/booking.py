@@ -7,6 +7,8 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Enum,
+    Index,
+    text,
 )
 from sqlalchemy.orm import relationship
 from models.base import Base
@@ -23,10 +25,28 @@ class Booking(Base):
 
     __tablename__ = "bookings"
     id = Column(Integer, primary_key=True, index=True)
-    booking_time = Column(DateTime, default=datetime.now)
+    booking_time = Column(DateTime, default=datetime.now, nullable=False)
     total_price = Column(Float, nullable=False)
     status = Column(Enum(BookingStatus), nullable=False, default=BookingStatus.PENDING)
+    # Seats of a pending booking are released when its hold expires
+    hold_expires_at = Column(DateTime, nullable=True)
 
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     user = relationship("User", back_populates="bookings")
     tickets = relationship("Ticket", back_populates="booking")
+
+    __table_args__ = (
+        Index(
+            "ix_bookings_hold_expires_at",
+            "hold_expires_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        # Booking history: keyset pages of one user, newest first, index-only
+        Index(
+            "ix_bookings_user_id_booking_time",
+            "user_id",
+            booking_time.desc(),
+            id.desc(),
+            postgresql_include=["total_price", "status", "hold_expires_at"],
+        ),
+    )
@@ -0,0 +1,28 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Enum, Float, Index, Integer
+from models.base import Base
+from models.booking import BookingStatus
+
+
+class BookingArchive(Base):
+    """Bookings of archived flights, moved out of ``bookings``."""
+
+    __tablename__ = "bookings_archive"
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    booking_time = Column(DateTime, nullable=False)
+    total_price = Column(Float, nullable=False)
+    status = Column(Enum(BookingStatus, create_type=False), nullable=False)
+    hold_expires_at = Column(DateTime, nullable=True)
+    user_id = Column(Integer, nullable=False)
+    archived_at = Column(DateTime, default=datetime.now, nullable=False)
+
+    __table_args__ = (
+        # Same covering index as bookings, for the booking history
+        Index(
+            "ix_bookings_archive_user_id_booking_time",
+            "user_id",
+            booking_time.desc(),
+            id.desc(),
+            postgresql_include=["total_price", "status", "hold_expires_at"],
+        ),
+    )
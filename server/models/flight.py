@@ -7,6 +7,8 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Enum,
+    Index,
+    text,
 )
 from sqlalchemy.orm import relationship
 from models.base import Base
@@ -24,9 +26,12 @@ class Flight(Base):
     """Model for flights."""
 
     __tablename__ = "flights"
-    id = Column(Integer, primary_key=True, index=True)
-    flight_number = Column(String, unique=True, index=True, nullable=False)
-    departure_time = Column(DateTime, nullable=False)
+    # Range-partitioned by departure month, so the primary key includes
+    # departure_time; ids and flight numbers are kept globally unique by
+    # flight_registry (see FlightRegistry)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    flight_number = Column(String, index=True, nullable=False)
+    departure_time = Column(DateTime, primary_key=True, index=True, nullable=False)
     arrival_time = Column(DateTime, nullable=False)
     base_price = Column(Float, nullable=False)
     status = Column(Enum(FlightStatus), nullable=False, default=FlightStatus.SCHEDULED)
@@ -38,4 +43,20 @@ class Flight(Base):
     plane = relationship("Plane", back_populates="flights")
     departure_airport = relationship("Airport", foreign_keys=[departure_airport_id])
     arrival_airport = relationship("Airport", foreign_keys=[arrival_airport_id])
-    tickets = relationship("Ticket", back_populates="flight")
+    tickets = relationship(
+        "Ticket",
+        primaryjoin="Flight.id == foreign(Ticket.flight_id)",
+        back_populates="flight",
+    )
+
+    __table_args__ = (
+        # Next batch of flights to archive (see core.archive)
+        Index(
+            "ix_flights_completed_departure_time",
+            "departure_time",
+            "id",
+            postgresql_where=text("status = 'COMPLETED'"),
+        ),
+        {"postgresql_partition_by": "RANGE (departure_time)"},
+    )
+    __mapper_args__ = {"primary_key": [id]}
@@ -0,0 +1,20 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Enum, Float, Integer, String
+from models.base import Base
+from models.flight import FlightStatus
+
+
+class FlightArchive(Base):
+    """Completed flights moved out of ``flights`` (see ``core.archive``)."""
+
+    __tablename__ = "flights_archive"
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    flight_number = Column(String, nullable=False)
+    departure_time = Column(DateTime, nullable=False)
+    arrival_time = Column(DateTime, nullable=False)
+    base_price = Column(Float, nullable=False)
+    status = Column(Enum(FlightStatus, create_type=False), nullable=False)
+    plane_id = Column(Integer, nullable=False)
+    departure_airport_id = Column(String(3), nullable=False)
+    arrival_airport_id = Column(String(3), nullable=False)
+    archived_at = Column(DateTime, default=datetime.now, nullable=False)
@@ -0,0 +1,29 @@
+from sqlalchemy import CheckConstraint, Column, ForeignKey, Integer, text
+from sqlalchemy.dialects.postgresql import BIT
+from models.base import Base
+
+
+class FlightInventory(Base):
+    """Seats sold per flight.
+
+    Bookings reserve seats with one conditional update of this row, so
+    concurrent bookings for the same flight serialize on a single row lock
+    and can never push ``sold`` past ``capacity``.
+
+    ``seat_bitmap`` has one bit per seat (see ``core.seat_map``); seats are
+    claimed and released with conditional bit updates of the same row.
+    """
+
+    __tablename__ = "flight_inventory"
+    flight_id = Column(
+        Integer, ForeignKey("flight_registry.id", ondelete="CASCADE"), primary_key=True
+    )
+    capacity = Column(Integer, nullable=False)
+    sold = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    seat_bitmap = Column(BIT(varying=True), nullable=False)
+
+    __table_args__ = (
+        CheckConstraint(
+            "sold >= 0 AND sold <= capacity", name="ck_flight_inventory_sold"
+        ),
+    )
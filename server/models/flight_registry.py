@@ -0,0 +1,16 @@
+from sqlalchemy import Column, DateTime, Integer, String
+from models.base import Base
+
+
+class FlightRegistry(Base):
+    """One row per flight, kept in sync with ``flights`` by a trigger.
+
+    ``flights`` is partitioned by departure month, so its keys include
+    ``departure_time``; this table holds the globally unique id and flight
+    number, and foreign keys to a flight reference it instead.
+    """
+
+    __tablename__ = "flight_registry"
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    flight_number = Column(String, unique=True, nullable=False)
+    departure_time = Column(DateTime, nullable=False)
@@ -0,0 +1,21 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Integer, JSON, LargeBinary, String
+from models.base import Base
+
+
+class IdempotencyKey(Base):
+    """Result of a mutating request made with an ``Idempotency-Key`` header.
+
+    ``status_code`` is NULL while the first request with the key is still
+    running; retries wait for it and then replay ``response_body``.
+    """
+
+    __tablename__ = "idempotency_keys"
+    scope = Column(String(64), primary_key=True)  # sha256 of the access token's subject (sub)
+    key = Column(String(255), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)  # sha256 of method, path and body
+    status_code = Column(Integer, nullable=True)
+    response_headers = Column(JSON, nullable=True)
+    response_body = Column(LargeBinary, nullable=True)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
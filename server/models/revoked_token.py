@@ -0,0 +1,16 @@
+from sqlalchemy import Column, String, DateTime, text
+from models.base import Base
+
+
+class RevokedToken(Base):
+    """Access token revoked before its expiry, identified by its ``jti`` claim."""
+
+    __tablename__ = "revoked_tokens"
+    jti = Column(String(32), primary_key=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    revoked_at = Column(
+        DateTime,
+        nullable=False,
+        index=True,
+        server_default=text("CURRENT_TIMESTAMP"),
+    )
@@ -4,6 +4,7 @@ from sqlalchemy import (
     String,
     Float,
     ForeignKey,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import relationship
 from models.base import Base
@@ -19,10 +20,20 @@ class Ticket(Base):
     extra_baggage_kg = Column(Integer, default=0)
     final_price = Column(Float, nullable=False)
 
-    booking_id = Column(Integer, ForeignKey("bookings.id"), nullable=False)
-    flight_id = Column(Integer, ForeignKey("flights.id"), nullable=False)
+    booking_id = Column(Integer, ForeignKey("bookings.id"), nullable=False, index=True)
+    flight_id = Column(Integer, ForeignKey("flight_registry.id"), nullable=False)
     ticket_type_id = Column(Integer, ForeignKey("ticket_types.id"), nullable=False)
 
     booking = relationship("Booking", back_populates="tickets")
-    flight = relationship("Flight", back_populates="tickets")
+    flight = relationship(
+        "Flight",
+        primaryjoin="Flight.id == foreign(Ticket.flight_id)",
+        back_populates="tickets",
+    )
     ticket_type = relationship("TicketType")
+
+    __table_args__ = (
+        UniqueConstraint(
+            "flight_id", "seat_number", name="uq_tickets_flight_id_seat_number"
+        ),
+    )
@@ -0,0 +1,18 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Float, Integer, String
+from models.base import Base
+
+
+class TicketArchive(Base):
+    """Tickets of archived bookings, moved out of ``tickets``."""
+
+    __tablename__ = "tickets_archive"
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    passenger_name = Column(String, nullable=False)
+    seat_number = Column(String, nullable=True)
+    extra_baggage_kg = Column(Integer, default=0)
+    final_price = Column(Float, nullable=False)
+    booking_id = Column(Integer, nullable=False, index=True)
+    flight_id = Column(Integer, nullable=False)
+    ticket_type_id = Column(Integer, nullable=False)
+    archived_at = Column(DateTime, default=datetime.now, nullable=False)
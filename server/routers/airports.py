@@ -1,10 +1,32 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from typing import List
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from config import settings
+from core.fast_json import prebuilt_json_response
+from core.profiler import ProfilingRoute
 from database import get_db
 from models.airport import Airport
 
-router = APIRouter()
+router = APIRouter(route_class=ProfilingRoute)
+
+_airports = Airport.__table__.c
+
+
+def _airport_rows(db: Session, criterion=None) -> list[dict]:
+    """Airport response dicts built from Core row tuples (no ORM instances)."""
+    stmt = select(_airports.id, _airports.name, _airports.city)
+    if criterion is not None:
+        stmt = stmt.where(criterion)
+    return [
+        {
+            "id": airport_id,
+            "name": name,
+            "city": city,
+            "display": f"{city} ({airport_id}) - {name}",
+        }
+        for airport_id, name, city in db.execute(stmt)
+    ]
 
 
 @router.get(
@@ -14,8 +36,10 @@ router = APIRouter()
     description="Lấy danh sách tất cả sân bay",
     response_model=List[dict],
 )
-def get_airports(db: Session = Depends(get_db)):
+def get_airports(request: Request, db: Session = Depends(get_db)):
     """Lấy danh sách tất cả sân bay"""
+    if settings.LIST_FAST_PATH:
+        return prebuilt_json_response(request, _airport_rows(db))
     airports = db.query(Airport).all()
     return [
         {
@@ -35,8 +59,16 @@ def get_airports(db: Session = Depends(get_db)):
     description="Tìm kiếm sân bay theo tên thành phố hoặc tên sân bay",
     response_model=List[dict],
 )
-def search_airports(q: str, db: Session = Depends(get_db)):
+def search_airports(request: Request, q: str, db: Session = Depends(get_db)):
     """Tìm kiếm sân bay theo query string"""
+    if settings.LIST_FAST_PATH:
+        criterion = (
+            Airport.name.ilike(f"%{q}%")
+            | Airport.city.ilike(f"%{q}%")
+            | Airport.id.ilike(f"%{q}%")
+        )
+        return prebuilt_json_response(request, _airport_rows(db, criterion))
+
     airports = db.query(Airport).filter(
         Airport.name.ilike(f"%{q}%") | 
         Airport.city.ilike(f"%{q}%") |
@@ -1,10 +1,25 @@
-from fastapi import APIRouter, Depends, status
+from typing import Mapping
+
+from fastapi import APIRouter, Body, Depends, status
 from core.jwt_helper import create_access_token
+from core.profiler import ProfilingRoute
+from dependencies.auth import get_current_token_claims
 
-from schemas.auth import UserRegister, UserResponse, UserLogin, TokenResponse
+from schemas.auth import (
+    UserRegister,
+    UserResponse,
+    UserLogin,
+    TokenResponse,
+    RefreshTokenRequest,
+    LogoutRequest,
+)
 from services.auth_service import AuthService, get_auth_service
+from services.refresh_token_service import (
+    RefreshTokenService,
+    get_refresh_token_service,
+)
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+router = APIRouter(prefix="/auth", tags=["Authentication"], route_class=ProfilingRoute)
 
 
 @router.post(
@@ -73,7 +88,8 @@ def register_user(
     - **email**: Email đã đăng ký
     - **password**: Mật khẩu tương ứng
     
-    **Response**: JWT access token để sử dụng cho các API khác
+    **Response**: JWT access token để sử dụng cho các API khác và refresh token
+    để lấy access token mới qua `/auth/refresh`
     """,
     responses={
         200: {
@@ -82,6 +98,7 @@ def register_user(
                 "application/json": {
                     "example": {
                         "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+                        "refresh_token": "q3Yx0p9Jc2T1...",
                         "token_type": "bearer"
                     }
                 }
@@ -100,7 +117,9 @@ def register_user(
     }
 )
 def login_user(
-    login_data: UserLogin, auth_service: AuthService = Depends(get_auth_service)
+    login_data: UserLogin,
+    auth_service: AuthService = Depends(get_auth_service),
+    refresh_token_service: RefreshTokenService = Depends(get_refresh_token_service),
 ):
     """
     Đăng nhập người dùng.
@@ -109,4 +128,79 @@ def login_user(
     """
     user = auth_service.authenticate_user(login_data)
     access_token = create_access_token(data={"sub": user.email})
-    return TokenResponse(access_token=access_token, token_type="bearer")
+    refresh_token = refresh_token_service.issue_refresh_token(user.id)
+    return TokenResponse(
+        access_token=access_token, refresh_token=refresh_token, token_type="bearer"
+    )
+
+
+@router.post(
+    "/refresh",
+    response_model=TokenResponse,
+    summary="Làm mới access token",
+    description="""
+    Đổi refresh token lấy access token mới mà không cần đăng nhập lại.
+
+    - **refresh_token**: Refresh token nhận được khi đăng nhập hoặc lần làm mới trước
+
+    Mỗi refresh token chỉ dùng được một lần. Nếu một refresh token đã dùng bị gửi
+    lại, toàn bộ chuỗi token của lần đăng nhập đó sẽ bị thu hồi.
+
+    **Response**: Access token mới và refresh token mới
+    """,
+    responses={
+        401: {
+            "description": "Refresh token không hợp lệ, đã hết hạn hoặc đã bị thu hồi",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Invalid or expired refresh token"
+                    }
+                }
+            }
+        }
+    }
+)
+def refresh_access_token(
+    refresh_data: RefreshTokenRequest,
+    refresh_token_service: RefreshTokenService = Depends(get_refresh_token_service),
+):
+    """
+    Làm mới access token bằng refresh token.
+    """
+    email, refresh_token = refresh_token_service.rotate_refresh_token(
+        refresh_data.refresh_token
+    )
+    access_token = create_access_token(data={"sub": email})
+    return TokenResponse(
+        access_token=access_token, refresh_token=refresh_token, token_type="bearer"
+    )
+
+
+@router.post(
+    "/logout",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Đăng xuất",
+    description="""
+    Thu hồi access token hiện tại ngay lập tức (không cần đợi hết hạn).
+
+    - **refresh_token** (tùy chọn): Refresh token cần thu hồi cùng lúc
+    """,
+    responses={
+        401: {
+            "description": "Token không hợp lệ hoặc đã hết hạn",
+        }
+    }
+)
+def logout_user(
+    logout_data: LogoutRequest | None = Body(default=None),
+    claims: Mapping = Depends(get_current_token_claims),
+    auth_service: AuthService = Depends(get_auth_service),
+    refresh_token_service: RefreshTokenService = Depends(get_refresh_token_service),
+):
+    """
+    Đăng xuất người dùng.
+    """
+    auth_service.revoke_access_token(claims)
+    if logout_data and logout_data.refresh_token:
+        refresh_token_service.revoke_refresh_token(logout_data.refresh_token)
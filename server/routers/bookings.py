@@ -0,0 +1,163 @@
+from fastapi import APIRouter, Depends, Response, status
+
+from core.principal_cache import Principal
+from core.profiler import ProfilingRoute
+from dependencies.auth import get_current_principal
+from schemas.booking import (
+    BookingCreate,
+    BookingResponse,
+    GroupBookingCreate,
+    TicketResponse,
+)
+from schemas.seat_map import SeatAssign
+from schemas.error import Error
+from services.bookings_service import BookingsService, get_bookings_service
+
+router = APIRouter(route_class=ProfilingRoute)
+
+
+@router.post(
+    "",
+    response_model=BookingResponse,
+    status_code=status.HTTP_201_CREATED,
+    name="Đặt vé",
+    description="""
+    Đặt vé cho một hoặc nhiều hành khách (tối đa 9) trên cùng một chuyến bay.
+
+    - **flight_id**: ID chuyến bay
+    - **ticket_type_id**: ID loại vé
+    - **passengers**: Danh sách hành khách
+
+    Ghế được giữ ngay khi đặt, booking ở trạng thái **Pending** cho đến
+    `hold_expires_at`. Booking chưa xác nhận sẽ tự động bị hủy khi hết hạn.
+    """,
+    responses={
+        400: {"description": "Chuyến bay không còn mở bán", "model": Error},
+        401: {"description": "Chưa đăng nhập", "model": Error},
+        404: {"description": "Chuyến bay hoặc loại vé không tồn tại", "model": Error},
+        409: {"description": "Không đủ ghế trống", "model": Error},
+    },
+)
+def create_booking(
+    booking_data: BookingCreate,
+    principal: Principal = Depends(get_current_principal),
+    bookings_service: BookingsService = Depends(get_bookings_service),
+):
+    """
+    Đặt vé và giữ ghế cho tất cả hành khách trong một giao dịch.
+    """
+    return bookings_service.create_booking(principal.id, booking_data)
+
+
+@router.post(
+    "/group",
+    response_model=BookingResponse,
+    status_code=status.HTTP_201_CREATED,
+    name="Đặt vé theo nhóm",
+    description="""
+    Đặt vé cho đoàn từ 10 đến 200 hành khách trên cùng một chuyến bay.
+
+    - **flight_id**: ID chuyến bay
+    - **ticket_type_id**: Loại vé mặc định
+    - **passengers**: Danh sách hành khách, mỗi người có thể chọn `ticket_type_id` riêng
+
+    Tất cả vé được tạo và giữ chỗ trong một giao dịch: hoặc đủ ghế cho cả đoàn,
+    hoặc không tạo vé nào.
+    """,
+    responses={
+        400: {"description": "Chuyến bay không còn mở bán", "model": Error},
+        401: {"description": "Chưa đăng nhập", "model": Error},
+        404: {"description": "Chuyến bay hoặc loại vé không tồn tại", "model": Error},
+        409: {"description": "Không đủ ghế trống", "model": Error},
+    },
+)
+def create_group_booking(
+    booking_data: GroupBookingCreate,
+    principal: Principal = Depends(get_current_principal),
+    bookings_service: BookingsService = Depends(get_bookings_service),
+):
+    """
+    Đặt vé theo nhóm.
+    """
+    return bookings_service.create_group_booking(principal.id, booking_data)
+
+
+@router.post(
+    "/{booking_id}/confirm",
+    response_model=BookingResponse,
+    name="Xác nhận booking",
+    description="Xác nhận booking đang giữ chỗ. Phải gọi trước `hold_expires_at`.",
+    responses={
+        401: {"description": "Chưa đăng nhập", "model": Error},
+        404: {"description": "Booking không tồn tại", "model": Error},
+        409: {"description": "Booking đã hết hạn giữ chỗ hoặc đã bị hủy", "model": Error},
+    },
+)
+def confirm_booking(
+    booking_id: int,
+    principal: Principal = Depends(get_current_principal),
+    bookings_service: BookingsService = Depends(get_bookings_service),
+):
+    """
+    Xác nhận booking.
+    """
+    return bookings_service.confirm_booking(principal.id, booking_id)
+
+
+@router.put(
+    "/{booking_id}/tickets/{ticket_id}/seat",
+    response_model=TicketResponse,
+    name="Chọn ghế",
+    description="""
+    Chọn hoặc đổi ghế cho một vé. Ghế cũ (nếu có) được trả lại cùng lúc.
+
+    - **seat_number**: Số ghế theo sơ đồ ghế của chuyến bay, VD: A23
+    """,
+    responses={
+        400: {"description": "Số ghế không hợp lệ hoặc booking đã bị hủy", "model": Error},
+        401: {"description": "Chưa đăng nhập", "model": Error},
+        404: {"description": "Vé không tồn tại", "model": Error},
+        409: {
+            "description": "Ghế đã có người chọn, hoặc booking đã hết hạn giữ chỗ",
+            "model": Error,
+        },
+    },
+)
+def assign_seat(
+    booking_id: int,
+    ticket_id: int,
+    seat_data: SeatAssign,
+    principal: Principal = Depends(get_current_principal),
+    bookings_service: BookingsService = Depends(get_bookings_service),
+):
+    """
+    Chọn ghế cho vé.
+    """
+    return bookings_service.assign_seat(
+        principal.id, booking_id, ticket_id, seat_data.seat_number
+    )
+
+
+@router.delete(
+    "/{booking_id}/tickets/{ticket_id}/seat",
+    status_code=status.HTTP_204_NO_CONTENT,
+    name="Bỏ chọn ghế",
+    description="Trả lại ghế đã chọn của một vé",
+    responses={
+        400: {"description": "Booking đã bị hủy", "model": Error},
+        401: {"description": "Chưa đăng nhập", "model": Error},
+        404: {"description": "Vé không tồn tại", "model": Error},
+        409: {"description": "Booking đã hết hạn giữ chỗ", "model": Error},
+    },
+)
+def release_seat(
+    booking_id: int,
+    ticket_id: int,
+    principal: Principal = Depends(get_current_principal),
+    bookings_service: BookingsService = Depends(get_bookings_service),
+):
+    """
+    Bỏ chọn ghế của vé.
+    """
+    bookings_service.release_seat(principal.id, booking_id, ticket_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
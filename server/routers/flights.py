@@ -1,12 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from typing import List
 from datetime import date, datetime
 
+from config import settings
+from core.fast_json import prebuilt_json_response
+from core.profiler import ProfilingRoute
+from core.seat_map import encode_bitmap, row_count
 from schemas import Flight
+from schemas.seat_map import SeatMap
 from services.flights_service import FlightsService, get_flights_service
 from schemas.error import Error
+from services.inventory_service import InventoryService, get_inventory_service
 
-router = APIRouter()
+router = APIRouter(route_class=ProfilingRoute)
 
 
 @router.get(
@@ -26,6 +34,7 @@ router = APIRouter()
     },
 )
 def read_flights(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
     flight_date: str | None = Query(
@@ -54,6 +63,16 @@ def read_flights(
                 detail="Định dạng ngày không hợp lệ. Vui lòng sử dụng định dạng dd/MM/yyyy.",
             )
 
+    if settings.LIST_FAST_PATH:
+        rows = flights_service.get_flight_rows(
+            skip=skip,
+            limit=limit,
+            flight_date=parsed_date,
+            departure_airport_id=departure_airport_id,
+            arrival_airport_id=arrival_airport_id,
+        )
+        return prebuilt_json_response(request, rows)
+
     flights = flights_service.get_flights(
         skip=skip,
         limit=limit,
@@ -64,6 +83,48 @@ def read_flights(
     return flights
 
 
+@router.get(
+    "/{flight_id}/seat-map",
+    tags=["Chuyến bay"],
+    name="Lấy sơ đồ ghế của chuyến bay",
+    description="Sơ đồ ghế dạng bitmap (mỗi ghế một bit). Hỗ trợ ETag/If-None-Match "
+    "để tải lại rẻ khi sơ đồ không đổi.",
+    response_model=SeatMap,
+    responses={
+        404: {
+            "description": "Chuyến bay không tồn tại",
+            "model": Error,
+        },
+    },
+)
+def read_seat_map(
+    flight_id: int,
+    request: Request,
+    inventory_service: InventoryService = Depends(get_inventory_service),
+):
+    seat_map = inventory_service.get_seat_map(flight_id)
+    if seat_map is None:
+        raise HTTPException(status_code=404, detail="Chuyến bay không tồn tại")
+    capacity, bits = seat_map
+    columns = settings.SEAT_COLUMNS
+    etag = '"' + hashlib.sha256(f"{columns}:{bits}".encode()).hexdigest()[:32] + '"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response = prebuilt_json_response(
+        request,
+        {
+            "flightId": flight_id,
+            "capacity": capacity,
+            "columns": columns,
+            "rows": row_count(capacity, columns),
+            "available": capacity - bits.count("1"),
+            "bitmap": encode_bitmap(bits),
+        },
+    )
+    response.headers["ETag"] = etag
+    return response
+
+
 @router.get(
     "/{flight_id_or_number}",
     tags=["Chuyến bay"],
@@ -0,0 +1,62 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from core.access_log import access_log
+from core.archive import flight_archiver
+from core.booking_holds import booking_holds
+from core.flight_partitions import flight_partitions
+from core.idempotency import idempotency_store
+from core.last_login import last_login_buffer
+from core.principal_cache import principal_cache
+from core.profiler import profile_store
+from core.revocation import revocation_list
+from core.token_cache import token_cache
+from database import engine, replicas, session_usage
+from dependencies.internal import require_internal_token
+
+router = APIRouter(dependencies=[Depends(require_internal_token)])
+
+
+@router.get(
+    "/stats",
+    name="Thống kê nội bộ",
+    description="Thống kê connection pool và các cache trong process hiện tại",
+)
+async def get_internal_stats():
+    return {
+        "db_pool": engine.pool.snapshot(),
+        "db_replicas": replicas.stats(),
+        "db_sessions": session_usage.snapshot(),
+        "token_cache": token_cache.stats(),
+        "principal_cache": principal_cache.stats(),
+        "last_login_buffer": last_login_buffer.stats(),
+        "revocation_list": revocation_list.stats(),
+        "booking_holds": booking_holds.stats(),
+        "idempotency": idempotency_store.stats(),
+        "flight_partitions": flight_partitions.stats(),
+        "flight_archive": flight_archiver.stats(),
+        "profiler": profile_store.stats(),
+        "access_log": access_log.stats(),
+    }
+
+
+@router.get(
+    "/profiles",
+    name="Danh sách profile",
+    description="Các request đã được profile gần đây, mới nhất trước",
+)
+async def list_profiles():
+    return profile_store.recent()
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    name="Chi tiết profile",
+    description="Các hàm tốn thời gian nhất (theo cumulative time) của một request đã profile",
+)
+async def get_profile(profile_id: str):
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Không tìm thấy profile"
+        )
+    return profile
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, Query
+
+from core.principal_cache import Principal
+from core.profiler import ProfilingRoute
+from dependencies.auth import get_current_principal
+from schemas.booking import BookingHistoryPage
+from schemas.error import Error
+from services.bookings_service import BookingsService, get_bookings_service
+
+router = APIRouter(route_class=ProfilingRoute)
+
+
+@router.get(
+    "/bookings",
+    response_model=BookingHistoryPage,
+    name="Lịch sử đặt vé",
+    description="""
+    Danh sách booking của người dùng hiện tại, mới nhất trước, kèm vé và thông tin chuyến bay.
+
+    - **limit**: Số booking mỗi trang
+    - **cursor**: Giá trị `next_cursor` của trang trước
+    """,
+    responses={
+        400: {"description": "Cursor không hợp lệ", "model": Error},
+        401: {"description": "Chưa đăng nhập", "model": Error},
+    },
+)
+def read_my_bookings(
+    limit: int = Query(default=20, ge=1, le=100, description="Số booking mỗi trang"),
+    cursor: str | None = Query(default=None, description="Cursor của trang tiếp theo"),
+    principal: Principal = Depends(get_current_principal),
+    bookings_service: BookingsService = Depends(get_bookings_service),
+):
+    """
+    Lấy lịch sử đặt vé.
+    """
+    return bookings_service.list_user_bookings(principal.id, limit=limit, cursor=cursor)
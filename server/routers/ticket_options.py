@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Path
 from typing import List
 
+from core.profiler import ProfilingRoute
 from schemas.ticket_type import TicketTypeWithPrice
 from schemas.error import Error
 from services.ticket_types_service import TicketTypesService, get_ticket_types_service
@@ -10,7 +11,7 @@ from services.addon_options_service import (
 )
 from schemas.addon_option import AddonOptionsGroupedByCategory, AddonOptionResponse
 
-router = APIRouter()
+router = APIRouter(route_class=ProfilingRoute)
 
 
 @router.get(
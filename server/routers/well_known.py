@@ -0,0 +1,39 @@
+import hashlib
+import json
+from fastapi import APIRouter, Request, Response
+
+from config import settings
+from core.jwt_helper import get_key_ring
+from core.profiler import ProfilingRoute
+
+router = APIRouter(route_class=ProfilingRoute)
+
+# (key ring fingerprint, body, etag) of the last rendered JWKS document
+_jwks_cache: tuple[str, bytes, str] | None = None
+
+
+def _render_jwks() -> tuple[bytes, str]:
+    global _jwks_cache
+    key_ring = get_key_ring()
+    if _jwks_cache is None or _jwks_cache[0] != key_ring.fingerprint:
+        body = json.dumps(key_ring.jwks(), separators=(",", ":")).encode()
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        _jwks_cache = (key_ring.fingerprint, body, etag)
+    return _jwks_cache[1], _jwks_cache[2]
+
+
+@router.get(
+    "/jwks.json",
+    name="Lấy danh sách public key (JWKS)",
+    description="Public key dùng để xác thực access token (theo `kid`). "
+    "Các service khác có thể cache và tự xác thực token mà không cần gọi API này.",
+)
+def get_jwks(request: Request):
+    body, etag = _render_jwks()
+    headers = {
+        "Cache-Control": f"public, max-age={settings.JWKS_CACHE_MAX_AGE_SECONDS}",
+        "ETag": etag,
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,7 +1,24 @@
 # flake8: noqa
-from .auth import UserRegister, UserLogin, UserResponse, TokenResponse
+from .auth import (
+    UserRegister,
+    UserLogin,
+    UserResponse,
+    TokenResponse,
+    RefreshTokenRequest,
+    LogoutRequest,
+)
 from .error import Error
 from .flight import Flight, FlightBase, FlightCreate
 from .ticket_type import TicketType, TicketTypeBase, TicketTypeWithPrice
 from .addon_option import AddonOption, AddonOptionBase
 from .ticket_type import TicketType, TicketTypeBase, TicketTypeWithPrice
+from .booking import (
+    BookingCreate,
+    BookingHistoryPage,
+    BookingResponse,
+    GroupBookingCreate,
+    GroupPassengerCreate,
+    PassengerCreate,
+    TicketResponse,
+)
+from .seat_map import SeatMap, SeatAssign
@@ -72,4 +72,24 @@ class TokenResponse(BaseModel):
     """Schema for token response after login."""
 
     access_token: str
+    refresh_token: str | None = None
     token_type: str = "bearer"
+
+
+class RefreshTokenRequest(BaseModel):
+    """Schema for exchanging a refresh token."""
+
+    refresh_token: str = Field(
+        ...,
+        min_length=1,
+        description="Refresh token nhận được khi đăng nhập hoặc làm mới token",
+    )
+
+
+class LogoutRequest(BaseModel):
+    """Schema for logout request."""
+
+    refresh_token: str | None = Field(
+        default=None,
+        description="Refresh token cần thu hồi cùng với access token hiện tại",
+    )
@@ -0,0 +1,125 @@
+from datetime import datetime
+from pydantic import BaseModel, Field
+from models.booking import BookingStatus
+from models.flight import FlightStatus
+
+# Larger parties go through group booking
+MAX_PASSENGERS_PER_BOOKING = 9
+MIN_GROUP_PASSENGERS = 10
+MAX_GROUP_PASSENGERS = 200
+
+
+class PassengerCreate(BaseModel):
+    """Schema for one passenger of a booking request."""
+
+    passenger_name: str = Field(
+        ...,
+        min_length=1,
+        description="Họ tên hành khách",
+        example="Nguyễn Văn A"
+    )
+
+
+class BookingCreate(BaseModel):
+    """Schema for booking request."""
+
+    flight_id: int = Field(..., description="ID chuyến bay", example=1)
+    ticket_type_id: int = Field(..., description="ID loại vé", example=1)
+    passengers: list[PassengerCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_PASSENGERS_PER_BOOKING,
+        description=f"Danh sách hành khách (tối đa {MAX_PASSENGERS_PER_BOOKING} người)",
+    )
+
+
+class GroupPassengerCreate(PassengerCreate):
+    """Schema for one passenger of a group booking request."""
+
+    ticket_type_id: int | None = Field(
+        None, description="Loại vé riêng cho hành khách này (mặc định theo booking)"
+    )
+
+
+class GroupBookingCreate(BaseModel):
+    """Schema for group booking request."""
+
+    flight_id: int = Field(..., description="ID chuyến bay", example=1)
+    ticket_type_id: int = Field(
+        ..., description="Loại vé mặc định cho các hành khách", example=1
+    )
+    passengers: list[GroupPassengerCreate] = Field(
+        ...,
+        min_length=MIN_GROUP_PASSENGERS,
+        max_length=MAX_GROUP_PASSENGERS,
+        description=f"Danh sách hành khách ({MIN_GROUP_PASSENGERS}-{MAX_GROUP_PASSENGERS} người)",
+    )
+
+
+class TicketResponse(BaseModel):
+    """Schema for a ticket of a booking."""
+
+    id: int
+    passenger_name: str
+    seat_number: str | None = None
+    extra_baggage_kg: int | None = None
+    final_price: float
+    flight_id: int
+    ticket_type_id: int
+
+    class Config:
+        from_attributes = True
+
+
+class BookingResponse(BaseModel):
+    """Schema for booking response."""
+
+    id: int
+    booking_time: datetime
+    total_price: float
+    status: BookingStatus
+    hold_expires_at: datetime | None = Field(
+        None, description="Thời điểm hết hạn giữ chỗ nếu chưa xác nhận"
+    )
+    tickets: list[TicketResponse]
+
+    class Config:
+        from_attributes = True
+
+
+class FlightSummary(BaseModel):
+    """Schema for the flight of a ticket in the booking history."""
+
+    id: int
+    flight_number: str
+    departure_time: datetime
+    arrival_time: datetime
+    departure_airport_id: str
+    arrival_airport_id: str
+    status: FlightStatus
+
+
+class BookingHistoryTicket(TicketResponse):
+    """Schema for a ticket with its flight in the booking history."""
+
+    flight: FlightSummary
+
+
+class BookingHistoryItem(BaseModel):
+    """Schema for one booking in the booking history."""
+
+    id: int
+    booking_time: datetime
+    total_price: float
+    status: BookingStatus
+    hold_expires_at: datetime | None = None
+    tickets: list[BookingHistoryTicket]
+
+
+class BookingHistoryPage(BaseModel):
+    """Schema for one page of the booking history."""
+
+    items: list[BookingHistoryItem]
+    next_cursor: str | None = Field(
+        None, description="Truyền vào `cursor` để lấy trang tiếp theo, null nếu đã hết"
+    )
@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+
+
+class SeatMap(BaseModel):
+    """Schema for the seat map of a flight."""
+
+    flight_id: int
+    capacity: int = Field(..., description="Tổng số ghế")
+    columns: str = Field(..., description="Các cột ghế trong một hàng, VD: ABCDEF")
+    rows: int = Field(..., description="Số hàng ghế")
+    available: int = Field(..., description="Số ghế chưa được chọn")
+    bitmap: str = Field(
+        ...,
+        description="Base64 của chuỗi bit, mỗi ghế một bit theo thứ tự A1, B1, ..., A2, ... "
+        "(bit cao trước, 1 = đã có người chọn)",
+    )
+
+
+class SeatAssign(BaseModel):
+    """Schema for seat selection request."""
+
+    seat_number: str = Field(
+        ...,
+        min_length=2,
+        max_length=5,
+        description="Số ghế",
+        example="A23"
+    )
@@ -3,3 +3,6 @@ from .ticket_types_service import TicketTypesService
 from .flights_service import FlightsService
 from .auth_service import AuthService
 from .addon_options_service import AddonOptionsService
+from .refresh_token_service import RefreshTokenService
+from .inventory_service import InventoryService
+from .bookings_service import BookingsService
@@ -1,14 +1,39 @@
 from datetime import datetime
+from typing import Mapping
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 
+from core.last_login import last_login_buffer
+from core.revocation import revocation_list
 from models.user import User
-from schemas.auth import UserRegister, UserLogin
+from schemas.auth import UserRegister, UserLogin, UserResponse
 from database import get_db
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Unique indexes on users -> error message returned to the client
+UNIQUE_VIOLATION_MESSAGES = {
+    "ix_users_email": "Email already registered",
+    "ix_users_phone_number": "Phone number already registered",
+}
+
+
+def _unique_violation_detail(error: IntegrityError) -> str | None:
+    """Map a unique violation to its client message using the constraint name."""
+    diag = getattr(error.orig, "diag", None)
+    constraint_name = getattr(diag, "constraint_name", None)
+    if constraint_name:
+        return UNIQUE_VIOLATION_MESSAGES.get(constraint_name)
+    # Drivers without diagnostics only expose the constraint in the message
+    message = str(error.orig)
+    for name, detail in UNIQUE_VIOLATION_MESSAGES.items():
+        if name in message:
+            return detail
+    return None
+
 
 class AuthService:
     def __init__(self, db: Session):
@@ -22,42 +47,49 @@ class AuthService:
         """Verify a password against its hash."""
         return pwd_context.verify(plain_password, hashed_password)
 
-    def register_new_user(self, user_data: UserRegister) -> User:
-        """Register a new user."""
-        # Check email exists
-        if self.db.query(User).filter(User.email == user_data.email).first():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered",
+    def register_new_user(self, user_data: UserRegister) -> UserResponse:
+        """Register a new user.
+
+        Uniqueness of email/phone number is enforced by the unique indexes on
+        ``users``, so registration is a single ``INSERT ... RETURNING``.
+        """
+        stmt = (
+            insert(User)
+            .values(
+                email=user_data.email,
+                hashed_password=self.get_password_hash(user_data.password),
+                full_name=user_data.full_name,
+                phone_number=user_data.phone_number,
+                created_at=datetime.now(),
+                is_active=True,
+                is_verified=False,
             )
-
-        # Check phone number exists
-        if (
-            self.db.query(User)
-            .filter(User.phone_number == user_data.phone_number)
-            .first()
-        ):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Phone number already registered",
+            .returning(
+                User.id,
+                User.email,
+                User.full_name,
+                User.phone_number,
+                User.is_active,
+                User.is_verified,
+                User.created_at,
             )
-
-        # Create user
-        user = User(
-            email=user_data.email,
-            hashed_password=self.get_password_hash(user_data.password),
-            full_name=user_data.full_name,
-            phone_number=user_data.phone_number,
-            created_at=datetime.now(),
-            is_active=True,
-            is_verified=False,
         )
 
         try:
-            self.db.add(user)
+            row = self.db.execute(stmt).one()
             self.db.commit()
-            self.db.refresh(user)
-            return user
+        except IntegrityError as e:
+            self.db.rollback()
+            detail = _unique_violation_detail(e)
+            if detail is None:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Could not register user",
+                ) from e
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=detail,
+            ) from e
         except Exception as e:
             self.db.rollback()
             raise HTTPException(
@@ -65,6 +97,8 @@ class AuthService:
                 detail="Could not register user",
             ) from e
 
+        return UserResponse.model_validate(row)
+
     def authenticate_user(self, login_data: UserLogin) -> User:
         """Authenticate a user for login."""
         # Find user by email
@@ -90,18 +124,18 @@ class AuthService:
                 detail="Incorrect email or password",
             )
 
-        # Update last login time
-        try:
-            user.last_login_at = datetime.now()
-            self.db.commit()
-            self.db.refresh(user)
-        except Exception:
-            self.db.rollback()
-            # Don't fail login if we can't update last_login_at
-            pass
+        # Update last login time (written in batches by the background flusher)
+        last_login_buffer.record(user.id, datetime.now())
 
         return user
 
+    def revoke_access_token(self, claims: Mapping) -> None:
+        """Revoke an access token before its expiry (logout/compromise)."""
+        jti = claims.get("jti")
+        exp = claims.get("exp")
+        if jti and exp:
+            revocation_list.revoke(self.db, jti, exp)
+
 
 def get_auth_service(db: Session = Depends(get_db)):
     return AuthService(db)
@@ -0,0 +1,468 @@
+import base64
+from datetime import datetime, timedelta
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy import insert, select, tuple_, union_all, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session, selectinload
+
+from config import settings
+from core.booking_holds import booking_holds
+from core.seat_map import seat_index, seat_label
+from database import get_db
+from models.booking import Booking, BookingStatus
+from models.booking_archive import BookingArchive
+from models.flight import Flight, FlightStatus
+from models.flight_archive import FlightArchive
+from models.ticket import Ticket
+from models.ticket_archive import TicketArchive
+from models.ticket_type import TicketType
+from schemas.booking import (
+    BookingCreate,
+    BookingHistoryItem,
+    BookingHistoryPage,
+    BookingHistoryTicket,
+    BookingResponse,
+    FlightSummary,
+    GroupBookingCreate,
+    TicketResponse,
+)
+from services.inventory_service import InventoryService
+from services.ticket_types_service import TicketTypesService
+
+BOOKABLE_FLIGHT_STATUSES = (
+    FlightStatus.SCHEDULED,
+    FlightStatus.ON_TIME,
+    FlightStatus.DELAYED,
+)
+# Columns shared by tickets and tickets_archive
+TICKET_COLUMNS = [column.name for column in Ticket.__table__.c]
+
+
+class BookingsService:
+    """Service class for handling booking operations"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.inventory = InventoryService(db)
+
+    def create_booking(self, user_id: int, booking_data: BookingCreate) -> BookingResponse:
+        """Tạo booking ở trạng thái chờ và giữ ghế cho tất cả hành khách"""
+        return self._create_pending_booking(
+            user_id,
+            booking_data.flight_id,
+            [
+                (passenger.passenger_name, booking_data.ticket_type_id)
+                for passenger in booking_data.passengers
+            ],
+        )
+
+    def create_group_booking(
+        self, user_id: int, booking_data: GroupBookingCreate
+    ) -> BookingResponse:
+        """Tạo booking nhóm, mỗi hành khách có thể chọn loại vé riêng"""
+        return self._create_pending_booking(
+            user_id,
+            booking_data.flight_id,
+            [
+                (
+                    passenger.passenger_name,
+                    passenger.ticket_type_id or booking_data.ticket_type_id,
+                )
+                for passenger in booking_data.passengers
+            ],
+        )
+
+    def _create_pending_booking(
+        self, user_id: int, flight_id: int, passengers: list[tuple[str, int]]
+    ) -> BookingResponse:
+        """Insert a pending booking with one ticket per (passenger name, ticket type).
+
+        Prices are computed once per ticket type. The booking and all of its
+        tickets are two INSERT statements, whatever the number of
+        passengers, followed by one inventory update.
+        """
+        flight = self.db.execute(
+            select(Flight.base_price, Flight.status, Flight.departure_time).where(
+                Flight.id == flight_id
+            )
+        ).first()
+        if flight is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Chuyến bay không tồn tại",
+            )
+        if (
+            flight.status not in BOOKABLE_FLIGHT_STATUSES
+            or flight.departure_time <= datetime.now()
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Chuyến bay không còn mở bán",
+            )
+
+        ticket_type_ids = {ticket_type_id for _, ticket_type_id in passengers}
+        prices = {
+            ticket_type_id: TicketTypesService.calculate_ticket_price(
+                flight.base_price, price_multiplier
+            )
+            for ticket_type_id, price_multiplier in self.db.execute(
+                select(TicketType.id, TicketType.price_multiplier).where(
+                    TicketType.id.in_(ticket_type_ids)
+                )
+            )
+        }
+        if len(prices) != len(ticket_type_ids):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Loại vé không tồn tại",
+            )
+
+        ticket_values = [
+            {
+                "passenger_name": passenger_name,
+                "extra_baggage_kg": 0,
+                "final_price": prices[ticket_type_id],
+                "flight_id": flight_id,
+                "ticket_type_id": ticket_type_id,
+            }
+            for passenger_name, ticket_type_id in passengers
+        ]
+
+        try:
+            booking = self.db.execute(
+                insert(Booking)
+                .values(
+                    user_id=user_id,
+                    total_price=round(sum(t["final_price"] for t in ticket_values), 2),
+                    status=BookingStatus.PENDING,
+                    hold_expires_at=datetime.now()
+                    + timedelta(seconds=booking_holds.ttl_seconds),
+                )
+                .returning(
+                    Booking.id,
+                    Booking.booking_time,
+                    Booking.total_price,
+                    Booking.status,
+                    Booking.hold_expires_at,
+                )
+            ).one()
+            for ticket in ticket_values:
+                ticket["booking_id"] = booking.id
+            # executemany with RETURNING: sent as one multi-row INSERT
+            tickets = self.db.execute(
+                insert(Ticket).returning(
+                    *Ticket.__table__.c, sort_by_parameter_order=True
+                ),
+                ticket_values,
+            ).all()
+            # Reserve last: the inventory row stays locked until commit
+            if not self.inventory.reserve_seats(flight_id, len(ticket_values)):
+                self.db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Không đủ ghế trống cho chuyến bay này",
+                )
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+        booking_holds.record_hold()
+        return BookingResponse(
+            **booking._mapping,
+            tickets=[TicketResponse.model_validate(ticket) for ticket in tickets],
+        )
+
+    def confirm_booking(self, user_id: int, booking_id: int) -> BookingResponse:
+        """Xác nhận booking đang giữ chỗ trước khi hết hạn"""
+        confirmed = self.db.execute(
+            update(Booking)
+            .where(
+                Booking.id == booking_id,
+                Booking.user_id == user_id,
+                Booking.status == BookingStatus.PENDING,
+                Booking.hold_expires_at > datetime.now(),
+            )
+            .values(status=BookingStatus.CONFIRMED, hold_expires_at=None)
+            .returning(Booking.id)
+        ).first()
+        if confirmed is not None:
+            self.db.commit()
+            booking_holds.record_confirm()
+        else:
+            self.db.rollback()
+
+        booking = self.get_booking(user_id, booking_id)
+        if booking is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Booking không tồn tại",
+            )
+        # Confirming twice is not an error
+        if booking.status != BookingStatus.CONFIRMED:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Booking đã hết hạn giữ chỗ hoặc đã bị hủy",
+            )
+        return booking
+
+    def get_booking(self, user_id: int, booking_id: int) -> BookingResponse | None:
+        booking = self.db.scalar(
+            select(Booking)
+            .options(selectinload(Booking.tickets))
+            .where(Booking.id == booking_id, Booking.user_id == user_id)
+        )
+        return BookingResponse.model_validate(booking) if booking else None
+
+    def list_user_bookings(
+        self, user_id: int, limit: int = 20, cursor: str | None = None
+    ) -> BookingHistoryPage:
+        """Lịch sử booking của người dùng, mới nhất trước, phân trang theo cursor
+
+        Always two queries: one page of bookings, merged from
+        ``ix_bookings_user_id_booking_time`` and its copy on
+        ``bookings_archive``, then the tickets of those bookings (hot or
+        archived) joined with their flights (hot or archived).
+        """
+        after = self._decode_cursor(cursor) if cursor else None
+        pages = []
+        for table in (Booking, BookingArchive):
+            page = (
+                select(
+                    table.id,
+                    table.booking_time,
+                    table.total_price,
+                    table.status,
+                    table.hold_expires_at,
+                )
+                .where(table.user_id == user_id)
+                .order_by(table.booking_time.desc(), table.id.desc())
+                .limit(limit + 1)
+            )
+            if after:
+                page = page.where(tuple_(table.booking_time, table.id) < after)
+            pages.append(page)
+        merged = union_all(*pages).subquery()
+        bookings = self.db.execute(
+            select(merged)
+            .order_by(merged.c.booking_time.desc(), merged.c.id.desc())
+            .limit(limit + 1)
+        ).all()
+        has_more = len(bookings) > limit
+        bookings = bookings[:limit]
+
+        tickets_by_booking: dict[int, list[BookingHistoryTicket]] = {
+            booking.id: [] for booking in bookings
+        }
+        if bookings:
+            booking_ids = list(tickets_by_booking)
+            tickets = union_all(
+                *(
+                    select(*(table.__table__.c[name] for name in TICKET_COLUMNS)).where(
+                        table.booking_id.in_(booking_ids)
+                    )
+                    for table in (Ticket, TicketArchive)
+                )
+            ).subquery()
+            flights = union_all(
+                *(
+                    select(
+                        table.id,
+                        table.flight_number,
+                        table.departure_time,
+                        table.arrival_time,
+                        table.departure_airport_id,
+                        table.arrival_airport_id,
+                        table.status.label("flight_status"),
+                    )
+                    for table in (Flight, FlightArchive)
+                )
+            ).subquery()
+            rows = self.db.execute(
+                select(
+                    tickets,
+                    flights.c.flight_number,
+                    flights.c.departure_time,
+                    flights.c.arrival_time,
+                    flights.c.departure_airport_id,
+                    flights.c.arrival_airport_id,
+                    flights.c.flight_status,
+                )
+                .join(flights, flights.c.id == tickets.c.flight_id)
+                .order_by(tickets.c.id)
+            )
+            for row in rows:
+                tickets_by_booking[row.booking_id].append(
+                    BookingHistoryTicket(
+                        id=row.id,
+                        passenger_name=row.passenger_name,
+                        seat_number=row.seat_number,
+                        extra_baggage_kg=row.extra_baggage_kg,
+                        final_price=row.final_price,
+                        flight_id=row.flight_id,
+                        ticket_type_id=row.ticket_type_id,
+                        flight=FlightSummary(
+                            id=row.flight_id,
+                            flight_number=row.flight_number,
+                            departure_time=row.departure_time,
+                            arrival_time=row.arrival_time,
+                            departure_airport_id=row.departure_airport_id,
+                            arrival_airport_id=row.arrival_airport_id,
+                            status=row.flight_status,
+                        ),
+                    )
+                )
+
+        return BookingHistoryPage(
+            items=[
+                BookingHistoryItem(
+                    **booking._mapping, tickets=tickets_by_booking[booking.id]
+                )
+                for booking in bookings
+            ],
+            next_cursor=self._encode_cursor(bookings[-1].booking_time, bookings[-1].id)
+            if has_more
+            else None,
+        )
+
+    @staticmethod
+    def _encode_cursor(booking_time: datetime, booking_id: int) -> str:
+        raw = f"{booking_time.isoformat()}|{booking_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+        try:
+            booking_time, booking_id = (
+                base64.urlsafe_b64decode(cursor.encode("ascii")).decode().split("|")
+            )
+            return datetime.fromisoformat(booking_time), int(booking_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor không hợp lệ",
+            )
+
+    def assign_seat(
+        self, user_id: int, booking_id: int, ticket_id: int, seat_number: str
+    ) -> TicketResponse:
+        """Chọn hoặc đổi ghế cho một vé của booking"""
+        ticket = self._lock_ticket(user_id, booking_id, ticket_id)
+        columns = settings.SEAT_COLUMNS
+        capacity = self.inventory.get_capacity(ticket.flight_id)
+        try:
+            seat = seat_index(seat_number, capacity or 0, columns)
+        except ValueError:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Số ghế không hợp lệ",
+            )
+        previous = self._seat_index_or_none(ticket.seat_number, capacity)
+
+        try:
+            row = self.db.execute(
+                update(Ticket)
+                .where(Ticket.id == ticket_id)
+                .values(seat_number=seat_label(seat, columns))
+                .returning(*Ticket.__table__.c)
+            ).first()
+            if seat != previous and not self.inventory.claim_seat(
+                ticket.flight_id, seat, previous
+            ):
+                self.db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Ghế đã có người chọn",
+                )
+            response = TicketResponse.model_validate(row)
+            self.db.commit()
+        except IntegrityError:
+            # uq_tickets_flight_id_seat_number: the bitmap and tickets disagree
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Ghế đã có người chọn",
+            )
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+        return response
+
+    def release_seat(self, user_id: int, booking_id: int, ticket_id: int) -> None:
+        """Bỏ chọn ghế của một vé"""
+        ticket = self._lock_ticket(user_id, booking_id, ticket_id)
+        capacity = self.inventory.get_capacity(ticket.flight_id)
+        seat = self._seat_index_or_none(ticket.seat_number, capacity)
+        try:
+            self.db.execute(
+                update(Ticket).where(Ticket.id == ticket_id).values(seat_number=None)
+            )
+            if seat is not None:
+                self.inventory.release_seat(ticket.flight_id, seat)
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+
+    def _lock_ticket(self, user_id: int, booking_id: int, ticket_id: int):
+        """Ticket of the user's active booking, locked until the transaction ends.
+
+        Seat changes of one ticket are serialized here, before the inventory
+        row is locked, so the caller's view of the previous seat is never stale.
+        The booking row is locked too, so the hold sweeper cannot cancel the
+        booking (and free its seats) while a seat is being changed; a hold
+        that has already expired is treated like a cancelled booking.
+        """
+        ticket = self.db.execute(
+            select(
+                Ticket.flight_id,
+                Ticket.seat_number,
+                Booking.status,
+                Booking.hold_expires_at,
+            )
+            .join(Booking, Booking.id == Ticket.booking_id)
+            .where(
+                Ticket.id == ticket_id,
+                Ticket.booking_id == booking_id,
+                Booking.user_id == user_id,
+            )
+            .with_for_update(of=(Ticket, Booking))
+        ).first()
+        if ticket is None:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Vé không tồn tại",
+            )
+        if ticket.status == BookingStatus.CANCELLED:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Booking đã bị hủy",
+            )
+        if (
+            ticket.status == BookingStatus.PENDING
+            and ticket.hold_expires_at is not None
+            and ticket.hold_expires_at <= datetime.now()
+        ):
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Booking đã hết hạn giữ chỗ hoặc đã bị hủy",
+            )
+        return ticket
+
+    @staticmethod
+    def _seat_index_or_none(seat_number: str | None, capacity: int | None) -> int | None:
+        if not seat_number or not capacity:
+            return None
+        try:
+            return seat_index(seat_number, capacity, settings.SEAT_COLUMNS)
+        except ValueError:
+            # Free-form seat number from before seat maps existed
+            return None
+
+
+def get_bookings_service(db: Session = Depends(get_db)):
+    return BookingsService(db)
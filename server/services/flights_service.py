@@ -1,9 +1,25 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from models.flight import Flight
 from datetime import date, timedelta
 from fastapi import Depends
 from database import get_db
 
+_flights = Flight.__table__.c
+
+# Response columns of the fast list path
+FLIGHT_LIST_COLUMNS = (
+    _flights.id,
+    _flights.flight_number,
+    _flights.departure_time,
+    _flights.arrival_time,
+    _flights.base_price,
+    _flights.status,
+    _flights.plane_id,
+    _flights.departure_airport_id,
+    _flights.arrival_airport_id,
+)
+
 
 class FlightsService:
     """Service class for handling flights operations"""
@@ -19,7 +35,65 @@ class FlightsService:
         departure_airport_id: str | None = None,
         arrival_airport_id: str | None = None,
     ):
-        query = self.db.query(Flight)
+        query = self._filter_flights(
+            self.db.query(Flight), flight_date, departure_airport_id, arrival_airport_id
+        )
+        return query.offset(skip).limit(limit).all()
+
+    def get_flight_rows(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        flight_date: date | None = None,
+        departure_airport_id: str | None = None,
+        arrival_airport_id: str | None = None,
+    ) -> list[dict]:
+        """Same filters and paging as ``get_flights``, returned as camelCase response dicts.
+
+        Selects only the response columns and builds the dicts from row
+        tuples, skipping ORM hydration and response model validation. Keys
+        follow the mapper's column order.
+        """
+        stmt = self._filter_flights(
+            select(*FLIGHT_LIST_COLUMNS),
+            flight_date,
+            departure_airport_id,
+            arrival_airport_id,
+        )
+        rows = self.db.execute(stmt.offset(skip).limit(limit))
+        return [
+            {
+                "id": flight_id,
+                "flightNumber": flight_number,
+                "departureTime": departure_time.isoformat(),
+                "arrivalTime": arrival_time.isoformat(),
+                "basePrice": base_price,
+                "status": status.value,
+                "planeId": plane_id,
+                "departureAirportId": departure_airport,
+                "arrivalAirportId": arrival_airport,
+            }
+            for (
+                flight_id,
+                flight_number,
+                departure_time,
+                arrival_time,
+                base_price,
+                status,
+                plane_id,
+                departure_airport,
+                arrival_airport,
+            ) in rows
+        ]
+
+    @staticmethod
+    def _filter_flights(
+        query,
+        flight_date: date | None,
+        departure_airport_id: str | None,
+        arrival_airport_id: str | None,
+    ):
+        """Apply the list filters to an ORM ``Query`` or a Core ``Select``."""
         if flight_date:
             query = query.filter(
                 Flight.departure_time >= flight_date,
@@ -33,7 +107,7 @@ class FlightsService:
 
         if arrival_airport_id:
             query = query.filter(Flight.arrival_airport_id == arrival_airport_id)
-        return query.offset(skip).limit(limit).all()
+        return query
 
     def get_flight_by_id_or_number(self, flight_id_or_number: str):
         try:
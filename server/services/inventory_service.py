@@ -0,0 +1,104 @@
+from fastapi import Depends
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from database import get_db
+from models.flight import Flight
+from models.flight_inventory import FlightInventory
+from models.plane import Plane
+
+# Creates the inventory row from the plane capacity on the first booking of
+# a flight that has none yet, otherwise adds to ``sold`` only while it stays
+# within capacity. ON CONFLICT ... WHERE re-checks the condition against the
+# latest row version after waiting for its lock, so concurrent bookings can
+# never oversell.
+RESERVE_SEATS_SQL = text("""
+    INSERT INTO flight_inventory (flight_id, capacity, sold, seat_bitmap)
+    SELECT f.id, p.total_seats, :count, CAST(repeat('0', p.total_seats) AS varbit)
+    FROM flights f
+    JOIN planes p ON p.id = f.plane_id
+    WHERE f.id = :flight_id AND :count <= p.total_seats
+    ON CONFLICT (flight_id) DO UPDATE
+        SET sold = flight_inventory.sold + EXCLUDED.sold
+        WHERE flight_inventory.sold + EXCLUDED.sold <= flight_inventory.capacity
+    RETURNING sold, capacity
+""")
+
+# Sets the seat's bit only if it is still clear; clears the previous seat of
+# the same ticket in the same statement, so a seat change is atomic.
+# set_bit() is strict, so a NULL :previous leaves the bitmap as it is.
+CLAIM_SEAT_SQL = text("""
+    UPDATE flight_inventory
+    SET seat_bitmap = set_bit(
+        COALESCE(set_bit(seat_bitmap, CAST(:previous AS INTEGER), 0), seat_bitmap),
+        :seat,
+        1
+    )
+    WHERE flight_id = :flight_id AND get_bit(seat_bitmap, :seat) = 0
+    RETURNING flight_id
+""")
+
+RELEASE_SEAT_SQL = text("""
+    UPDATE flight_inventory
+    SET seat_bitmap = set_bit(seat_bitmap, :seat, 0)
+    WHERE flight_id = :flight_id
+""")
+
+
+class InventoryService:
+    """Seat counts and seat maps per flight, kept in ``flight_inventory``.
+
+    Nothing here commits: reservations and seat claims are meant to run inside the caller's
+    transaction, as late as possible, because the inventory row stays
+    locked until that transaction ends.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def reserve_seats(self, flight_id: int, count: int) -> bool:
+        """Add ``count`` sold seats; False if the flight does not have that many left."""
+        row = self.db.execute(
+            RESERVE_SEATS_SQL, {"flight_id": flight_id, "count": count}
+        ).first()
+        return row is not None
+
+    def get_seat_map(self, flight_id: int) -> tuple[int, str] | None:
+        """(capacity, bitmap) of a flight, or None if the flight does not exist."""
+        row = self.db.execute(
+            select(FlightInventory.capacity, FlightInventory.seat_bitmap).where(
+                FlightInventory.flight_id == flight_id
+            )
+        ).first()
+        if row is not None:
+            return row.capacity, row.seat_bitmap
+        # No booking yet: every seat of the plane is free
+        capacity = self.db.scalar(
+            select(Plane.total_seats)
+            .join(Flight, Flight.plane_id == Plane.id)
+            .where(Flight.id == flight_id)
+        )
+        if capacity is None:
+            return None
+        return capacity, "0" * capacity
+
+    def get_capacity(self, flight_id: int) -> int | None:
+        return self.db.scalar(
+            select(FlightInventory.capacity).where(
+                FlightInventory.flight_id == flight_id
+            )
+        )
+
+    def claim_seat(self, flight_id: int, seat: int, previous: int | None = None) -> bool:
+        """Mark seat index ``seat`` taken, releasing ``previous``; False if already taken."""
+        row = self.db.execute(
+            CLAIM_SEAT_SQL, {"flight_id": flight_id, "seat": seat, "previous": previous}
+        ).first()
+        return row is not None
+
+    def release_seat(self, flight_id: int, seat: int) -> None:
+        self.db.execute(RELEASE_SEAT_SQL, {"flight_id": flight_id, "seat": seat})
+
+
+def get_inventory_service(db: Session = Depends(get_db)):
+    return InventoryService(db)
@@ -0,0 +1,127 @@
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+from fastapi import Depends, HTTPException, status
+
+from config import settings
+from models.refresh_token import RefreshToken
+from models.user import User
+from database import get_db
+
+
+def hash_refresh_token(token: str) -> str:
+    """Refresh tokens are random 256-bit values, so a plain SHA-256 is enough."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class RefreshTokenService:
+    """Issues and rotates refresh tokens.
+
+    Every rotation marks the presented token as used and issues a new one in
+    the same family. Presenting an already used token means it was leaked, so
+    the whole family is revoked.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def issue_refresh_token(self, user_id: int, family_id: str | None = None) -> str:
+        """Create a refresh token for the user and commit it."""
+        token = secrets.token_urlsafe(32)
+        now = datetime.now()
+        self.db.execute(
+            insert(RefreshToken).values(
+                token_hash=hash_refresh_token(token),
+                family_id=family_id or uuid.uuid4().hex,
+                user_id=user_id,
+                created_at=now,
+                expires_at=now
+                + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+            )
+        )
+        self.db.commit()
+        return token
+
+    def rotate_refresh_token(self, token: str) -> tuple[str, str]:
+        """Exchange a refresh token for a new one.
+
+        Returns the user's email and the new refresh token.
+        """
+        token_hash = hash_refresh_token(token)
+        now = datetime.now()
+
+        # Claim the token atomically so concurrent refreshes cannot both succeed
+        claimed = self.db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.user_id == User.id,
+                RefreshToken.used_at.is_(None),
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > now,
+            )
+            .values(used_at=now)
+            .returning(
+                RefreshToken.family_id,
+                RefreshToken.user_id,
+                User.email,
+                User.is_active,
+            )
+        ).first()
+
+        if claimed is None:
+            self._handle_rejected_token(token_hash, now)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired refresh token",
+            )
+
+        if not claimed.is_active:
+            self._revoke_family(claimed.family_id, now)
+            self.db.commit()
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Account is deactivated",
+            )
+
+        new_token = self.issue_refresh_token(claimed.user_id, claimed.family_id)
+        return claimed.email, new_token
+
+    def revoke_refresh_token(self, token: str) -> None:
+        """Revoke the family of the given token (e.g. on logout)."""
+        family_id = self.db.execute(
+            select(RefreshToken.family_id).where(
+                RefreshToken.token_hash == hash_refresh_token(token)
+            )
+        ).scalar()
+        if family_id is not None:
+            self._revoke_family(family_id, datetime.now())
+            self.db.commit()
+
+    def _handle_rejected_token(self, token_hash: str, now: datetime) -> None:
+        """Revoke the family when an already rotated token is replayed."""
+        rejected = self.db.execute(
+            select(RefreshToken.family_id, RefreshToken.used_at).where(
+                RefreshToken.token_hash == token_hash
+            )
+        ).first()
+        if rejected is not None and rejected.used_at is not None:
+            self._revoke_family(rejected.family_id, now)
+        self.db.commit()
+
+    def _revoke_family(self, family_id: str, now: datetime) -> None:
+        self.db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.family_id == family_id,
+                RefreshToken.revoked_at.is_(None),
+            )
+            .values(revoked_at=now)
+        )
+
+
+def get_refresh_token_service(db: Session = Depends(get_db)):
+    return RefreshTokenService(db)